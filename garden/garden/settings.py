@@ -4,10 +4,11 @@ from pathlib import Path
 
 import dotenv
 
-dotenv.load_dotenv()
-
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# An explicit path skips find_dotenv's walk over the caller's stack and parent dirs.
+dotenv.load_dotenv(os.getenv('DOTENV_PATH', BASE_DIR.parent / '.env'))
+
 SECRET_KEY = os.getenv('SECRET_KEY')
 
 DEBUG = True
@@ -35,10 +36,27 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.TokenAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'garden_app.renderers.ORJSONRenderer',
+        'garden_app.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'token_list': '60/min',
+        'token_retrieve': '600/min',
+        'token_write': '120/min',
+        'ip_list': '300/min',
+        'ip_retrieve': '3000/min',
+        'ip_write': '600/min',
+    },
+    # Reverse proxies in front of the app whose X-Forwarded-For entries are trusted.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
 }
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',
+    'garden_app.middleware.LoadSheddingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -53,8 +71,16 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
+            'loaders': [
+                (
+                    'django.template.loaders.cached.Loader',
+                    [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ],
+                ),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -82,6 +108,20 @@ DATABASES = {
     },
 }
 
+# 'numeric' keeps coordinates in numeric columns, 'point' only in the geography point.
+COORD_STORAGE = os.getenv('COORD_STORAGE', 'numeric')
+
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# Shared by all worker processes, so a write invalidates pages everywhere.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'garden',
+    },
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -112,6 +152,11 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 TEST_RUNNER = 'tests.runner.PostgresSchemaRunner'
 
+FILE_UPLOAD_HANDLERS = [
+    'garden_app.uploads.HashingMemoryFileUploadHandler',
+    'garden_app.uploads.HashingTemporaryFileUploadHandler',
+]
+
 MINIO_CONSISTENCY_CHECK_ON_START = False
 MINIO_ENDPOINT = 'http://localhost:9000'
 MINIO_ACCESS_KEY = os.getenv('MINIO_ACCESS_KEY')
@@ -1,7 +1,7 @@
 """Module that provides admin panel config."""
 from django.contrib import admin
 from django.contrib.gis import admin as gis_admin
-from garden_app import models
+from garden_app import consts, duplicates, models, validators
 
 
 @admin.register(models.Flora)
@@ -9,6 +9,25 @@ class FloraAdmin(admin.ModelAdmin):
     """Admin class for Flora model."""
 
     model = models.Flora
+    list_display = ('taxonomycol', 'author', 'alive', 'autochthony', 'taxon', 'herbarium')
+    list_filter = ('alive', 'autochthony')
+    list_select_related = ('taxon', 'herbarium')
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('taxonomycol', 'author', 'rus_name')
+    autocomplete_fields = ('taxon', 'collect_place', 'herbarium', 'comment')
+
+
+@gis_admin.register(models.AdminBoundary)
+class AdminBoundaryAdmin(gis_admin.GISModelAdmin):
+    """Admin class for AdminBoundary model."""
+
+    model = models.AdminBoundary
+    list_display = ('name', 'level')
+    list_filter = ('level',)
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('name',)
 
 
 @gis_admin.register(models.Coord)
@@ -16,6 +35,67 @@ class CoordsAdmin(gis_admin.GISModelAdmin):
     """Admin class for Coord model."""
 
     model = models.Coord
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    # Coords are attached to collect places and labels, and found through both.
+    search_fields = (
+        'collectplace__country', 'collectplace__region', 'collectplace__city', 'label__name',
+    )
+
+
+@admin.register(models.DuplicateCandidate)
+class DuplicateCandidateAdmin(admin.ModelAdmin):
+    """Admin class for DuplicateCandidate model."""
+
+    model = models.DuplicateCandidate
+    list_display = ('flora', 'duplicate', 'score', 'distance', 'days', 'status', 'created')
+    list_filter = ('status',)
+    list_select_related = ('flora', 'duplicate')
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    readonly_fields = ('flora', 'duplicate', 'score', 'distance', 'days', 'created')
+    actions = ('merge', 'dismiss')
+
+    @admin.action(description='Merge duplicates into the more complete specimen')
+    def merge(self, request, queryset):
+        """Move labels to the more complete specimen and remove the other one."""
+        merged = 0
+        for candidate in queryset.filter(status=consts.DUPLICATE_PENDING):
+            # An earlier merge of this batch may have removed either specimen.
+            pair = (candidate.flora_id, candidate.duplicate_id)
+            if models.Flora.objects.filter(pk__in=pair).count() == len(pair):
+                duplicates.merge(candidate)
+                merged += 1
+        self.message_user(request, f'Merged {merged} duplicates.')
+
+    @admin.action(description='Dismiss selected candidates')
+    def dismiss(self, request, queryset):
+        """Mark selected pairs as distinct specimens."""
+        queryset.update(status=consts.DUPLICATE_DISMISSED)
+
+
+@admin.register(models.Job)
+class JobAdmin(admin.ModelAdmin):
+    """Admin class for Job model."""
+
+    model = models.Job
+    list_display = ('kind', 'status', 'priority', 'progress', 'attempts', 'created', 'finished')
+    list_filter = ('status', 'kind')
+    search_fields = ('kind', 'worker')
+    ordering = ('-created',)
+    readonly_fields = (
+        'attempts', 'progress', 'result', 'error', 'worker', 'started', 'heartbeat', 'finished',
+    )
+    actions = ('retry',)
+
+    @admin.action(description='Retry selected jobs')
+    def retry(self, request, queryset):
+        """Put selected jobs back on the queue."""
+        queryset.exclude(status=consts.JOB_RUNNING).update(
+            status=consts.JOB_QUEUED,
+            attempts=0,
+            run_after=validators.get_datetime(),
+        )
 
 
 @admin.register(models.Label)
@@ -23,6 +103,24 @@ class LabelAdmin(admin.ModelAdmin):
     """Admin class for Label model."""
 
     model = models.Label
+    list_display = ('name', 'institute', 'project', 'collected', 'plant')
+    list_select_related = ('plant',)
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('name', 'institute', 'project')
+    autocomplete_fields = ('plant', 'coord')
+
+
+@admin.register(models.PictureBlob)
+class PictureBlobAdmin(admin.ModelAdmin):
+    """Admin class for PictureBlob model."""
+
+    model = models.PictureBlob
+    list_display = ('sha256', 'name', 'size', 'refcount', 'created', 'used')
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('=sha256', 'name')
+    readonly_fields = ('sha256', 'name', 'size', 'refcount', 'created', 'used')
 
 
 @admin.register(models.CollectPlace)
@@ -30,6 +128,11 @@ class CollectPlaceAdmin(admin.ModelAdmin):
     """Admin class for CollectPlace model."""
 
     model = models.CollectPlace
+    list_display = ('country', 'region', 'city')
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('country', 'region', 'city')
+    autocomplete_fields = ('coord',)
 
 
 @admin.register(models.Herbarium)
@@ -37,6 +140,9 @@ class HerbariumAdmin(admin.ModelAdmin):
     """Admin class for Herbarium model."""
 
     model = models.Herbarium
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('depart', 'region')
 
 
 @admin.register(models.Comment)
@@ -44,6 +150,9 @@ class CommentAdmin(admin.ModelAdmin):
     """Admin class for Comment model."""
 
     model = models.Comment
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('description',)
 
 
 @admin.register(models.Taxon)
@@ -51,3 +160,7 @@ class TaxonAdmin(admin.ModelAdmin):
     """Admin class for Taxon model."""
 
     model = models.Taxon
+    list_display = ('genus', 'species', 'subspecies', 'family')
+    list_per_page = consts.ADMIN_LIST_PER_PAGE
+    show_full_result_count = False
+    search_fields = ('genus', 'species', 'family')
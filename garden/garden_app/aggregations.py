@@ -0,0 +1,117 @@
+"""Module that provides species richness and specimen density aggregations."""
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count
+from garden_app import caching, consts, models
+
+SOURCE_MODELS = (models.Flora, models.CollectPlace, models.Coord, models.Herbarium)
+
+GROUPINGS = {
+    'country': ('collect_place__country',),
+    'region': ('collect_place__country', 'collect_place__region'),
+    'herbarium': ('herbarium__depart', 'herbarium__region'),
+}
+
+_POINTS = (
+    'SELECT flora.taxon_id, coord.geog_point::geometry AS geom '  # noqa: S608
+    f'FROM {models.Flora._meta.db_table} AS flora '
+    f'JOIN {models.CollectPlace._meta.db_table} AS place ON place.id = flora.collect_place_id '
+    f'JOIN {models.Coord._meta.db_table} AS coord ON coord.id = place.coord_id '
+    'WHERE coord.geog_point IS NOT NULL'
+)
+
+_SQUARE_GRID = (
+    'SELECT floor(ST_X(geom) / %(resolution)s) AS i, floor(ST_Y(geom) / %(resolution)s) AS j, '
+    '(floor(ST_X(geom) / %(resolution)s) + 0.5) * %(resolution)s AS longitude, '
+    '(floor(ST_Y(geom) / %(resolution)s) + 0.5) * %(resolution)s AS latitude, '
+    'COUNT(*) AS specimens, COUNT(DISTINCT taxon_id) AS taxa '
+    'FROM ({points}) AS points GROUP BY 1, 2, 3, 4 ORDER BY 1, 2'
+)
+
+# Each point is assigned to its cell by rounding its axial hexagon
+# coordinates, so no grid is built and every point lands in one cell. Cells
+# are numbered like ST_HexagonGrid's: flat-topped, odd columns shifted up.
+_HEX_GRID = (
+    'SELECT cell.i, cell.j, 1.5 * %(resolution)s * cell.i AS longitude, '
+    'sqrt(3) * %(resolution)s * (cell.j + (cell.i & 1) / 2.0) AS latitude, '
+    'COUNT(*) AS specimens, COUNT(DISTINCT points.taxon_id) AS taxa '
+    'FROM ({points}) AS points '
+    'CROSS JOIN LATERAL (SELECT 2.0 / 3 * ST_X(geom) / %(resolution)s AS q, '
+    '(sqrt(3) / 3 * ST_Y(geom) - ST_X(geom) / 3) / %(resolution)s AS r) AS axial '
+    'CROSS JOIN LATERAL (SELECT round(axial.q) AS q, round(axial.r) AS r, '
+    'round(-axial.q - axial.r) AS s) AS rounded '
+    'CROSS JOIN LATERAL (SELECT abs(rounded.q - axial.q) AS q, abs(rounded.r - axial.r) AS r, '
+    'abs(rounded.s + axial.q + axial.r) AS s) AS error '
+    'CROSS JOIN LATERAL (SELECT CASE WHEN error.q > error.r AND error.q > error.s '
+    'THEN -rounded.r - rounded.s ELSE rounded.q END::bigint AS q, '
+    'CASE WHEN error.q > error.r AND error.q > error.s THEN rounded.r '
+    'WHEN error.r > error.s THEN -rounded.q - rounded.s ELSE rounded.r END::bigint AS r) AS hex '
+    'CROSS JOIN LATERAL (SELECT hex.q AS i, hex.r + (hex.q - (hex.q & 1)) / 2 AS j) AS cell '
+    'GROUP BY cell.i, cell.j ORDER BY cell.i, cell.j'
+)
+
+
+def _cached(parts, compute):
+    key = caching.make_aggregate_key(SOURCE_MODELS, *parts)
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result, consts.AGGREGATION_CACHE_TIMEOUT)
+    return result
+
+
+def grid(resolution: float, shape: str, alive=None, autochthony=None) -> list[dict]:
+    """Count specimens and distinct taxa per grid cell.
+
+    Args:
+        resolution (float): Cell size in degrees.
+        shape (str): ``square`` or ``hex`` cells.
+        alive (bool | None): Only alive or only dead specimens.
+        autochthony (str | None): Only specimens of the given autochthony.
+
+    Returns:
+        list[dict]: Cell indexes, cell center and counts.
+    """
+    def compute():
+        points = _POINTS
+        params = {'resolution': resolution}
+        if alive is not None:
+            points += ' AND flora.alive = %(alive)s'
+            params['alive'] = alive
+        if autochthony is not None:
+            points += ' AND flora.autochthony = %(autochthony)s'
+            params['autochthony'] = autochthony
+        template = _HEX_GRID if shape == consts.GRID_HEX else _SQUARE_GRID
+        with connection.cursor() as cursor:
+            cursor.execute(template.format(points=points), params)
+            columns = [column.name for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    return _cached(('grid', shape, resolution, alive, autochthony), compute)
+
+
+def groups(by: str, alive=None, autochthony=None) -> list[dict]:
+    """Count specimens and distinct taxa per administrative grouping or herbarium.
+
+    Args:
+        by (str): One of ``GROUPINGS``.
+        alive (bool | None): Only alive or only dead specimens.
+        autochthony (str | None): Only specimens of the given autochthony.
+
+    Returns:
+        list[dict]: Grouping values and counts.
+    """
+    def compute():
+        queryset = models.Flora.objects.all()
+        if alive is not None:
+            queryset = queryset.filter(alive=alive)
+        if autochthony is not None:
+            queryset = queryset.filter(autochthony=autochthony)
+        fields = GROUPINGS[by]
+        return list(
+            queryset.values(*fields).annotate(
+                specimens=Count('pk'), taxa=Count('taxon', distinct=True),
+            ).order_by(*fields),
+        )
+
+    return _cached(('groups', by, alive, autochthony), compute)
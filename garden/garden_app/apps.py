@@ -7,3 +7,7 @@ class GardenAppConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'garden_app'
+
+    def ready(self) -> None:
+        """Connect signal receivers."""
+        from garden_app import signals  # noqa: F401, WPS433
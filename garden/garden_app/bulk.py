@@ -0,0 +1,208 @@
+"""Module that provides set-based bulk operations on catalog records."""
+from collections import Counter, defaultdict
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import IntegrityError, connection, models, transaction
+from garden_app import consts, signals
+
+FILTER_LOOKUPS = frozenset((
+    'exact', 'iexact', 'in', 'isnull', 'gt', 'gte', 'lt', 'lte', 'contains', 'icontains',
+    'startswith', 'istartswith',
+))
+
+
+def select(model_class, ids=None, filters=None):
+    """Build a queryset from a list of ids or a filter expression.
+
+    The filter expression maps ``field`` or ``field__lookup`` to a value and
+    may only use concrete fields of the model and plain comparison lookups.
+
+    Args:
+        model_class (type): Model to select from.
+        ids (list | None): Primary keys to select.
+        filters (dict | None): Filter expression.
+
+    Raises:
+        ValidationError: If neither or both selectors are given or the filter is invalid.
+
+    Returns:
+        QuerySet: Selected records.
+    """
+    if (ids is None) == (filters is None):
+        raise ValidationError('Either ids or filter is required.')
+    if ids is not None:
+        if not isinstance(ids, (list, tuple, set)):
+            raise ValidationError('Ids must be a list.')
+        return model_class._base_manager.filter(pk__in=ids)
+    if not isinstance(filters, dict) or not filters:
+        raise ValidationError('Filter must be a non-empty object.')
+    for expression in filters:
+        name, _, lookup = expression.partition('__')
+        try:
+            model_field = model_class._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise ValidationError(f'Unknown field: {name}')
+        if not model_field.concrete or (lookup and lookup not in FILTER_LOOKUPS):
+            raise ValidationError(f'Unsupported filter: {expression}')
+    try:
+        return model_class._base_manager.filter(**filters)
+    except (TypeError, ValueError) as error:
+        raise ValidationError(f'Invalid filter value: {error}')
+
+
+def collect(model_class, pks) -> dict:
+    """Collect primary keys of records removed together with the given ones.
+
+    Follows reverse ``on_delete=CASCADE`` relations like Django's deletion
+    collector, with one query per relation instead of one per object. Records
+    the deleted rows point to, e.g. the collect place of a flora, are kept.
+
+    Args:
+        model_class (type): Model of the deleted records.
+        pks (Iterable): Primary keys of the deleted records.
+
+    Raises:
+        ProtectedError: If a record is still referenced through ``on_delete=PROTECT``.
+
+    Returns:
+        dict: Sets of primary keys keyed by model.
+    """
+    collected = defaultdict(set)
+    pending = [(model_class, set(pks))]
+    while pending:
+        current, current_pks = pending.pop()
+        current_pks -= collected.get(current, set())
+        if not current_pks:
+            continue
+        collected[current] |= current_pks
+        for relation in current._meta.related_objects:
+            if relation.on_delete is models.PROTECT:
+                protected = relation.related_model._base_manager.filter(
+                    **{f'{relation.field.name}__in': current_pks},
+                )
+                if protected.exists():
+                    raise models.ProtectedError(
+                        f'{current._meta.verbose_name_plural} are still referenced by '
+                        f'{relation.related_model._meta.verbose_name_plural}.',
+                        protected,
+                    )
+            elif relation.on_delete is models.CASCADE:
+                children = relation.related_model._base_manager.filter(
+                    **{f'{relation.field.name}__in': current_pks},
+                ).values_list('pk', flat=True)
+                pending.append((relation.related_model, set(children)))
+    return collected
+
+
+def _references(model_class, target) -> bool:
+    return any(
+        model_field.related_model is target
+        for model_field in model_class._meta.concrete_fields
+        if model_field.is_relation
+    )
+
+
+def _deletion_order(collected) -> list:
+    """Order models so that referencing rows are deleted before referenced ones."""
+    remaining = sorted(collected, key=lambda model_class: model_class._meta.label)
+    ordered = []
+    while remaining:
+        for candidate in remaining:
+            if not any(
+                _references(other, candidate) for other in remaining if other is not candidate
+            ):
+                break
+        remaining.remove(candidate)
+        ordered.append(candidate)
+    return ordered
+
+
+def _file_names(model_class, pks) -> list[str]:
+    columns = [
+        model_field.attname
+        for model_field in model_class._meta.concrete_fields
+        if isinstance(model_field, models.FileField)
+    ]
+    if not columns:
+        return []
+    rows = model_class._base_manager.filter(pk__in=pks).values_list(*columns)
+    return [name for row in rows for name in row if name]
+
+
+def _delete_collected(collected) -> None:
+    with connection.cursor() as cursor:
+        for model_class in _deletion_order(collected):
+            cursor.execute(
+                f'DELETE FROM {model_class._meta.db_table} '  # noqa: S608
+                f'WHERE {model_class._meta.pk.column} = ANY(%s::uuid[])',
+                [[str(pk) for pk in collected[model_class]]],
+            )
+
+
+def delete(queryset, batch_size: int = consts.DELETE_BATCH_SIZE, dry_run: bool = False):
+    """Delete records of the queryset and everything cascading from them.
+
+    Records are processed in keyset batches, each in its own transaction,
+    with a set-based DELETE per affected table. Instead of ``post_delete``,
+    one ``bulk_changed`` signal per model and batch carries the deleted
+    primary keys and stored file names once the batch is committed.
+
+    Args:
+        queryset (QuerySet): Records to delete.
+        batch_size (int): Root records per batch.
+        dry_run (bool): Only count affected rows.
+
+    Returns:
+        Counter: Number of affected rows keyed by model label.
+    """
+    affected = Counter()
+    last_pk = None
+    while True:
+        batch = queryset.order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        pks = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+        with transaction.atomic():
+            collected = collect(queryset.model, pks)
+            if not dry_run:
+                files = {
+                    model_class: _file_names(model_class, model_pks)
+                    for model_class, model_pks in collected.items()
+                }
+                _delete_collected(collected)
+                for model_class, model_pks in collected.items():
+                    transaction.on_commit(partial(
+                        signals.bulk_changed.send,
+                        sender=model_class,
+                        pks=model_pks,
+                        files=files[model_class],
+                    ))
+        for model_class, model_pks in collected.items():
+            affected[model_class._meta.label] += len(model_pks)
+    return affected
+
+
+def update(queryset, values: dict) -> int:
+    """Apply the same field values to every record of the queryset.
+
+    Args:
+        queryset (QuerySet): Records to update.
+        values (dict): Validated field values.
+
+    Raises:
+        ValidationError: If the new values break a database constraint.
+
+    Returns:
+        int: Number of updated records.
+    """
+    try:
+        with transaction.atomic():
+            updated = queryset.update(**values)
+    except IntegrityError as error:
+        raise ValidationError(str(error))
+    signals.bulk_changed.send(sender=queryset.model, pks=None)
+    return updated
@@ -0,0 +1,96 @@
+"""Module that provides per-model versioned caching for catalog pages."""
+import time
+from http import HTTPStatus
+from typing import Callable
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from garden_app import consts
+
+
+def _version_key(model_class) -> str:
+    return f'{consts.CACHE_PREFIX}:version:{model_class._meta.label_lower}'
+
+
+def get_model_version(model_class) -> int:
+    """Return current cache version of the given model.
+
+    Versions start from a timestamp so an evicted version key never
+    resurrects entries cached under an older version.
+
+    Args:
+        model_class (type): Model class to get version for.
+
+    Returns:
+        int: Current version of the model.
+    """
+    key = _version_key(model_class)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_model(model_class) -> None:
+    """Drop every cached page and fragment of the given model.
+
+    Args:
+        model_class (type): Model class whose entries become stale.
+    """
+    key = _version_key(model_class)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def make_key(model_class, *parts) -> str:
+    """Build a cache key bound to the current version of the model.
+
+    Args:
+        model_class (type): Model class the cached content depends on.
+        parts: Extra key parts, e.g. page number or object id.
+
+    Returns:
+        str: Cache key.
+    """
+    version = get_model_version(model_class)
+    suffix = ':'.join(str(part) for part in parts)
+    return f'{consts.CACHE_PREFIX}:{model_class._meta.label_lower}:{version}:{suffix}'
+
+
+def make_aggregate_key(model_classes, *parts) -> str:
+    """Build a cache key bound to the current versions of several models.
+
+    Args:
+        model_classes (Iterable[type]): Model classes the cached content depends on.
+        parts: Extra key parts, e.g. query parameters.
+
+    Returns:
+        str: Cache key.
+    """
+    versions = ':'.join(str(get_model_version(model_class)) for model_class in model_classes)
+    suffix = ':'.join(str(part) for part in parts)
+    return f'{consts.CACHE_PREFIX}:aggregate:{versions}:{suffix}'
+
+
+def cached_response(key: str, render: Callable[[], HttpResponse]) -> HttpResponse:
+    """Return the cached page for key or render and cache it.
+
+    Args:
+        key (str): Cache key of the page.
+        render (Callable[[], HttpResponse]): Renders the page on cache miss.
+
+    Returns:
+        HttpResponse: Cached or freshly rendered response.
+    """
+    content = cache.get(key)
+    if content is not None:
+        return HttpResponse(content)
+    response = render()
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code == HTTPStatus.OK:
+        cache.set(key, response.content, consts.PAGE_CACHE_TIMEOUT)
+    return response
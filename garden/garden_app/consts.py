@@ -10,6 +10,10 @@ MAX_LENGTH_PROTECT = 100
 
 CORDS_MAX_DIGITS = 16
 CORDS_MAX_DECIMAL = 14
+WGS84 = 4326
+COORD_STORAGE_NUMERIC = 'numeric'
+COORD_STORAGE_POINT = 'point'
+COORD_COLUMNS = ('longitude', 'latitude', 'altitude')
 
 BUCKET_NAME = 'images'
 
@@ -27,3 +31,79 @@ MAX_LENGTH_TAXONOMY_COL = 100
 
 MAX_POSITIVE_DEGREE = 90
 MAX_NEGATIVE_DEGREE = -90
+
+CACHE_PREFIX = 'garden'
+PAGE_CACHE_TIMEOUT = 60 * 5
+FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
+IMPORT_CHUNK_SIZE = 5000
+
+TAXON_CLASSIFICATION = (
+    'domain',
+    'kingdom',
+    'phylum',
+    'klass',
+    'ordo',
+    'family',
+    'genus',
+    'species',
+    'subspecies',
+)
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_DELAY = 30
+JOB_POLL_INTERVAL = 1
+JOB_HEARTBEAT_INTERVAL = 30
+JOB_STALE_TIMEOUT = 5 * 60
+JOB_MAX_BACKOFF = 60
+BACKFILL_BATCH_SIZE = 5000
+
+DELETE_BATCH_SIZE = 1000
+
+AUTOCOMPLETE_PAGE_SIZE = 20
+ADMIN_LIST_PER_PAGE = 50
+
+GRID_SQUARE = 'square'
+GRID_HEX = 'hex'
+MIN_GRID_RESOLUTION = 0.01
+MAX_GRID_RESOLUTION = 10
+AGGREGATION_CACHE_TIMEOUT = 60 * 60
+
+DUPLICATE_PENDING = 'pending'
+DUPLICATE_DISMISSED = 'dismissed'
+DUPLICATE_DISTANCE = 100
+DUPLICATE_DAYS = 3
+DUPLICATE_BATCH_SIZE = 5000
+
+# OpenStreetMap admin_level of the boundaries matching CollectPlace fields.
+GEOCODE_LEVELS = (('country', 2), ('region', 4), ('city', 8))
+GEOCODE_FILL = 'fill'
+GEOCODE_VALIDATE = 'validate'
+GEOCODE_FIX = 'fix'
+GEOCODE_BATCH_SIZE = 5000
+BOUNDARY_BATCH_SIZE = 500
+GEOCODE_SAMPLE_SIZE = 100
+
+THROTTLE_LIST = 'list'
+THROTTLE_RETRIEVE = 'retrieve'
+THROTTLE_WRITE = 'write'
+API_PREFIX = '/api/'
+SHED_DB_LATENCY = 0.1
+SHED_PROBE_INTERVAL = 1
+SHED_QUEUE_DEPTH = 10000
+SHED_RETRY_AFTER = 10
+LATENCY_EWMA_ALPHA = 0.2
+QUEUE_DEPTH_CACHE_TIMEOUT = 5
+
+PICTURE_HASH_PREFIX = 'sha256'
+PICTURE_HASH_CHUNK_SIZE = 1024 * 1024
+PICTURE_RECLAIM_GRACE = 24 * 60 * 60
+PICTURE_RECLAIM_WORKERS = 8
+PICTURE_RECLAIM_BATCH_SIZE = 100
+
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_IDS = 500
@@ -0,0 +1,142 @@
+"""Module that provides near-duplicate specimen detection.
+
+Comparing every pair of specimens is quadratic, so candidate pairs are
+blocked first: both specimens share a taxon, lie within a distance of each
+other and, when both labels have a collection date, were collected within a
+few days. Only the blocked pairs are scored.
+"""
+from datetime import datetime, timezone
+
+from django.db import connection, transaction
+from django.db.models import Count
+from garden_app import bulk, consts, models, signals
+
+
+def _join_specimen(side: str) -> str:
+    return (
+        f'JOIN {models.CollectPlace._meta.db_table} AS place_{side} '
+        f'ON place_{side}.id = {side}.collect_place_id '
+        f'JOIN {models.Coord._meta.db_table} AS coord_{side} '
+        f'ON coord_{side}.id = place_{side}.coord_id '
+        f'LEFT JOIN LATERAL (SELECT MIN(collected) AS collected '  # noqa: S608
+        f'FROM {models.Label._meta.db_table} WHERE plant_id = {side}.id) AS label_{side} ON true '
+    )
+
+
+_DETECT = (
+    f'INSERT INTO {models.DuplicateCandidate._meta.db_table} '  # noqa: S608
+    '(id, flora_id, duplicate_id, score, distance, days, status, created) '
+    'SELECT gen_random_uuid(), LEAST(a.id, b.id), GREATEST(a.id, b.id), '
+    '0.5 * (1 - pairs.distance / %(distance)s) '
+    '+ 0.3 * COALESCE(1 - pairs.days::float / (%(days)s + 1), 0.5) '
+    '+ 0.2 * COALESCE(lower(a.author) = lower(b.author), false)::int, '
+    'pairs.distance, pairs.days, %(status)s, now() '
+    f'FROM {models.Flora._meta.db_table} AS a {_join_specimen("a")}'
+    f'JOIN {models.Flora._meta.db_table} AS b ON b.taxon_id = a.taxon_id AND b.id <> a.id '
+    f'{_join_specimen("b")}'
+    'CROSS JOIN LATERAL (SELECT '
+    'ST_Distance(coord_a.geog_point, coord_b.geog_point) AS distance, '
+    'abs(label_a.collected - label_b.collected) AS days) AS pairs '
+    'WHERE a.id = ANY(%(ids)s::uuid[]) AND a.taxon_id IS NOT NULL '
+    'AND ST_DWithin(coord_a.geog_point, coord_b.geog_point, %(distance)s) '
+    'AND (pairs.days IS NULL OR pairs.days <= %(days)s) '
+    'ON CONFLICT DO NOTHING'
+)
+
+
+def detect(distance: float = consts.DUPLICATE_DISTANCE, days: int = consts.DUPLICATE_DAYS,
+           full: bool = False, batch_size: int = consts.DUPLICATE_BATCH_SIZE) -> dict:
+    """Store scored candidate pairs for specimens not checked for duplicates yet.
+
+    Unchecked specimens are compared with every specimen of the same block
+    and marked as checked in the same transaction, batch by batch. Specimens
+    committed while a run is in progress stay unchecked for the next run, so
+    the detection can run incrementally after each import. Pairs are stored
+    once with the smaller id first and existing pairs are kept as they are.
+
+    Args:
+        distance (float): Maximum distance between the specimens in meters.
+        days (int): Maximum number of days between the collection dates.
+        full (bool): Check every specimen again.
+        batch_size (int): Specimens checked per transaction.
+
+    Returns:
+        dict: Number of checked specimens and new candidates.
+    """
+    if full:
+        models.Flora.objects.update(duplicates_checked=False)
+    params = {'distance': distance, 'days': days, 'status': consts.DUPLICATE_PENDING}
+    stats = {'checked': 0, 'candidates': 0}
+    pending = models.Flora.objects.filter(duplicates_checked=False).order_by('pk')
+    while True:
+        with transaction.atomic():
+            ids = list(pending.values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                break
+            with connection.cursor() as cursor:
+                cursor.execute(_DETECT, {**params, 'ids': [str(pk) for pk in ids]})
+                stats['candidates'] += cursor.rowcount
+            models.Flora.objects.filter(pk__in=ids).update(duplicates_checked=True)
+        stats['checked'] += len(ids)
+    if stats['candidates']:
+        signals.bulk_changed.send(sender=models.DuplicateCandidate, pks=None)
+    return stats
+
+
+def _completeness(flora) -> int:
+    values = (getattr(flora, model_field.attname) for model_field in flora._meta.concrete_fields)
+    return sum(value not in (None, '') for value in values) + flora.labels
+
+
+def _delete_unreferenced(model_class, pk) -> None:
+    """Delete a record unless another record still references it."""
+    if pk is None:
+        return
+    queryset = model_class.objects.filter(pk=pk)
+    for relation in model_class._meta.related_objects:
+        queryset = queryset.filter(**{f'{relation.name}__isnull': True})
+    bulk.delete(queryset)
+
+
+def merge(candidate, keep=None):
+    """Merge the specimens of a candidate pair into one and remove the other one.
+
+    Unless the kept specimen is given, the more complete one is kept: the one
+    with more filled fields and labels, then the older one. Labels of the
+    removed specimen are moved to the kept one first. The candidate itself
+    is removed together with the other specimen, and so are its collect
+    place, coordinates, herbarium and comment once nothing else references
+    them.
+
+    Args:
+        candidate (DuplicateCandidate): Pair to merge.
+        keep (UUID | None): Id of the specimen to keep.
+
+    Raises:
+        ValueError: If the kept specimen is not a member of the pair.
+
+    Returns:
+        UUID: Id of the kept specimen.
+    """
+    pair = {candidate.flora_id, candidate.duplicate_id}
+    if keep is None:
+        newest = datetime.max.replace(tzinfo=timezone.utc)
+        floras = models.Flora.objects.filter(pk__in=pair).annotate(labels=Count('label'))
+        keep = min(
+            floras, key=lambda flora: (-_completeness(flora), flora.created or newest, flora.pk),
+        ).pk
+    elif keep not in pair:
+        raise ValueError(f'{keep} is not a member of the candidate pair.')
+    (removed,) = pair - {keep}
+    owned = models.Flora.objects.filter(pk=removed).values(
+        'collect_place_id', 'collect_place__coord_id', 'herbarium_id', 'comment_id',
+    ).get()
+    with transaction.atomic():
+        models.Label.objects.filter(plant_id=removed).update(plant_id=keep)
+        signals.bulk_changed.send(sender=models.Label, pks=None)
+        bulk.delete(models.Flora.objects.filter(pk=removed))
+        _delete_unreferenced(models.CollectPlace, owned['collect_place_id'])
+        _delete_unreferenced(models.Coord, owned['collect_place__coord_id'])
+        _delete_unreferenced(models.Herbarium, owned['herbarium_id'])
+        _delete_unreferenced(models.Comment, owned['comment_id'])
+    return keep
@@ -1,8 +1,50 @@
 """Module that provides forms."""
 from django import forms
+from django.core.exceptions import ValidationError
+from django.urls import reverse
 from garden_app import consts, models
 
 
+class AutocompleteSelect(forms.Select):
+    """Select that renders only chosen options and loads the rest on demand."""
+
+    class Media:
+        js = ('garden_app/autocomplete.js',)
+
+    def __init__(self, url_name: str, attrs=None):
+        """Create the widget.
+
+        Args:
+            url_name (str): Name of the autocomplete endpoint URL.
+            attrs (dict | None): HTML attributes.
+        """
+        super().__init__(attrs)
+        self.url_name = url_name
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        """Add the autocomplete endpoint to the HTML attributes."""
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs['data-autocomplete-url'] = reverse(self.url_name)
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        """Build options from the selected values only instead of the whole table."""
+        field = self.choices.field
+        selected = [option for option in value if option not in field.empty_values]
+        options = [self.create_option(name, '', field.empty_label or '', False, 0)]
+        try:
+            chosen = list(self.choices.queryset.filter(pk__in=selected))
+        except ValidationError:
+            chosen = []
+        for index, obj in enumerate(chosen, start=1):
+            options.append(
+                self.create_option(
+                    name, str(obj.pk), field.label_from_instance(obj), True, index,
+                ),
+            )
+        return [(None, options, 0)]
+
+
 class FloraForm(forms.ModelForm):
     """Form for Flora model."""
 
@@ -21,4 +63,8 @@ class FloraForm(forms.ModelForm):
                 attrs={'maxlength': consts.MAX_LENGTH_RUS_NAME, 'required': False},
             ),
             'picture': forms.FileInput(),
+            'taxon': AutocompleteSelect('taxons_autocomplete'),
+            'collect_place': AutocompleteSelect('collect_places_autocomplete'),
+            'herbarium': AutocompleteSelect('herbariums_autocomplete'),
+            'comment': AutocompleteSelect('comments_autocomplete'),
         }
@@ -0,0 +1,176 @@
+"""Module that provides offline reverse geocoding of collect places.
+
+Administrative boundaries are loaded from a local vector file into a
+GiST-indexed table. Collect places are then matched to the boundaries that
+cover their coordinates with one set-based statement per field and batch.
+"""
+from pathlib import Path
+from typing import Callable
+
+from django.contrib.gis.gdal import CoordTransform, DataSource, SpatialReference
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.db import connection, transaction
+from garden_app import consts, models, signals
+
+_PLACE_BOUNDARY = (
+    f'FROM {models.Coord._meta.db_table} AS coord, '
+    f'{models.AdminBoundary._meta.db_table} AS boundary '
+    'WHERE place.id = ANY(%(ids)s::uuid[]) AND coord.id = place.coord_id '
+    'AND boundary.level = %(level)s '
+    'AND ST_Covers(boundary.geom, coord.geog_point::geometry) '
+)
+
+# Places covered by boundaries of the level none of which has the place's name.
+_MISMATCH = (
+    "place.{column} IS NOT NULL AND place.{column} <> '' "
+    f'AND NOT EXISTS (SELECT 1 FROM {models.AdminBoundary._meta.db_table} AS named '
+    'WHERE named.level = %(level)s AND lower(named.name) = lower(place.{column}) '
+    'AND ST_Covers(named.geom, coord.geog_point::geometry)) '
+)
+
+_EMPTY = "place.{column} IS NULL OR place.{column} = ''"
+
+_UPDATE = (
+    f'UPDATE {models.CollectPlace._meta.db_table} AS place '  # noqa: S608
+    'SET {column} = boundary.name '
+)
+
+_FILL = f'{_UPDATE}{_PLACE_BOUNDARY}AND ({_EMPTY})'
+
+_FIX = f'{_UPDATE}{_PLACE_BOUNDARY}AND ({_EMPTY} OR {_MISMATCH})'
+
+_VALIDATE = (
+    f'SELECT DISTINCT place.id FROM {models.CollectPlace._meta.db_table} AS place, '  # noqa: S608
+    f'{_PLACE_BOUNDARY.removeprefix("FROM ")}AND {_MISMATCH}'
+)
+
+
+def _multipolygon(geometry):
+    if isinstance(geometry, Polygon):
+        geometry = MultiPolygon(geometry, srid=geometry.srid)
+    return geometry if isinstance(geometry, MultiPolygon) else None
+
+
+def load_boundaries(
+    path: Path,
+    level: int | None = None,
+    name_field: str = 'name',
+    level_field: str = 'admin_level',
+    layer: int | str = 0,
+    batch_size: int = consts.BOUNDARY_BATCH_SIZE,
+) -> dict[str, int]:
+    """Load administrative boundary polygons from a vector file.
+
+    Any format readable by GDAL works, e.g. GeoJSON, Shapefile or GeoPackage.
+    Geometries are reprojected to WGS 84, features that are not polygons are
+    ignored. Features without a name or a numeric level are skipped and
+    counted.
+
+    Args:
+        path (Path): Vector file.
+        level (int | None): Administrative level of every feature, None to read it
+            from ``level_field``.
+        name_field (str): Feature field with the boundary name.
+        level_field (str): Feature field with the administrative level.
+        layer (int | str): Layer index or name.
+        batch_size (int): Boundaries per insert.
+
+    Returns:
+        dict[str, int]: Numbers of loaded and skipped boundaries.
+    """
+    source_layer = DataSource(str(path))[layer]
+    transform = None
+    if source_layer.srs is not None and source_layer.srs.srid != consts.WGS84:
+        transform = CoordTransform(source_layer.srs, SpatialReference(consts.WGS84))
+    batch = []
+    loaded = 0
+    skipped = 0
+    for feature in source_layer:
+        name = feature.get(name_field)
+        try:
+            feature_level = level if level is not None else int(feature.get(level_field))
+        except (TypeError, ValueError):
+            feature_level = None
+        if not name or feature_level is None:
+            skipped += 1
+            continue
+        geometry = feature.geom
+        if transform is not None:
+            geometry.transform(transform)
+        geometry = _multipolygon(geometry.geos)
+        if geometry is None:
+            continue
+        geometry.srid = consts.WGS84
+        batch.append(models.AdminBoundary(name=name, level=feature_level, geom=geometry))
+        if len(batch) >= batch_size:
+            loaded += len(models.AdminBoundary.objects.bulk_create(batch))
+            batch = []
+    loaded += len(models.AdminBoundary.objects.bulk_create(batch))
+    return {'loaded': loaded, 'skipped': skipped}
+
+
+def _geocode_batch(cursor, mode: str, ids: list[str], stats: dict, mismatches: dict) -> None:
+    for column, level in consts.GEOCODE_LEVELS:
+        params = {'ids': ids, 'level': level}
+        if mode == consts.GEOCODE_VALIDATE:
+            cursor.execute(_VALIDATE.format(column=column), params)
+            found = [str(row[0]) for row in cursor.fetchall()]
+            stats[column] += len(found)
+            sample = mismatches[column]
+            sample.extend(found[:consts.GEOCODE_SAMPLE_SIZE - len(sample)])
+        else:
+            template = _FILL if mode == consts.GEOCODE_FILL else _FIX
+            cursor.execute(template.format(column=column), params)
+            stats[column] += cursor.rowcount
+
+
+def reverse_geocode(
+    mode: str = consts.GEOCODE_FILL,
+    batch_size: int = consts.GEOCODE_BATCH_SIZE,
+    progress: Callable[[float], None] | None = None,
+) -> dict:
+    """Fill in, fix or validate collect place fields from the boundaries.
+
+    ``fill`` sets empty country, region and city fields to the name of the
+    boundary covering the place's coordinates. ``fix`` also overwrites names
+    that match none of the covering boundaries, and ``validate`` only counts
+    such places.
+
+    Args:
+        mode (str): ``fill``, ``fix`` or ``validate``.
+        batch_size (int): Collect places per batch and transaction.
+        progress (Callable[[float], None] | None): Receives the done fraction.
+
+    Raises:
+        ValueError: If the mode is unknown.
+
+    Returns:
+        dict: Updated or mismatched place counts per field, plus a sample of
+            mismatched place ids in ``validate`` mode.
+    """
+    if mode not in {consts.GEOCODE_FILL, consts.GEOCODE_FIX, consts.GEOCODE_VALIDATE}:
+        raise ValueError(f'Unknown geocoding mode: {mode}')
+    places = models.CollectPlace.objects.filter(
+        coord__geog_point__isnull=False,
+    ).order_by('pk').values_list('pk', flat=True)
+    total = places.count()
+    stats = {column: 0 for column, _ in consts.GEOCODE_LEVELS}
+    mismatches = {column: [] for column, _ in consts.GEOCODE_LEVELS}
+    done = 0
+    last_pk = None
+    while True:
+        batch = places if last_pk is None else places.filter(pk__gt=last_pk)
+        ids = [str(pk) for pk in batch[:batch_size]]
+        if not ids:
+            break
+        last_pk = ids[-1]
+        with transaction.atomic(), connection.cursor() as cursor:
+            _geocode_batch(cursor, mode, ids, stats, mismatches)
+        done += len(ids)
+        if progress is not None:
+            progress(done / total)
+    if mode == consts.GEOCODE_VALIDATE:
+        return {'mismatched': stats, 'sample': mismatches}
+    if any(stats.values()):
+        signals.bulk_changed.send(sender=models.CollectPlace, pks=None)
+    return {'updated': stats}
@@ -0,0 +1,456 @@
+"""Module that provides bulk import of Darwin Core specimen records.
+
+Records are parsed and validated in a process pool and streamed into the
+``garden`` schema with PostgreSQL COPY through temporary staging tables.
+Every row id is derived from the record's ``occurrenceID``, so a repeated
+record or a resumed run never inserts the same specimen twice. Taxa are
+keyed by their classification and shared between specimens.
+"""
+import csv
+import io
+import json
+import os
+import uuid
+import zipfile
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time, timezone
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Iterator
+from xml.etree import ElementTree  # noqa: S405
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from garden_app import caching, consts, models, validators
+
+NAMESPACE = uuid.UUID('6f1d3a52-8c3e-4d0e-9a57-31c1b8f0e2a4')
+NULL = r'\N'
+DWC_ARCHIVE_META = 'meta.xml'
+TEXT_NAMESPACE = '{http://rs.tdwg.org/dwc/text/}'
+
+AUTOCHTHONY = {
+    'native': 'autochthonous',
+    'autochthonous': 'autochthonous',
+    'introduced': 'introduced',
+    'naturalised': 'introduced',
+    'naturalized': 'introduced',
+    'invasive': 'invasive',
+}
+
+# Tables in foreign key order: referenced rows are loaded first.
+IMPORT_MODELS = (
+    models.Coord,
+    models.CollectPlace,
+    models.Taxon,
+    models.Herbarium,
+    models.Flora,
+    models.Label,
+)
+
+
+def _term(name: str) -> str:
+    return name.rsplit('/', 1)[-1].strip()
+
+
+def _value(row: dict[str, str], term: str) -> str | None:
+    value = (row.get(term) or '').strip()
+    return value or None
+
+
+def _row_id(table: str, occurrence_id: str) -> uuid.UUID:
+    return uuid.uuid5(NAMESPACE, f'{table}:{occurrence_id}')
+
+
+def _decimal(row: dict[str, str], term: str) -> Decimal | None:
+    value = _value(row, term)
+    if value is None:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValidationError(f'{term} is not a number: {value}')
+
+
+def _date(row: dict[str, str], term: str) -> date | None:
+    value = _value(row, term)
+    if value is None:
+        return None
+    try:
+        parsed = date.fromisoformat(value.split('/')[0][:10])
+    except ValueError:
+        raise ValidationError(f'{term} is not an ISO date: {value}')
+    validators.check_date(datetime.combine(parsed, time(), tzinfo=timezone.utc))
+    return parsed
+
+
+def parse_record(row: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """Map one Darwin Core record to rows of the garden tables.
+
+    Args:
+        row (dict[str, str]): Record keyed by Darwin Core term.
+
+    Raises:
+        ValidationError: If the record breaks the model validation rules.
+
+    Returns:
+        dict[str, dict[str, Any]]: Column values keyed by model name.
+    """
+    occurrence_id = _value(row, 'occurrenceID') or _value(row, 'catalogNumber')
+    if occurrence_id is None:
+        raise ValidationError('Record has no occurrenceID or catalogNumber')
+    author = _value(row, 'recordedBy')
+    if author is None:
+        raise ValidationError('Record has no recordedBy')
+
+    scientific_name = _value(row, 'scientificName')
+    name_parts = (scientific_name or '').split()
+    genus = _value(row, 'genus') or (name_parts[0] if name_parts else None)
+    species = _value(row, 'specificEpithet') or (name_parts[1] if len(name_parts) > 1 else None)
+    if genus is None or species is None:
+        raise ValidationError('Record has no genus and species')
+
+    records = {}
+    latitude = _decimal(row, 'decimalLatitude')
+    longitude = _decimal(row, 'decimalLongitude')
+    altitude = _decimal(row, 'minimumElevationInMeters')
+    coord_id = None
+    if latitude is not None and longitude is not None:
+        validators.check_coords(latitude)
+        validators.check_coords(longitude)
+        if altitude is not None:
+            validators.check_positive_height(altitude)
+        coord_id = _row_id('coord', occurrence_id)
+        records['coord'] = {
+            'id': coord_id,
+            'geog_point': (
+                f'SRID={consts.WGS84};POINT Z({longitude} {latitude} {altitude or 0})'
+            ),
+        }
+        if settings.COORD_STORAGE == consts.COORD_STORAGE_NUMERIC:
+            records['coord'].update(
+                altitude=altitude if altitude is not None else 0,
+                longitude=longitude,
+                latitude=latitude,
+            )
+
+    collect_place_id = None
+    country, region = _value(row, 'country'), _value(row, 'stateProvince')
+    if country and region:
+        collect_place_id = _row_id('collect_place', occurrence_id)
+        records['collectplace'] = {
+            'id': collect_place_id,
+            'country': country,
+            'region': region,
+            'city': _value(row, 'municipality'),
+            'coord_id': coord_id,
+        }
+
+    taxon = {
+        'domain': _value(row, 'domain'),
+        'kingdom': _value(row, 'kingdom'),
+        'phylum': _value(row, 'phylum'),
+        'klass': _value(row, 'class'),
+        'ordo': _value(row, 'order'),
+        'family': _value(row, 'family'),
+        'genus': genus,
+        'species': species,
+        'subspecies': _value(row, 'infraspecificEpithet'),
+    }
+    taxon_id = _row_id('taxon', json.dumps([taxon[name] for name in consts.TAXON_CLASSIFICATION]))
+    records['taxon'] = {'id': taxon_id, **taxon}
+
+    herbarium_id = None
+    institute, collection = _value(row, 'institutionCode'), _value(row, 'collectionCode')
+    if institute and collection:
+        herbarium_id = _row_id('herbarium', occurrence_id)
+        records['herbarium'] = {'id': herbarium_id, 'depart': collection, 'region': institute}
+
+    flora_id = _row_id('flora', occurrence_id)
+    establishment = (_value(row, 'establishmentMeans') or '').lower()
+    records['flora'] = {
+        'id': flora_id,
+        'alive': _value(row, 'basisOfRecord') == 'LivingSpecimen',
+        'author': author,
+        'geo_author': _value(row, 'georeferencedBy'),
+        'rus_name': _value(row, 'vernacularName'),
+        'taxonomycol': scientific_name or f'{genus} {species}',
+        'autochthony': AUTOCHTHONY.get(establishment),
+        'picture': '',
+        'taxon_id': taxon_id,
+        'collect_place_id': collect_place_id,
+        'herbarium_id': herbarium_id,
+        'created': validators.get_datetime(),
+        'duplicates_checked': False,
+    }
+
+    collected = _date(row, 'eventDate')
+    project = _value(row, 'datasetName') or collection
+    if institute and project:
+        records['label'] = {
+            'id': _row_id('label', occurrence_id),
+            'institute': institute,
+            'project': project,
+            'name': _value(row, 'catalogNumber') or occurrence_id,
+            'description': _value(row, 'occurrenceRemarks'),
+            'collected': collected,
+            'plant_id': flora_id,
+        }
+    return records
+
+
+def _columns(model_class) -> list[str]:
+    return [model_field.column for model_field in model_class._meta.concrete_fields]
+
+
+def parse_chunk(chunk: tuple[int, list[tuple[int, dict[str, str]]]]) -> dict[str, Any]:
+    """Parse and validate a chunk of records into COPY payloads.
+
+    Runs in a worker process, so it only touches plain data.
+
+    Args:
+        chunk (tuple): Chunk index and its ``(line, record)`` pairs.
+
+    Returns:
+        dict[str, Any]: Chunk index, CSV payload per model, row count and rejects.
+    """
+    index, rows = chunk
+    buffers = {
+        model_class._meta.model_name: io.StringIO() for model_class in IMPORT_MODELS
+    }
+    writers = {name: csv.writer(buffer) for name, buffer in buffers.items()}
+    rejects = []
+    accepted = 0
+    for line, row in rows:
+        try:
+            records = parse_record(row)
+        except ValidationError as error:
+            rejects.append((line, '; '.join(error.messages), row))
+            continue
+        accepted += 1
+        for model_class in IMPORT_MODELS:
+            name = model_class._meta.model_name
+            record = records.get(name)
+            if record is not None:
+                writers[name].writerow(
+                    NULL if record.get(column) is None else record[column]
+                    for column in _columns(model_class)
+                )
+    return {
+        'index': index,
+        'accepted': accepted,
+        'rejects': rejects,
+        'payloads': {name: buffer.getvalue() for name, buffer in buffers.items()},
+    }
+
+
+def _stage(model_class) -> str:
+    return f'import_{model_class._meta.model_name}'
+
+
+def _remap_taxa(cursor) -> None:
+    """Point staged specimens at taxa that already exist under another id."""
+    staged = ', '.join(f'staged.{name}' for name in consts.TAXON_CLASSIFICATION)
+    existing = ', '.join(f'taxon.{name}' for name in consts.TAXON_CLASSIFICATION)
+    cursor.execute(
+        f'UPDATE {_stage(models.Flora)} AS flora SET taxon_id = taxon.id '  # noqa: S608
+        f'FROM {_stage(models.Taxon)} AS staged '
+        f'JOIN {models.Taxon._meta.db_table} AS taxon '
+        f'ON ({staged}) IS NOT DISTINCT FROM ({existing}) '
+        'WHERE flora.taxon_id = staged.id AND taxon.id <> staged.id',
+    )
+
+
+def load_chunk(parsed: dict[str, Any]) -> Counter:
+    """Stream a parsed chunk into the garden tables in one transaction.
+
+    Args:
+        parsed (dict[str, Any]): Output of ``parse_chunk``.
+
+    Returns:
+        Counter: Number of inserted rows per model.
+    """
+    inserted = Counter()
+    with transaction.atomic(), connection.cursor() as cursor:
+        for model_class in IMPORT_MODELS:
+            columns = ', '.join(_columns(model_class))
+            cursor.execute(
+                f'CREATE TEMP TABLE {_stage(model_class)} (LIKE {model_class._meta.db_table})',
+            )
+            cursor.copy_expert(
+                f'COPY {_stage(model_class)} ({columns}) '
+                f"FROM STDIN WITH (FORMAT csv, NULL '{NULL}')",
+                io.StringIO(parsed['payloads'][model_class._meta.model_name]),
+            )
+        _remap_taxa(cursor)
+        for model_class in IMPORT_MODELS:
+            columns = ', '.join(_columns(model_class))
+            cursor.execute(
+                f'INSERT INTO {model_class._meta.db_table} ({columns}) '  # noqa: S608
+                f'SELECT {columns} FROM {_stage(model_class)} ON CONFLICT DO NOTHING',
+            )
+            inserted[model_class._meta.model_name] = cursor.rowcount
+            cursor.execute(f'DROP TABLE {_stage(model_class)}')
+    return inserted
+
+
+def _read_archive(path: Path) -> Iterator[dict[str, str]]:
+    with zipfile.ZipFile(path) as archive:
+        meta = ElementTree.fromstring(archive.read(DWC_ARCHIVE_META))  # noqa: S314
+        core = meta.find(f'{TEXT_NAMESPACE}core')
+        location = core.find(f'{TEXT_NAMESPACE}files/{TEXT_NAMESPACE}location').text
+        delimiter = core.get('fieldsTerminatedBy', ',').encode().decode('unicode_escape')
+        skip = int(core.get('ignoreHeaderLines', '0'))
+        terms = {
+            int(field_node.get('index')): _term(field_node.get('term'))
+            for field_node in core.findall(f'{TEXT_NAMESPACE}field')
+            if field_node.get('index') is not None
+        }
+        id_node = core.find(f'{TEXT_NAMESPACE}id')
+        if id_node is not None:
+            terms.setdefault(int(id_node.get('index')), 'occurrenceID')
+        with archive.open(location) as core_file:
+            reader = csv.reader(io.TextIOWrapper(core_file, encoding='utf-8'), delimiter=delimiter)
+            for line, values in enumerate(reader, start=1):
+                if line > skip:
+                    yield {
+                        term: values[index] for index, term in terms.items() if index < len(values)
+                    }
+
+
+def _read_csv(path: Path) -> Iterator[dict[str, str]]:
+    delimiter = '\t' if path.suffix in {'.tsv', '.txt'} else ','
+    with open(path, newline='', encoding='utf-8') as source:
+        reader = csv.DictReader(source, delimiter=delimiter)
+        reader.fieldnames = [_term(name) for name in reader.fieldnames or ()]
+        yield from reader
+
+
+def read_records(path: Path) -> Iterator[dict[str, str]]:
+    """Yield records of a CSV file or a Darwin Core archive.
+
+    Args:
+        path (Path): Path to a ``.csv``/``.tsv`` file or a DwC-A ``.zip``.
+
+    Returns:
+        Iterator[dict[str, str]]: Records keyed by Darwin Core term.
+    """
+    if zipfile.is_zipfile(path):
+        return _read_archive(path)
+    return _read_csv(path)
+
+
+def iter_chunks(
+    path: Path, chunk_size: int, skip: int = 0,
+) -> Iterator[tuple[int, list[tuple[int, dict[str, str]]]]]:
+    """Split records of the source into numbered chunks.
+
+    Args:
+        path (Path): Source file.
+        chunk_size (int): Records per chunk.
+        skip (int): Number of leading chunks that are already loaded.
+
+    Returns:
+        Iterator[tuple]: Chunk index and its ``(line, record)`` pairs.
+    """
+    rows = []
+    index = 0
+    for line, row in enumerate(read_records(path), start=1):
+        rows.append((line, row))
+        if len(rows) == chunk_size:
+            if index >= skip:
+                yield index, rows
+            rows = []
+            index += 1
+    if rows and index >= skip:
+        yield index, rows
+
+
+def parse_in_pool(chunks, workers: int) -> Iterator[dict[str, Any]]:
+    """Parse chunks in worker processes, yielding results in input order.
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    no matter how large the source is.
+
+    Args:
+        chunks: Iterable of chunks from ``iter_chunks``.
+        workers (int): Number of worker processes.
+
+    Returns:
+        Iterator[dict[str, Any]]: Parsed chunks.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(parse_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def read_checkpoint(path: Path) -> int:
+    """Return the number of chunks already loaded according to the checkpoint.
+
+    Args:
+        path (Path): Checkpoint file.
+
+    Returns:
+        int: Loaded chunk count, 0 if there is no checkpoint.
+    """
+    if not path.exists():
+        return 0
+    return json.loads(path.read_text())['chunks']
+
+
+def write_checkpoint(path: Path, chunks: int) -> None:
+    """Atomically record the number of loaded chunks.
+
+    Args:
+        path (Path): Checkpoint file.
+        chunks (int): Loaded chunk count.
+    """
+    temporary = path.with_suffix(f'{path.suffix}.tmp')
+    temporary.write_text(json.dumps({'chunks': chunks}))
+    os.replace(temporary, path)
+
+
+def run_import(
+    path: Path,
+    workers: int,
+    chunk_size: int,
+    checkpoint: Path,
+    rejects: Path,
+    resume: bool = False,
+) -> Counter:
+    """Import a specimen source into the garden schema.
+
+    Args:
+        path (Path): Source file.
+        workers (int): Number of parser processes.
+        chunk_size (int): Records per chunk and per transaction.
+        checkpoint (Path): Checkpoint file updated after each loaded chunk.
+        rejects (Path): CSV report of rejected records.
+        resume (bool): Continue after the last checkpointed chunk.
+
+    Returns:
+        Counter: Accepted, rejected and inserted row counts.
+    """
+    skip = read_checkpoint(checkpoint) if resume else 0
+    stats = Counter(skipped_chunks=skip)
+    with open(rejects, 'a' if resume else 'w', newline='', encoding='utf-8') as report:
+        writer = csv.writer(report)
+        if not resume or report.tell() == 0:
+            writer.writerow(('line', 'reason', 'record'))
+        for parsed in parse_in_pool(iter_chunks(path, chunk_size, skip), workers):
+            stats.update(load_chunk(parsed))
+            for line, reason, row in parsed['rejects']:
+                writer.writerow((line, reason, json.dumps(row, ensure_ascii=False)))
+            report.flush()
+            write_checkpoint(checkpoint, parsed['index'] + 1)
+            stats['accepted'] += parsed['accepted']
+            stats['rejected'] += len(parsed['rejects'])
+    for model_class in IMPORT_MODELS:
+        caching.invalidate_model(model_class)
+    return stats
@@ -0,0 +1,381 @@
+"""Module that provides the database-backed background job queue.
+
+Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number
+of them can poll the same table without blocking each other. A running job
+holds a lease renewed by a heartbeat thread; jobs whose lease expired are
+returned to the queue.
+"""
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+from django.db import DatabaseError, connection, transaction
+from django.db.models import F
+from garden_app import caching, consts, duplicates, geocoding, importer, models, validators
+
+HANDLERS: dict[str, Callable[[models.Job], Any]] = {}
+
+
+def register(kind: str):
+    """Register a job handler under the given kind.
+
+    The handler receives the claimed job and returns a JSON-serializable result.
+
+    Args:
+        kind (str): Job kind.
+
+    Returns:
+        Callable: Decorator registering the handler.
+    """
+    def decorator(handler):
+        HANDLERS[kind] = handler
+        return handler
+    return decorator
+
+
+def enqueue(kind: str, payload: dict | None = None, priority: int = 0, delay: int = 0):
+    """Put a job on the queue.
+
+    Args:
+        kind (str): Kind of a registered handler.
+        payload (dict | None): Handler arguments.
+        priority (int): Jobs with higher priority are claimed first.
+        delay (int): Seconds to wait before the job may run.
+
+    Raises:
+        ValueError: If no handler is registered for the kind.
+
+    Returns:
+        Job: Queued job.
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f'Unknown job kind: {kind}')
+    return models.Job.objects.create(
+        kind=kind,
+        payload=payload or {},
+        priority=priority,
+        run_after=validators.get_datetime() + timedelta(seconds=delay),
+    )
+
+
+def claim(worker: str):
+    """Lock the most urgent runnable job and mark it as running.
+
+    Args:
+        worker (str): Name of the claiming worker.
+
+    Returns:
+        Job | None: Claimed job or None if the queue is empty.
+    """
+    now = validators.get_datetime()
+    with transaction.atomic():
+        job = models.Job.objects.select_for_update(skip_locked=True).filter(
+            status=consts.JOB_QUEUED, run_after__lte=now,
+        ).order_by('-priority', 'run_after').first()
+        if job is None:
+            return None
+        job.status = consts.JOB_RUNNING
+        job.attempts += 1
+        job.worker = worker
+        job.started = now
+        job.heartbeat = now
+        job.save(update_fields=['status', 'attempts', 'worker', 'started', 'heartbeat'])
+    return job
+
+
+def report_progress(job, progress: float) -> None:
+    """Store progress of a running job.
+
+    Args:
+        job (Job): Running job.
+        progress (float): Done fraction from 0 to 1.
+    """
+    job.progress = progress
+    models.Job.objects.filter(pk=job.pk).update(progress=progress)
+
+
+def _owned(job):
+    return models.Job.objects.filter(
+        pk=job.pk, status=consts.JOB_RUNNING, worker=job.worker, attempts=job.attempts,
+    )
+
+
+@contextmanager
+def heartbeat(job):
+    """Renew the lease of a running job from a background thread.
+
+    The thread uses its own database connection and keeps beating while the
+    handler blocks in long queries. Failed beats are retried on the next one.
+
+    Args:
+        job (Job): Claimed job.
+
+    Yields:
+        None: While the lease is renewed.
+    """
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(consts.JOB_HEARTBEAT_INTERVAL):
+                try:
+                    _owned(job).update(heartbeat=validators.get_datetime())
+                except DatabaseError:
+                    connection.close()
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f'heartbeat-{job.pk}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run(job) -> None:
+    """Run a claimed job and record its outcome.
+
+    Failed jobs are requeued with exponential backoff until they run out of attempts.
+    The outcome is only recorded while the worker still holds the job, a job
+    requeued after its lease expired belongs to its new worker.
+
+    Args:
+        job (Job): Claimed job.
+    """
+    try:
+        with heartbeat(job):
+            job.result = HANDLERS[job.kind](job)
+    except Exception:
+        job.error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = consts.JOB_QUEUED
+            delay = consts.JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+            job.run_after = validators.get_datetime() + timedelta(seconds=delay)
+        else:
+            job.status = consts.JOB_FAILED
+    else:
+        job.status = consts.JOB_DONE
+        job.progress = 1
+        job.error = None
+    job.finished = validators.get_datetime()
+    _owned(job).update(**{
+        name: getattr(job, name)
+        for name in ('status', 'progress', 'result', 'error', 'run_after', 'finished')
+    })
+
+
+def run_inline(kind: str, payload: dict | None = None, worker: str = 'inline'):
+    """Run a job in the current process and record it like a queued one.
+
+    Inline jobs are not retried, a failure is recorded right away.
+
+    Args:
+        kind (str): Kind of a registered handler.
+        payload (dict | None): Handler arguments.
+        worker (str): Name recorded as the job worker.
+
+    Raises:
+        ValueError: If no handler is registered for the kind.
+
+    Returns:
+        Job: Finished job.
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f'Unknown job kind: {kind}')
+    job = models.Job.objects.create(
+        kind=kind,
+        payload=payload or {},
+        status=consts.JOB_RUNNING,
+        attempts=1,
+        max_attempts=1,
+        worker=worker,
+        started=validators.get_datetime(),
+        heartbeat=validators.get_datetime(),
+    )
+    run(job)
+    return job
+
+
+def requeue_stale() -> int:
+    """Return jobs whose lease expired, e.g. of crashed workers, to the queue.
+
+    Jobs that used up their attempts are failed instead, so a job that kills
+    its worker does not crash workers forever.
+
+    Returns:
+        int: Number of requeued jobs.
+    """
+    now = validators.get_datetime()
+    stale = models.Job.objects.filter(
+        status=consts.JOB_RUNNING,
+        heartbeat__lt=now - timedelta(seconds=consts.JOB_STALE_TIMEOUT),
+    )
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status=consts.JOB_FAILED, error='Lease expired', finished=now,
+    )
+    return stale.filter(attempts__lt=F('max_attempts')).update(
+        status=consts.JOB_QUEUED, worker=None,
+    )
+
+
+def work(worker: str, burst: bool = False, should_stop: Callable[[], bool] = bool) -> int:
+    """Claim and run jobs until stopped.
+
+    Expired leases are requeued every heartbeat interval. Database errors,
+    e.g. while the server restarts, do not stop the loop: the connection is
+    dropped and the worker backs off exponentially.
+
+    Args:
+        worker (str): Worker name.
+        burst (bool): Stop as soon as the queue is empty.
+        should_stop (Callable[[], bool]): Polled between jobs to stop the loop.
+
+    Returns:
+        int: Number of processed jobs.
+    """
+    processed = 0
+    backoff = consts.JOB_POLL_INTERVAL
+    requeue_at = 0
+    while not should_stop():
+        try:
+            if time.monotonic() >= requeue_at:
+                requeue_stale()
+                requeue_at = time.monotonic() + consts.JOB_HEARTBEAT_INTERVAL
+            job = claim(worker)
+            if job is not None:
+                run(job)
+                processed += 1
+        except DatabaseError:
+            connection.close()
+            time.sleep(backoff)
+            backoff = min(backoff * 2, consts.JOB_MAX_BACKOFF)
+            continue
+        backoff = consts.JOB_POLL_INTERVAL
+        if job is None:
+            if burst:
+                break
+            time.sleep(consts.JOB_POLL_INTERVAL)
+    return processed
+
+
+@register('backfill_coord_points')
+def backfill_coord_points(job) -> dict[str, int]:
+    """Fill the 3D point column added by the CoordPointZ migration in batches.
+
+    Only useful between the CoordPointZ and CoordPointSwap migrations, the
+    latter replaces the 2D point with the filled column.
+    """
+    table = models.Coord._meta.db_table
+    batch_size = job.payload.get('batch_size', consts.BACKFILL_BATCH_SIZE)
+    pending = (
+        f'SELECT id FROM {table} WHERE geog_point_z IS NULL '  # noqa: S608
+        'AND (longitude IS NOT NULL AND latitude IS NOT NULL OR geog_point IS NOT NULL)'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM ({pending}) AS pending')  # noqa: S608
+        total = cursor.fetchone()[0]
+    updated = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} SET geog_point_z = '  # noqa: S608
+                'garden.coord_point_z(longitude, latitude, altitude, geog_point) '
+                f'WHERE id IN ({pending} LIMIT %s)',
+                [batch_size],
+            )
+            batch = cursor.rowcount
+        if not batch:
+            break
+        updated += batch
+        report_progress(job, updated / total if total else 1)
+    caching.invalidate_model(models.Coord)
+    return {'updated': updated}
+
+
+# Moves coordinates of a batch of rows into the storage mode named by the key.
+_STORE_COORDS = {
+    consts.COORD_STORAGE_POINT: (
+        'SET geog_point = ST_SetSRID(ST_MakePoint('
+        'longitude, latitude, COALESCE(altitude, 0)), 4326)::geography, '
+        'longitude = NULL, latitude = NULL, altitude = NULL',
+        'longitude IS NOT NULL AND latitude IS NOT NULL',
+    ),
+    consts.COORD_STORAGE_NUMERIC: (
+        'SET longitude = ST_X(geog_point::geometry), latitude = ST_Y(geog_point::geometry), '
+        'altitude = COALESCE(ST_Z(geog_point::geometry), 0)',
+        'latitude IS NULL AND geog_point IS NOT NULL',
+    ),
+}
+
+
+@register('store_coords')
+def store_coords(job) -> dict[str, int]:
+    """Convert Coord rows to the ``storage`` of the payload in batches.
+
+    Run it after switching the COORD_STORAGE setting, rows written by the
+    old setting in the meantime are picked up by running it again.
+    """
+    storage = job.payload.get('storage', consts.COORD_STORAGE_POINT)
+    assignments, condition = _STORE_COORDS[storage]
+    table = models.Coord._meta.db_table
+    batch_size = job.payload.get('batch_size', consts.BACKFILL_BATCH_SIZE)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM {table} WHERE {condition}')  # noqa: S608
+        total = cursor.fetchone()[0]
+    updated = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} {assignments} '  # noqa: S608
+                f'WHERE id IN (SELECT id FROM {table} WHERE {condition} LIMIT %s)',
+                [batch_size],
+            )
+            batch = cursor.rowcount
+        if not batch:
+            break
+        updated += batch
+        report_progress(job, updated / total if total else 1)
+    caching.invalidate_model(models.Coord)
+    return {'updated': updated}
+
+
+@register('import_specimens')
+def import_specimens(job) -> dict[str, int]:
+    """Run a bulk specimen import described by the job payload."""
+    path = Path(job.payload['path'])
+    stats = importer.run_import(
+        path,
+        workers=job.payload.get('workers', 1),
+        chunk_size=job.payload.get('chunk_size', consts.IMPORT_CHUNK_SIZE),
+        checkpoint=path.with_name(f'{path.name}.checkpoint'),
+        rejects=path.with_name(f'{path.name}.rejects.csv'),
+        resume=job.attempts > 1,
+    )
+    enqueue('detect_duplicates')
+    return dict(stats)
+
+
+@register('detect_duplicates')
+def detect_duplicates(job) -> dict:
+    """Detect near-duplicate specimens not checked by a previous detection run."""
+    return duplicates.detect(
+        distance=job.payload.get('distance', consts.DUPLICATE_DISTANCE),
+        days=job.payload.get('days', consts.DUPLICATE_DAYS),
+        full=job.payload.get('full', False),
+    )
+
+
+@register('reverse_geocode')
+def reverse_geocode(job) -> dict:
+    """Fill in, fix or validate collect place fields from administrative boundaries."""
+    return geocoding.reverse_geocode(
+        mode=job.payload.get('mode', consts.GEOCODE_FILL),
+        batch_size=job.payload.get('batch_size', consts.GEOCODE_BATCH_SIZE),
+        progress=lambda done: report_progress(job, done),
+    )
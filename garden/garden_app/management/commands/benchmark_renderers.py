@@ -0,0 +1,93 @@
+"""Module that provides the API renderer benchmark command."""
+import gzip
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+from garden_app import models, renderers, serializers
+from rest_framework.renderers import JSONRenderer
+
+RENDERERS = (
+    ('drf-json', JSONRenderer()),
+    ('orjson', renderers.ORJSONRenderer()),
+    ('msgpack', renderers.MessagePackRenderer()),
+)
+
+SERIALIZERS = (
+    (models.Flora, serializers.FloraSerializer),
+    (models.Coord, serializers.CoordSerializer),
+)
+
+
+def seed(count: int) -> None:
+    """Create floras with taxon, collect place and coordinates.
+
+    Args:
+        count (int): Number of floras.
+    """
+    taxon = models.Taxon.objects.create(genus='Betula', species='pendula')
+    coords = models.Coord.objects.bulk_create(
+        models.Coord(latitude=55 + number / count, longitude=37 + number / count)
+        for number in range(count)
+    )
+    places = models.CollectPlace.objects.bulk_create(
+        models.CollectPlace(country='Russia', region='Moscow', coord=coord) for coord in coords
+    )
+    models.Flora.objects.bulk_create(
+        models.Flora(
+            author='Ford',
+            taxonomycol=f'Betula pendula {number}',
+            rus_name='Береза повислая',
+            taxon=taxon,
+            collect_place=place,
+        )
+        for number, place in enumerate(places)
+    )
+
+
+class Command(BaseCommand):
+    """Compare encode time and response size of the API renderers."""
+
+    help = 'Benchmark API renderers on Flora and Coord list responses.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Seed this many floras in a rolled back transaction first.',
+        )
+        parser.add_argument('--limit', type=int, default=1000, help='Records per response.')
+        parser.add_argument('--repeat', type=int, default=10, help='Encodings per renderer.')
+
+    def handle(self, *args, **options):
+        """Print encode time, raw and gzipped size per serializer and renderer."""
+        with transaction.atomic():
+            if options['seed']:
+                seed(options['seed'])
+            self.benchmark(options['limit'], options['repeat'])
+            transaction.set_rollback(True)
+
+    def benchmark(self, limit: int, repeat: int) -> None:
+        """Encode list responses with every renderer and print the results.
+
+        Args:
+            limit (int): Records per response.
+            repeat (int): Encodings per renderer.
+        """
+        request = RequestFactory().get('/api/')
+        self.stdout.write(
+            f'{"serializer":<22}{"renderer":<10}{"records":>8}{"ms":>10}{"bytes":>12}{"gzip":>10}',
+        )
+        for model_class, serializer_class in SERIALIZERS:
+            queryset = model_class.objects.all()[:limit]
+            data = serializer_class(queryset, many=True, context={'request': request}).data
+            for name, renderer in RENDERERS:
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    content = renderer.render(data)
+                elapsed = (time.perf_counter() - started) / repeat * 1000
+                self.stdout.write(
+                    f'{serializer_class.__name__:<22}{name:<10}{len(data):>8}'
+                    f'{elapsed:>10.2f}{len(content):>12}{len(gzip.compress(content)):>10}',
+                )
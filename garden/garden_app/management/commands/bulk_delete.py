@@ -0,0 +1,50 @@
+"""Module that provides the bulk delete command."""
+import json
+from pathlib import Path
+
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import ProtectedError
+from garden_app import bulk, consts
+
+
+class Command(BaseCommand):
+    """Delete records and their cascades with set-based SQL."""
+
+    help = 'Delete records selected by ids or a filter together with everything cascading.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('model', help='Model name, e.g. flora or taxon.')
+        parser.add_argument('--ids-file', type=Path, help='File with one id per line.')
+        parser.add_argument('--filter', type=json.loads, help='JSON filter expression.')
+        parser.add_argument(
+            '--batch-size', type=int, default=consts.DELETE_BATCH_SIZE, help='Records per batch.',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help='Only report affected row counts.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the deletion and print affected row counts."""
+        try:
+            model_class = apps.get_model('garden_app', options['model'])
+        except LookupError as error:
+            raise CommandError(error)
+        ids = None
+        if options['ids_file']:
+            ids = [line.strip() for line in options['ids_file'].read_text().splitlines()]
+            ids = [pk for pk in ids if pk]
+        try:
+            affected = bulk.delete(
+                bulk.select(model_class, ids, options['filter']),
+                batch_size=options['batch_size'],
+                dry_run=options['dry_run'],
+            )
+        except ValidationError as error:
+            raise CommandError('; '.join(error.messages))
+        except ProtectedError as error:
+            raise CommandError(error.args[0])
+        for label, count in sorted(affected.items()):
+            self.stdout.write(f'{label}: {count}')
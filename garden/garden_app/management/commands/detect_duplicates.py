@@ -0,0 +1,42 @@
+"""Module that provides the duplicate detection command."""
+from django.core.management.base import BaseCommand, CommandError
+from garden_app import consts, jobs
+
+
+class Command(BaseCommand):
+    """Detect near-duplicate specimens."""
+
+    help = 'Store candidate pairs of near-duplicate specimens for review.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--full', action='store_true', help='Check every specimen again.',
+        )
+        parser.add_argument(
+            '--distance', type=float, default=consts.DUPLICATE_DISTANCE,
+            help='Maximum distance between duplicates in meters.',
+        )
+        parser.add_argument(
+            '--days', type=int, default=consts.DUPLICATE_DAYS,
+            help='Maximum number of days between collection dates.',
+        )
+        parser.add_argument(
+            '--enqueue', action='store_true', help='Queue the detection for workers.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the detection and print the number of new candidates."""
+        if options['distance'] <= 0 or options['days'] < 0:
+            raise CommandError('Distance must be positive and days not negative.')
+        payload = {key: options[key] for key in ('full', 'distance', 'days')}
+        if options['enqueue']:
+            job = jobs.enqueue('detect_duplicates', payload)
+            self.stdout.write(f'Queued job {job.pk}')
+            return
+        job = jobs.run_inline('detect_duplicates', payload)
+        if job.status != consts.JOB_DONE:
+            raise CommandError(job.error)
+        self.stdout.write(
+            f'Checked: {job.result["checked"]}, new candidates: {job.result["candidates"]}',
+        )
@@ -0,0 +1,44 @@
+"""Module that provides the bulk specimen import command."""
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from garden_app import consts, importer
+
+
+class Command(BaseCommand):
+    """Import specimens from a CSV file or a Darwin Core archive."""
+
+    help = 'Import specimens from a CSV file or a Darwin Core archive with COPY.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('path', type=Path, help='CSV/TSV file or DwC-A zip archive.')
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1, help='Parser processes.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=consts.IMPORT_CHUNK_SIZE,
+            help='Records per chunk and per transaction.',
+        )
+        parser.add_argument('--checkpoint', type=Path, help='Checkpoint file.')
+        parser.add_argument('--rejects', type=Path, help='Report of rejected records.')
+        parser.add_argument(
+            '--resume', action='store_true', help='Continue after the last checkpoint.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the import and print its statistics."""
+        path = options['path']
+        stats = importer.run_import(
+            path,
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+            checkpoint=options['checkpoint'] or path.with_name(f'{path.name}.checkpoint'),
+            rejects=options['rejects'] or path.with_name(f'{path.name}.rejects.csv'),
+            resume=options['resume'],
+        )
+        for name, count in sorted(stats.items()):
+            self.stdout.write(f'{name}: {count}')
@@ -0,0 +1,52 @@
+"""Module that provides the administrative boundary loading command."""
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from garden_app import consts, geocoding, models
+
+
+class Command(BaseCommand):
+    """Load administrative boundaries for reverse geocoding."""
+
+    help = 'Load administrative boundary polygons from a local vector file.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('path', type=Path, help='GeoJSON, Shapefile or GeoPackage file.')
+        parser.add_argument('--layer', default=0, help='Layer index or name.')
+        parser.add_argument(
+            '--level', type=int, help='Administrative level of every feature, e.g. 2 or 4.',
+        )
+        parser.add_argument('--name-field', default='name', help='Field with boundary names.')
+        parser.add_argument(
+            '--level-field', default='admin_level', help='Field with administrative levels.',
+        )
+        parser.add_argument(
+            '--replace', action='store_true', help='Remove loaded boundaries of the level first.',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=consts.BOUNDARY_BATCH_SIZE,
+            help='Boundaries per insert.',
+        )
+
+    def handle(self, *args, **options):
+        """Load the boundaries and print their number."""
+        layer = options['layer']
+        if isinstance(layer, str) and layer.isdigit():
+            layer = int(layer)
+        with transaction.atomic():
+            if options['replace']:
+                boundaries = models.AdminBoundary.objects.all()
+                if options['level'] is not None:
+                    boundaries = boundaries.filter(level=options['level'])
+                boundaries.delete()
+            stats = geocoding.load_boundaries(
+                options['path'],
+                level=options['level'],
+                name_field=options['name_field'],
+                level_field=options['level_field'],
+                layer=layer,
+                batch_size=options['batch_size'],
+            )
+        self.stdout.write(f'Loaded boundaries: {stats["loaded"]}, skipped: {stats["skipped"]}')
@@ -0,0 +1,70 @@
+"""Module that provides the coordinate storage measurement command."""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import RequestFactory
+from garden_app import consts, models, serializers
+
+
+class Command(BaseCommand):
+    """Report Coord table size and coordinate loading and serialization throughput."""
+
+    help = 'Measure Coord table size and serialization throughput of both storage modes.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--limit', type=int, default=10000, help='Coords to serialize.')
+        parser.add_argument('--repeat', type=int, default=5, help='Serializations per mode.')
+
+    def handle(self, *args, **options):
+        """Print table size and serialization throughput."""
+        self.measure_table()
+        self.measure_serialization(options['limit'], options['repeat'])
+
+    def measure_table(self) -> None:
+        """Print row counts per storage mode, heap and total size and average row width."""
+        table = models.Coord._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT COUNT(*), COUNT(latitude), '  # noqa: S608
+                'pg_relation_size(%s), pg_total_relation_size(%s), '
+                f'COALESCE(AVG(pg_column_size(coord.*)), 0) FROM {table} AS coord',
+                [table, table],
+            )
+            rows, numeric, heap, total, width = cursor.fetchone()
+        self.stdout.write(f'rows: {rows} (numeric: {numeric}, point: {rows - numeric})')
+        self.stdout.write(f'heap bytes: {heap}')
+        self.stdout.write(f'total bytes: {total}')
+        self.stdout.write(f'average row bytes: {width:.1f}')
+
+    def measure_serialization(self, limit: int, repeat: int) -> None:
+        """Print coords per second loaded and serialized from each storage.
+
+        The same rows are read once from their numeric columns and once from
+        their point only, as the point storage mode reads them.
+
+        Args:
+            limit (int): Coords to serialize.
+            repeat (int): Serializations per mode.
+        """
+        pks = list(
+            models.Coord.objects.filter(latitude__isnull=False, geog_point__isnull=False)
+            .values_list('pk', flat=True)[:limit],
+        )
+        if not pks:
+            self.stdout.write('No rows with numeric coordinates to compare.')
+            return
+        coords = models.Coord.objects.filter(pk__in=pks)
+        context = {'request': RequestFactory().get('/api/coords/')}
+        modes = (
+            (consts.COORD_STORAGE_NUMERIC, coords),
+            (consts.COORD_STORAGE_POINT, coords.defer(*consts.COORD_COLUMNS)),
+        )
+        for name, queryset in modes:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                serializers.CoordSerializer(queryset.all(), many=True, context=context).data
+            elapsed = (time.perf_counter() - started) / repeat
+            rate = len(pks) / elapsed if elapsed else 0
+            self.stdout.write(f'{name}: {rate:.0f} coords/s')
@@ -0,0 +1,97 @@
+"""Module that provides the startup profiling command."""
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs django.setup() in a fresh interpreter, timing every AppConfig.ready().
+SETUP_SCRIPT = '''
+import json, time
+from django.apps import config
+
+create = config.AppConfig.create.__func__
+ready_times = {}
+
+
+def timed_create(cls, entry):
+    app_config = create(cls, entry)
+    ready = app_config.ready
+
+    def timed_ready():
+        started = time.perf_counter()
+        ready()
+        ready_times[app_config.label] = time.perf_counter() - started
+
+    app_config.ready = timed_ready
+    return app_config
+
+
+config.AppConfig.create = classmethod(timed_create)
+started = time.perf_counter()
+import django
+django.setup()
+print(json.dumps({'setup': time.perf_counter() - started, 'ready': ready_times}))
+'''
+
+
+def parse_import_times(output: str) -> list[tuple[str, int, int]]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        output (str): Standard error of the profiled interpreter.
+
+    Returns:
+        list[tuple[str, int, int]]: Module, self and cumulative microseconds.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, cumulative, module = line.removeprefix('import time:').split('|')
+        imports.append((module.strip(), int(own), int(cumulative)))
+    return imports
+
+
+class Command(BaseCommand):
+    """Report the slowest imports and app-ready steps of process startup."""
+
+    help = 'Profile imports and app ready() calls of a fresh django.setup().'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--top', type=int, default=20, help='Number of imports to show.')
+        parser.add_argument(
+            '--self-time', action='store_true',
+            help='Sort imports by self instead of cumulative time.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the profile in a subprocess and print the report."""
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get(
+            'DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE,
+        )}
+        completed = subprocess.run(  # noqa: S603
+            [sys.executable, '-X', 'importtime', '-c', SETUP_SCRIPT],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=settings.BASE_DIR,
+        )
+        if completed.returncode:
+            raise CommandError(completed.stderr.splitlines()[-1] if completed.stderr else 'failed')
+        timings = json.loads(completed.stdout.splitlines()[-1])
+        imports = parse_import_times(completed.stderr)
+        column = 1 if options['self_time'] else 2
+
+        self.stdout.write(f'django.setup(): {timings["setup"] * 1000:.1f} ms')
+        self.stdout.write(f'\n{"self ms":>10}{"total ms":>10}  module')
+        for module, own, cumulative in sorted(
+            imports, key=lambda row: row[column], reverse=True,
+        )[:options['top']]:
+            self.stdout.write(f'{own / 1000:>10.1f}{cumulative / 1000:>10.1f}  {module}')
+        self.stdout.write(f'\n{"ready ms":>10}  app')
+        for label, seconds in sorted(timings['ready'].items(), key=lambda row: -row[1]):
+            self.stdout.write(f'{seconds * 1000:>10.1f}  {label}')
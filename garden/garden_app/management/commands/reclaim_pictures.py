@@ -0,0 +1,31 @@
+"""Module that provides the picture garbage collection command."""
+from django.core.management.base import BaseCommand
+from garden_app import consts, pictures
+
+
+class Command(BaseCommand):
+    """Reclaim orphaned and duplicate pictures from the bucket."""
+
+    help = 'Delete pictures no flora references and merge duplicate pictures.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--workers', type=int, default=consts.PICTURE_RECLAIM_WORKERS,
+            help='Threads for bucket requests.',
+        )
+        parser.add_argument(
+            '--grace', type=int, default=consts.PICTURE_RECLAIM_GRACE,
+            help='Skip objects younger than this many seconds.',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help='Only report what would be reclaimed.',
+        )
+
+    def handle(self, *args, **options):
+        """Run the garbage collection and print its statistics."""
+        stats = pictures.reclaim(
+            workers=options['workers'], grace=options['grace'], dry_run=options['dry_run'],
+        )
+        for name, count in sorted(stats.items()):
+            self.stdout.write(f'{name}: {count}')
@@ -0,0 +1,41 @@
+"""Module that provides the reverse geocoding command."""
+from django.core.management.base import BaseCommand, CommandError
+from garden_app import consts, jobs
+
+
+class Command(BaseCommand):
+    """Fill in or validate collect places from administrative boundaries."""
+
+    help = 'Fill in, fix or validate collect place fields by their coordinates.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--mode',
+            choices=(consts.GEOCODE_FILL, consts.GEOCODE_FIX, consts.GEOCODE_VALIDATE),
+            default=consts.GEOCODE_FILL,
+            help='Fill empty fields, fix mismatching ones or only report mismatches.',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=consts.GEOCODE_BATCH_SIZE,
+            help='Collect places per batch.',
+        )
+        parser.add_argument(
+            '--enqueue', action='store_true', help='Queue the job for workers.',
+        )
+
+    def handle(self, *args, **options):
+        """Run reverse geocoding and print per-field counts."""
+        payload = {'mode': options['mode'], 'batch_size': options['batch_size']}
+        if options['enqueue']:
+            job = jobs.enqueue('reverse_geocode', payload)
+            self.stdout.write(f'Queued job {job.pk}')
+            return
+        job = jobs.run_inline('reverse_geocode', payload)
+        if job.status != consts.JOB_DONE:
+            raise CommandError(job.error)
+        for key, counts in job.result.items():
+            if key == 'sample':
+                continue
+            for column, count in counts.items():
+                self.stdout.write(f'{key} {column}: {count}')
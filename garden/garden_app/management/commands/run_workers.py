@@ -0,0 +1,52 @@
+"""Module that provides the background job worker command."""
+import multiprocessing
+import os
+import signal
+import socket
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from garden_app import jobs
+
+
+def _work(name: str, burst: bool) -> None:
+    stop = multiprocessing.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    jobs.work(name, burst=burst, should_stop=stop.is_set)
+
+
+class Command(BaseCommand):
+    """Run worker processes that execute queued jobs."""
+
+    help = 'Run worker processes that execute queued background jobs.'
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument('--processes', type=int, default=1, help='Worker processes.')
+        parser.add_argument(
+            '--burst', action='store_true', help='Exit once the queue is empty.',
+        )
+
+    def handle(self, *args, **options):
+        """Start the workers and wait for them to finish."""
+        connections.close_all()
+        prefix = f'{socket.gethostname()}:{os.getpid()}'
+        workers = [
+            multiprocessing.Process(
+                target=_work, args=(f'{prefix}:{number}', options['burst']),
+            )
+            for number in range(options['processes'])
+        ]
+        for worker in workers:
+            worker.start()
+
+        def stop(*_):
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        for worker in workers:
+            worker.join()
@@ -0,0 +1,91 @@
+"""Module that provides middleware."""
+import time
+
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+from garden_app import consts, models
+
+SAFE_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+
+class LoadSheddingMiddleware:
+    """Reject API requests with 503 while the database is overloaded.
+
+    The database is probed directly: at most once per probe interval the
+    process times a trivial query and keeps an exponentially weighted moving
+    average of its latency. Slow queries of the application itself, e.g.
+    aggregations, do not count. Write requests are also rejected while the
+    background job queue is too deep.
+    """
+
+    def __init__(self, get_response):
+        """Initialize middleware.
+
+        Args:
+            get_response (Callable): Next handler in the chain.
+        """
+        self.get_response = get_response
+        self.latency = 0.0
+        self.probed = float('-inf')
+
+    def __call__(self, request):
+        """Handle the request unless the service is overloaded.
+
+        Args:
+            request (HttpRequest): Incoming request.
+
+        Returns:
+            HttpResponse: Response or 503 with Retry-After.
+        """
+        if not request.path.startswith(consts.API_PREFIX):
+            return self.get_response(request)
+        if self.db_latency() > consts.SHED_DB_LATENCY or (
+            request.method not in SAFE_METHODS and queue_depth() > consts.SHED_QUEUE_DEPTH
+        ):
+            response = JsonResponse(
+                {'detail': 'Service is overloaded, retry later.'}, status=503,
+            )
+            response['Retry-After'] = str(consts.SHED_RETRY_AFTER)
+            return response
+        return self.get_response(request)
+
+    def db_latency(self) -> float:
+        """Return the probe latency average, probing the database when it is due.
+
+        A probe counts at most twice the threshold, so a single stall does not
+        shed traffic on its own. A failed probe, e.g. while the server
+        restarts, sets the average to twice the threshold.
+
+        Returns:
+            float: Average latency in seconds.
+        """
+        if time.monotonic() - self.probed >= consts.SHED_PROBE_INTERVAL:
+            started = time.monotonic()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            except DatabaseError:
+                connection.close()
+                self.probed = time.monotonic()
+                self.latency = consts.SHED_DB_LATENCY * 2
+                return self.latency
+            self.probed = time.monotonic()
+            duration = min(self.probed - started, consts.SHED_DB_LATENCY * 2)
+            alpha = consts.LATENCY_EWMA_ALPHA
+            self.latency = self.latency * (1 - alpha) + duration * alpha
+        return self.latency
+
+
+def queue_depth() -> int:
+    """Return the number of queued background jobs, cached for a few seconds.
+
+    Returns:
+        int: Queued jobs.
+    """
+    key = f'{consts.CACHE_PREFIX}:queue_depth'
+    depth = cache.get(key)
+    if depth is None:
+        depth = models.Job.objects.filter(status=consts.JOB_QUEUED).count()
+        cache.set(key, depth, consts.QUEUE_DEPTH_CACHE_TIMEOUT)
+    return depth
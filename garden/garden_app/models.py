@@ -1,11 +1,15 @@
 """Module that provides models."""
 from uuid import uuid4
 
+from django.conf import settings
 from django.contrib.gis.db import models as gis_models
+from django.contrib.gis.geos import Point
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
-from django_minio_backend import MinioBackend, iso_date_prefix
-from garden_app import consts, validators
+from django_minio_backend import iso_date_prefix
+from garden_app import consts, storages, validators
 
 
 class UUIDMixin(models.Model):
@@ -17,6 +21,101 @@ class UUIDMixin(models.Model):
         abstract = True
 
 
+class PointZField(gis_models.PointField):
+    """3D point field that stores 2D points with zero altitude."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize a three-dimensional point field."""
+        kwargs['dim'] = 3
+        super().__init__(*args, **kwargs)
+
+    def get_prep_value(self, value):
+        """Add zero altitude to 2D points, e.g. from map widgets.
+
+        Args:
+            value (Point | None): Point to store.
+
+        Returns:
+            Point | None: Three-dimensional point.
+        """
+        value = super().get_prep_value(value)
+        if isinstance(value, Point) and not value.hasz:
+            value = Point(value.x, value.y, 0, srid=value.srid)
+        return value
+
+
+class CoordinateField(models.DecimalField):
+    """Decimal coordinate column that is left empty in the point storage mode."""
+
+    def pre_save(self, model_instance, add):
+        """Return the value to store, None when the point holds the coordinates.
+
+        Args:
+            model_instance (Coord): Saved instance.
+            add (bool): Whether the instance is inserted.
+
+        Returns:
+            Decimal | None: Stored value.
+        """
+        if settings.COORD_STORAGE == consts.COORD_STORAGE_POINT:
+            return None
+        return super().pre_save(model_instance, add)
+
+
+class CoordPointField(PointZField):
+    """Geography point built from the coordinates of the saved instance."""
+
+    def pre_save(self, model_instance, add):
+        """Rebuild the point from longitude, latitude and altitude.
+
+        Args:
+            model_instance (Coord): Saved instance.
+            add (bool): Whether the instance is inserted.
+
+        Returns:
+            Point | None: Stored point.
+        """
+        longitude, latitude = model_instance.longitude, model_instance.latitude
+        if longitude is not None and latitude is not None:
+            setattr(model_instance, self.attname, Point(
+                float(longitude),
+                float(latitude),
+                float(model_instance.altitude or 0),
+                srid=consts.WGS84,
+            ))
+        return super().pre_save(model_instance, add)
+
+
+def trigram_index(table: str, field: str) -> GinIndex:
+    """Create a trigram index serving case-insensitive prefix search on a field.
+
+    Args:
+        table (str): Table name used as the index name prefix.
+        field (str): Indexed field.
+
+    Returns:
+        GinIndex: Index over the upper-cased field, as compared by ``istartswith``.
+    """
+    return GinIndex(OpClass(Upper(field), name='gin_trgm_ops'), name=f'{table}_{field}_trgm_idx')
+
+
+class AdminBoundary(UUIDMixin, models.Model):
+    """Model that represents an administrative boundary polygon."""
+
+    name = models.TextField(_('Name'), blank=False, null=False)
+    level = models.SmallIntegerField(_('Administrative level'))
+    geom = gis_models.MultiPolygonField(_('Boundary'), srid=consts.WGS84)
+
+    class Meta:
+        db_table = '"garden"."admin_boundary"'
+        indexes = [
+            models.Index(fields=['level'], name='admin_boundary_level_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.name} {self.level}'
+
+
 class CollectPlace(UUIDMixin, models.Model):
     """Model that represents place where flora was collected."""
 
@@ -37,6 +136,15 @@ class CollectPlace(UUIDMixin, models.Model):
 
     class Meta:
         db_table = '"garden"."collect_place"'
+        indexes = [
+            models.Index(fields=['country', 'region'], name='collect_place_country_idx'),
+            models.Index(
+                fields=['country', 'region', 'city', 'id'], name='collect_place_autocomplete_idx',
+            ),
+            trigram_index('collect_place', 'country'),
+            trigram_index('collect_place', 'region'),
+            trigram_index('collect_place', 'city'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.id} {self.country} {self.region}'
@@ -72,15 +180,24 @@ class Comment(UUIDMixin, models.Model):
 
     class Meta:
         db_table = '"garden"."comment"'
+        indexes = [
+            models.Index(fields=['description', 'id'], name='comment_autocomplete_idx'),
+            trigram_index('comment', 'description'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.id}'
 
 
 class Coord(UUIDMixin, models.Model):
-    """Model that represents coordinates."""
+    """Model that represents coordinates.
 
-    altitude = models.DecimalField(
+    The geography point is always built from the coordinates on save. With
+    the ``point`` storage mode the numeric columns are left empty and the
+    coordinates are read back from the point.
+    """
+
+    altitude = CoordinateField(
         _('Altitude'),
         blank=True,
         null=True,
@@ -89,29 +206,30 @@ class Coord(UUIDMixin, models.Model):
         default=0,
         validators=[validators.check_positive_height],
     )
-    longitude = models.DecimalField(
+    longitude = CoordinateField(
         _('Longitude'),
         blank=False,
-        null=False,
+        null=True,
         decimal_places=consts.CORDS_MAX_DECIMAL,
         max_digits=consts.CORDS_MAX_DIGITS,
         default=0,
         validators=[validators.check_coords],
     )
-    latitude = models.DecimalField(
+    latitude = CoordinateField(
         _('Latitude'),
         blank=False,
-        null=False,
+        null=True,
         decimal_places=consts.CORDS_MAX_DECIMAL,
         max_digits=consts.CORDS_MAX_DIGITS,
         default=0,
         validators=[validators.check_coords],
     )
-    geog_point = gis_models.PointField(
-        _('Latitude and Longitude'),
+    geog_point = CoordPointField(
+        _('Latitude, longitude and altitude'),
         geography=True,
         blank=True,
         null=True,
+        editable=False,
     )
 
     class Meta:
@@ -120,6 +238,64 @@ class Coord(UUIDMixin, models.Model):
     def __str__(self) -> str:
         return f'{self.id} {self.latitude} {self.longitude}'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Load a record, reading empty or deferred coordinates from the point.
+
+        Args:
+            db (str): Database alias.
+            field_names (list[str]): Loaded field names.
+            values (list): Loaded values.
+
+        Returns:
+            Coord: Loaded instance.
+        """
+        coord = super().from_db(db, field_names, values)
+        point = coord.__dict__.get('geog_point')
+        if point is not None and coord.__dict__.get('latitude') is None:
+            coord.longitude, coord.latitude, coord.altitude = point.x, point.y, point.z or 0
+        return coord
+
+    def save(self, *args, **kwargs):
+        """Save the record, rebuilding the point when coordinates are updated."""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(consts.COORD_COLUMNS) & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'geog_point'}
+        super().save(*args, **kwargs)
+
+
+class DuplicateCandidate(UUIDMixin, models.Model):
+    """Model that represents a pair of possibly duplicate floras."""
+
+    flora = models.ForeignKey('Flora', models.CASCADE, related_name='duplicate_candidates')
+    duplicate = models.ForeignKey('Flora', models.CASCADE, related_name='duplicate_of')
+    score = models.FloatField(_('Score'))
+    distance = models.FloatField(_('Distance'))
+    days = models.IntegerField(_('Days between collection dates'), blank=True, null=True)
+    status = models.TextField(
+        _('Status'),
+        blank=False,
+        null=False,
+        default=consts.DUPLICATE_PENDING,
+        choices=(
+            (consts.DUPLICATE_PENDING, _('pending')),
+            (consts.DUPLICATE_DISMISSED, _('dismissed')),
+        ),
+    )
+    created = models.DateTimeField(_('Create date'), default=validators.get_datetime)
+
+    class Meta:
+        db_table = '"garden"."duplicate_candidate"'
+        ordering = ['-score']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['flora', 'duplicate'], name='duplicate_candidate_pair_unique',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.flora_id} {self.duplicate_id} {self.score:.2f}'
+
 
 class Flora(UUIDMixin, models.Model):
     """Model that represents flora."""
@@ -170,22 +346,68 @@ class Flora(UUIDMixin, models.Model):
     picture = models.ImageField(
         _('Image'),
         blank=True,
-        storage=MinioBackend(bucket_name=consts.BUCKET_NAME),
+        storage=storages.ContentAddressedMinioBackend(bucket_name=consts.BUCKET_NAME),
         upload_to=iso_date_prefix,
     )
 
-    taxon = models.OneToOneField('Taxon', models.CASCADE, blank=True, null=True)
+    taxon = models.ForeignKey('Taxon', models.PROTECT, blank=True, null=True)
     collect_place = models.OneToOneField('CollectPlace', models.CASCADE, blank=True, null=True)
     herbarium = models.OneToOneField('Herbarium', models.CASCADE, blank=True, null=True)
     comment = models.OneToOneField('Comment', models.CASCADE, blank=True, null=True)
+    # Set by the duplicate detection only, unlike the create date clients can write.
+    duplicates_checked = models.BooleanField(
+        _('Checked for duplicates'), db_default=False, editable=False,
+    )
 
     class Meta:
         db_table = '"garden"."flora"'
         ordering = ['taxonomycol', 'author']
+        indexes = [
+            models.Index(fields=['taxonomycol', 'author'], name='flora_taxonomycol_author_idx'),
+            models.Index(fields=['created'], name='flora_created_idx'),
+            models.Index(
+                fields=['taxonomycol', 'author'],
+                condition=models.Q(alive=True),
+                name='flora_alive_order_idx',
+            ),
+            models.Index(
+                fields=['autochthony', 'taxonomycol'],
+                condition=models.Q(autochthony__isnull=False),
+                name='flora_autochthony_idx',
+            ),
+            models.Index(
+                fields=['picture'], condition=~models.Q(picture=''), name='flora_picture_idx',
+            ),
+            models.Index(
+                fields=['id'],
+                condition=models.Q(duplicates_checked=False),
+                name='flora_duplicates_pending_idx',
+            ),
+            trigram_index('flora', 'taxonomycol'),
+            trigram_index('flora', 'author'),
+            trigram_index('flora', 'rus_name'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.id} {self.author} {self.taxonomycol}'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Load a record, remembering its stored picture for reference counting.
+
+        Args:
+            db (str): Database alias.
+            field_names (list[str]): Loaded field names.
+            values (list): Loaded values.
+
+        Returns:
+            Flora: Loaded instance.
+        """
+        flora = super().from_db(db, field_names, values)
+        if 'picture' in flora.__dict__:
+            flora._stored_picture = flora.__dict__['picture']
+        return flora
+
 
 class Herbarium(UUIDMixin, models.Model):
     """Model that represents herbarium."""
@@ -195,11 +417,62 @@ class Herbarium(UUIDMixin, models.Model):
 
     class Meta:
         db_table = '"garden"."herbarium"'
+        indexes = [
+            models.Index(fields=['depart', 'region', 'id'], name='herbarium_autocomplete_idx'),
+            trigram_index('herbarium', 'depart'),
+            trigram_index('herbarium', 'region'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.depart} {self.region}'
 
 
+class Job(UUIDMixin, models.Model):
+    """Model that represents background job."""
+
+    kind = models.TextField(_('Kind'), blank=False, null=False)
+    payload = models.JSONField(_('Payload'), blank=True, default=dict)
+    status = models.TextField(
+        _('Status'),
+        blank=False,
+        null=False,
+        default=consts.JOB_QUEUED,
+        choices=(
+            (consts.JOB_QUEUED, _('queued')),
+            (consts.JOB_RUNNING, _('running')),
+            (consts.JOB_DONE, _('done')),
+            (consts.JOB_FAILED, _('failed')),
+        ),
+    )
+    priority = models.SmallIntegerField(_('Priority'), default=0)
+    attempts = models.PositiveSmallIntegerField(_('Attempts'), default=0)
+    max_attempts = models.PositiveSmallIntegerField(
+        _('Max attempts'), default=consts.JOB_MAX_ATTEMPTS,
+    )
+    progress = models.FloatField(_('Progress'), default=0)
+    result = models.JSONField(_('Result'), blank=True, null=True)
+    error = models.TextField(_('Error'), blank=True, null=True)
+    worker = models.TextField(_('Worker'), blank=True, null=True)
+    run_after = models.DateTimeField(_('Run after'), default=validators.get_datetime)
+    created = models.DateTimeField(_('Create date'), default=validators.get_datetime)
+    started = models.DateTimeField(_('Start date'), blank=True, null=True)
+    finished = models.DateTimeField(_('Finish date'), blank=True, null=True)
+    heartbeat = models.DateTimeField(_('Heartbeat'), blank=True, null=True)
+
+    class Meta:
+        db_table = '"garden"."job"'
+        indexes = [
+            models.Index(
+                fields=['-priority', 'run_after'],
+                condition=models.Q(status=consts.JOB_QUEUED),
+                name='job_queued_idx',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.kind} {self.status}'
+
+
 class Label(UUIDMixin, models.Model):
     """Model that represents label for flora."""
 
@@ -246,11 +519,36 @@ class Label(UUIDMixin, models.Model):
 
     class Meta:
         db_table = '"garden"."label"'
+        indexes = [
+            models.Index(fields=['collected'], name='label_collected_idx'),
+            trigram_index('label', 'name'),
+            trigram_index('label', 'institute'),
+            trigram_index('label', 'project'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.id} {self.institute} {self.project}'
 
 
+class PictureBlob(UUIDMixin, models.Model):
+    """Model that represents a stored picture identified by its content hash."""
+
+    sha256 = models.CharField(_('SHA-256'), max_length=64, unique=True)
+    name = models.TextField(_('Object name'), unique=True)
+    size = models.BigIntegerField(_('Size'))
+    refcount = models.IntegerField(_('References'), default=0)
+    created = models.DateTimeField(_('Create date'), default=validators.get_datetime)
+    # Last time the storage handed the object out, reclaim spares it for the
+    # grace period so a flora being saved can still reference it.
+    used = models.DateTimeField(_('Last used'), default=validators.get_datetime)
+
+    class Meta:
+        db_table = '"garden"."picture_blob"'
+
+    def __str__(self) -> str:
+        return f'{self.sha256} {self.refcount}'
+
+
 class Taxon(UUIDMixin, models.Model):
     """Model that represents taxon."""
 
@@ -301,6 +599,18 @@ class Taxon(UUIDMixin, models.Model):
 
     class Meta:
         db_table = '"garden"."taxon"'
+        indexes = [
+            models.Index(fields=['genus', 'species', 'id'], name='taxon_autocomplete_idx'),
+            trigram_index('taxon', 'genus'),
+            trigram_index('taxon', 'species'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=consts.TAXON_CLASSIFICATION,
+                name='taxon_classification_unique',
+                nulls_distinct=False,
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.id} {self.genus} {self.species}'
@@ -0,0 +1,170 @@
+"""Module that provides garbage collection of stored pictures.
+
+Objects are reclaimed when no flora references them or when they duplicate
+the content of an indexed object. Bucket I/O runs in a thread pool, database
+writes stay in the calling thread, whose transaction holds the content locks
+of the objects being removed so the storage can not hand them out meanwhile.
+"""
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import PurePosixPath
+
+from django.db import connection, transaction
+from django.db.models import Count, F
+from garden_app import consts, models, storages, validators
+
+
+def _storage():
+    return models.Flora._meta.get_field('picture').storage
+
+
+def recount() -> None:
+    """Recompute reference counts of every indexed picture from flora rows."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {models.PictureBlob._meta.db_table} AS blob SET refcount = '  # noqa: S608
+            f'(SELECT COUNT(*) FROM {models.Flora._meta.db_table} AS flora '
+            'WHERE flora.picture = blob.name)',
+        )
+
+
+def _hash_object(name: str) -> tuple[str, str]:
+    storage = _storage()
+    response = storage.client.get_object(storage.bucket, name)
+    digest = hashlib.sha256()
+    try:
+        for chunk in response.stream(consts.PICTURE_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    finally:
+        response.close()
+        response.release_conn()
+    return name, digest.hexdigest()
+
+
+def _remove_object(name: str) -> str:
+    storage = _storage()
+    storage.client.remove_object(storage.bucket, name)
+    return name
+
+
+def _index_legacy(hashes, sizes, references, stats, doomed) -> None:
+    """Index referenced objects stored before content addressing, merging duplicates."""
+    known = dict(models.PictureBlob.objects.values_list('sha256', 'name'))
+    for name, digest in hashes:
+        canonical = known.get(digest)
+        with transaction.atomic():
+            if canonical is None:
+                known[digest] = name
+                models.PictureBlob.objects.create(
+                    sha256=digest, name=name, size=sizes[name], refcount=references[name],
+                )
+                stats['indexed'] += 1
+                continue
+            models.Flora.objects.filter(picture=name).update(picture=canonical)
+            models.PictureBlob.objects.filter(name=canonical).update(
+                refcount=F('refcount') + references[name],
+            )
+        doomed.append(name)
+        stats['duplicates'] += 1
+
+
+def _name_digest(name: str) -> str | None:
+    if name.startswith(f'{consts.PICTURE_HASH_PREFIX}/'):
+        return PurePosixPath(name).stem
+    return None
+
+
+def _lock_reclaimable(names: list[str], deadline: datetime) -> list[str]:
+    """Lock the contents of objects and unindex the ones that are still unused.
+
+    Must run in a transaction that lasts until the objects are removed.
+
+    Args:
+        names (list[str]): Object names to reclaim.
+        deadline (datetime): Indexed objects used after it are kept.
+
+    Returns:
+        list[str]: Names that are safe to remove from the bucket.
+    """
+    blobs = dict(models.PictureBlob.objects.filter(name__in=names).values_list('name', 'sha256'))
+    digests = {blobs.get(name) or _name_digest(name) for name in names} - {None}
+    for digest in sorted(digests):
+        storages.lock_content(digest)
+    referenced = set(
+        models.Flora.objects.filter(picture__in=names).values_list('picture', flat=True),
+    )
+    unused = models.PictureBlob.objects.filter(
+        name__in=set(names) - referenced, refcount=0, used__lt=deadline,
+    )
+    unindexed = set(unused.values_list('name', flat=True))
+    unused.delete()
+    indexed = set(models.PictureBlob.objects.filter(name__in=names).values_list('name', flat=True))
+    unindexed |= set(names) - indexed
+    return [name for name in names if name in unindexed and name not in referenced]
+
+
+def reclaim(
+    workers: int = consts.PICTURE_RECLAIM_WORKERS,
+    grace: int = consts.PICTURE_RECLAIM_GRACE,
+    dry_run: bool = False,
+    batch_size: int = consts.PICTURE_RECLAIM_BATCH_SIZE,
+) -> Counter:
+    """Delete orphaned and duplicate objects from the picture bucket.
+
+    Reference counts are recomputed first. Objects younger than the grace
+    period and indexed objects the storage handed out within it are skipped,
+    they may belong to an upload whose flora is not saved yet. Referenced
+    objects missing from the index are hashed; the ones matching an indexed
+    hash are merged into it, the rest are indexed. Candidates are checked
+    again under their content locks before they are removed.
+
+    Args:
+        workers (int): Threads for bucket I/O.
+        grace (int): Minimum object age in seconds.
+        dry_run (bool): Only count what would be reclaimed.
+        batch_size (int): Objects removed per transaction.
+
+    Returns:
+        Counter: Scanned, orphaned, duplicate, indexed objects and reclaimed bytes.
+    """
+    recount()
+    storage = _storage()
+    deadline = validators.get_datetime() - timedelta(seconds=grace)
+    references = Counter(dict(
+        models.Flora.objects.exclude(picture='').values('picture').annotate(
+            count=Count('pk'),
+        ).values_list('picture', 'count'),
+    ))
+    indexed = set(models.PictureBlob.objects.values_list('name', flat=True))
+    stats = Counter()
+    sizes = {}
+    orphans = []
+    legacy = []
+    for bucket_object in storage.client.list_objects(storage.bucket, recursive=True):
+        stats['scanned'] += 1
+        name = bucket_object.object_name
+        sizes[name] = bucket_object.size
+        if bucket_object.last_modified > deadline:
+            continue
+        if not references[name]:
+            orphans.append(name)
+        elif name not in indexed:
+            legacy.append(name)
+    stats['orphans'] = len(orphans)
+    if dry_run:
+        stats['bytes'] = sum(sizes[name] for name in orphans)
+        stats['legacy'] = len(legacy)
+        return stats
+
+    doomed = list(orphans)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        _index_legacy(pool.map(_hash_object, legacy), sizes, references, stats, doomed)
+        for start in range(0, len(doomed), batch_size):
+            with transaction.atomic():
+                removable = _lock_reclaimable(doomed[start:start + batch_size], deadline)
+                for name in pool.map(_remove_object, removable):
+                    stats['removed'] += 1
+                    stats['bytes'] += sizes[name]
+    return stats
@@ -0,0 +1,56 @@
+"""Module that provides fast JSON and MessagePack API renderers."""
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Falls back to DRF's conversions for types the encoders do not know natively,
+# e.g. Decimal, lazy translations and geometries.
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render JSON with orjson, several times faster than the standard library."""
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Encode data to JSON.
+
+        Args:
+            data (Any): Response data.
+            accepted_media_type (str | None): Negotiated media type.
+            renderer_context (dict | None): View, request and response.
+
+        Returns:
+            bytes: Encoded data.
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_encoder.default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Render MessagePack, a compact binary alternative to JSON."""
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Encode data to MessagePack.
+
+        Args:
+            data (Any): Response data.
+            accepted_media_type (str | None): Negotiated media type.
+            renderer_context (dict | None): View, request and response.
+
+        Returns:
+            bytes: Encoded data.
+        """
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encoder.default)
@@ -1,6 +1,18 @@
 """Module that provides serializers."""
-from garden_app import models
-from rest_framework.serializers import HyperlinkedModelSerializer
+from garden_app import aggregations, consts, models
+from rest_framework.serializers import (
+    BooleanField,
+    CharField,
+    ChoiceField,
+    DecimalField,
+    FloatField,
+    HyperlinkedModelSerializer,
+    IntegerField,
+    ListField,
+    Serializer,
+    UUIDField,
+    ValidationError,
+)
 
 ALL = '__all__'
 
@@ -21,12 +33,39 @@ class CommentSerializer(HyperlinkedModelSerializer):
         fields = ALL
 
 
+class CoordinateField(DecimalField):
+    """Decimal field that formats coordinates read from the point directly.
+
+    Floats are formatted to the fixed decimal places instead of being
+    quantized as a Decimal per value, with the same output.
+    """
+
+    def to_representation(self, value):
+        """Format a coordinate.
+
+        Args:
+            value (Decimal | float): Coordinate.
+
+        Returns:
+            str | float | Decimal: Coordinate with fixed decimal places.
+        """
+        if isinstance(value, float) and self.coerce_to_string:
+            return f'{value:.{self.decimal_places}f}'
+        return super().to_representation(value)
+
+
 class CoordSerializer(HyperlinkedModelSerializer):
     """Serializer for the Coord model."""
 
+    serializer_field_mapping = {
+        **HyperlinkedModelSerializer.serializer_field_mapping,
+        models.CoordinateField: CoordinateField,
+    }
+
     class Meta:
         model = models.Coord
         fields = ALL
+        bulk_read_only_fields = consts.COORD_COLUMNS
 
 
 class FloraSerializer(HyperlinkedModelSerializer):
@@ -35,6 +74,8 @@ class FloraSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = models.Flora
         fields = ALL
+        # Pictures are reference counted by model signals a queryset update skips.
+        bulk_read_only_fields = ('picture',)
 
 
 class HerbariumSerializer(HyperlinkedModelSerializer):
@@ -54,8 +95,76 @@ class LabelSerializer(HyperlinkedModelSerializer):
 
 
 class TaxonSerializer(HyperlinkedModelSerializer):
-    """Serializer for the Taxon model."""
+    """Serializer for the Taxon model.
+
+    Taxa form a shared dictionary: creating an already known classification
+    returns the existing taxon instead of a copy and sets ``created`` to False.
+    """
+
+    specimens = IntegerField(read_only=True)
 
     class Meta:
         model = models.Taxon
         fields = ALL
+        validators = []
+
+    def create(self, validated_data):
+        """Return the taxon with the given classification, creating it if needed."""
+        classification = {name: validated_data.get(name) for name in consts.TAXON_CLASSIFICATION}
+        taxon, self.created = models.Taxon.objects.get_or_create(**classification)
+        return taxon
+
+    def update(self, instance, validated_data):
+        """Update the taxon unless its new classification is already taken."""
+        classification = {
+            name: validated_data.get(name, getattr(instance, name))
+            for name in consts.TAXON_CLASSIFICATION
+        }
+        if models.Taxon.objects.filter(**classification).exclude(pk=instance.pk).exists():
+            raise ValidationError('Taxon with this classification already exists.')
+        return super().update(instance, validated_data)
+
+
+class AggregationFilterSerializer(Serializer):
+    """Serializer for the specimen filters of aggregation queries."""
+
+    alive = BooleanField(required=False, allow_null=True, default=None)
+    autochthony = ChoiceField(
+        choices=models.Flora._meta.get_field('autochthony').choices,
+        required=False,
+        allow_null=True,
+        default=None,
+    )
+
+
+class GridAggregationSerializer(AggregationFilterSerializer):
+    """Serializer for the grid aggregation query."""
+
+    resolution = FloatField(
+        min_value=consts.MIN_GRID_RESOLUTION,
+        max_value=consts.MAX_GRID_RESOLUTION,
+        default=1,
+    )
+    shape = ChoiceField(choices=(consts.GRID_SQUARE, consts.GRID_HEX), default=consts.GRID_SQUARE)
+
+
+class GroupAggregationSerializer(AggregationFilterSerializer):
+    """Serializer for the grouping aggregation query."""
+
+    by = ChoiceField(choices=tuple(aggregations.GROUPINGS))
+
+
+class BatchRequestSerializer(Serializer):
+    """Serializer for one resource request of a batch fetch.
+
+    The registered resources are passed in the ``resources`` context entry.
+    """
+
+    resource = CharField()
+    ids = ListField(child=UUIDField(), allow_empty=False, max_length=consts.BATCH_MAX_IDS)
+
+    def validate_resource(self, value):
+        """Check that the resource is registered in the API router."""
+        if value not in self.context['resources']:
+            raise ValidationError(f'Unknown resource: {value}.')
+        return value
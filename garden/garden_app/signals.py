@@ -0,0 +1,62 @@
+"""Module that provides signal receivers."""
+from collections import Counter
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+from garden_app import caching, models
+
+APP_LABEL = 'garden_app'
+
+# Sent after set-based writes that bypass model signals, with the affected
+# ``pks`` or None when they are not known. Deletes also pass the stored
+# ``files`` of the deleted rows.
+bulk_changed = Signal()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_cached_pages(sender, **kwargs) -> None:
+    """Invalidate cached catalog pages of the changed model."""
+    if sender._meta.app_label == APP_LABEL:
+        caching.invalidate_model(sender)
+
+
+@receiver(bulk_changed)
+def invalidate_bulk_changed(sender, **kwargs) -> None:
+    """Invalidate cached catalog pages after a set-based write."""
+    caching.invalidate_model(sender)
+
+
+def _count_picture(name: str, delta: int) -> None:
+    if name:
+        models.PictureBlob.objects.filter(name=name).update(refcount=F('refcount') + delta)
+
+
+@receiver(post_save, sender=models.Flora)
+def count_picture_references(sender, instance, created, update_fields=None, **kwargs) -> None:
+    """Move a picture reference when a flora gets another picture.
+
+    The previous picture is the one the instance was loaded or last saved
+    with, so saving takes no extra query.
+    """
+    if update_fields is not None and 'picture' not in update_fields:
+        return
+    stored = '' if created else getattr(instance, '_stored_picture', '')
+    if stored != instance.picture.name:
+        _count_picture(stored, -1)
+        _count_picture(instance.picture.name, 1)
+    instance._stored_picture = instance.picture.name
+
+
+@receiver(post_delete, sender=models.Flora)
+def release_picture(sender, instance, **kwargs) -> None:
+    """Drop the picture reference of a deleted flora."""
+    _count_picture(instance.picture.name, -1)
+
+
+@receiver(bulk_changed, sender=models.Flora)
+def release_bulk_pictures(sender, files=(), **kwargs) -> None:
+    """Drop the picture references of floras removed by a set-based delete."""
+    for name, count in Counter(files).items():
+        _count_picture(name, -count)
@@ -0,0 +1,56 @@
+// Loads options of selects marked with data-autocomplete-url page by page.
+document.addEventListener('DOMContentLoaded', function () {
+  document.querySelectorAll('select[data-autocomplete-url]').forEach(function (select) {
+    var search = document.createElement('input');
+    var more = document.createElement('button');
+    var page = 1;
+    var timer = null;
+
+    search.type = 'search';
+    search.placeholder = 'Search...';
+    more.type = 'button';
+    more.textContent = 'More';
+    more.hidden = true;
+    select.parentNode.insertBefore(search, select);
+    select.parentNode.insertBefore(more, select.nextSibling);
+
+    function load(append) {
+      var url = select.dataset.autocompleteUrl +
+        '?q=' + encodeURIComponent(search.value) + '&page=' + page;
+      fetch(url, {credentials: 'same-origin'})
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          if (!append) {
+            Array.from(select.options).forEach(function (option) {
+              if (option.value && !option.selected) {
+                option.remove();
+              }
+            });
+          }
+          data.results.forEach(function (result) {
+            if (!select.querySelector('option[value="' + result.id + '"]')) {
+              select.add(new Option(result.text, result.id));
+            }
+          });
+          more.hidden = !data.more;
+        });
+    }
+
+    search.addEventListener('input', function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () {
+        page = 1;
+        load(false);
+      }, 250);
+    });
+    more.addEventListener('click', function () {
+      page += 1;
+      load(true);
+    });
+    select.addEventListener('focus', function () {
+      if (select.options.length <= 2) {
+        load(false);
+      }
+    }, {once: true});
+  });
+});
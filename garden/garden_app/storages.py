@@ -0,0 +1,92 @@
+"""Module that provides content-addressed file storages."""
+import hashlib
+from pathlib import PurePosixPath
+
+from django.apps import apps
+from django.db import connection, transaction
+from django_minio_backend import MinioBackend
+from garden_app import consts, validators
+
+
+class ContentAddressedMinioBackend(MinioBackend):
+    """MinIO storage that stores each distinct picture once.
+
+    Objects are named after the SHA-256 of their content and indexed in
+    PictureBlob. Saving content that is already indexed and still stored
+    uploads nothing and returns the existing object name. Saving holds the
+    content lock that picture reclaim takes before removing an object.
+    """
+
+    def get_available_name(self, name, max_length=None) -> str:
+        """Return the name unchanged, the object name is derived from the content.
+
+        Args:
+            name (str): Requested name.
+            max_length (int | None): Maximum name length.
+
+        Returns:
+            str: Requested name.
+        """
+        return name
+
+    def _save(self, name, content) -> str:
+        """Upload content unless an object with the same hash is stored.
+
+        Args:
+            name (str): Requested name, only its extension is kept.
+            content (File): Uploaded file.
+
+        Returns:
+            str: Name of the stored object.
+        """
+        picture_blob = apps.get_model('garden_app', 'PictureBlob')
+        digest = getattr(content, 'sha256', None) or content_hash(content)
+        with transaction.atomic():
+            lock_content(digest)
+            blob = picture_blob.objects.filter(sha256=digest).first()
+            if blob is not None and self.exists(blob.name):
+                picture_blob.objects.filter(pk=blob.pk).update(used=validators.get_datetime())
+                return blob.name
+            if blob is None:
+                suffix = PurePosixPath(name).suffix.lower()
+                object_name = f'{consts.PICTURE_HASH_PREFIX}/{digest[:2]}/{digest}{suffix}'
+            else:
+                object_name = blob.name
+            content.seek(0)
+            object_name = super()._save(object_name, content)
+            picture_blob.objects.update_or_create(
+                sha256=digest,
+                defaults={
+                    'name': object_name,
+                    'size': content.size,
+                    'used': validators.get_datetime(),
+                },
+            )
+        return object_name
+
+
+def lock_content(digest: str) -> None:
+    """Lock a picture content until the current transaction ends.
+
+    Args:
+        digest (str): SHA-256 hex digest of the content.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))', [digest])
+
+
+def content_hash(content) -> str:
+    """Return the SHA-256 hex digest of a file, reading it in chunks.
+
+    Args:
+        content (File): File to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha256()
+    content.seek(0)
+    for chunk in content.chunks(consts.PICTURE_HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
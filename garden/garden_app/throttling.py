@@ -0,0 +1,184 @@
+"""Module that provides token bucket throttles for the REST API.
+
+Buckets live in Redis, shared by every worker process, and are refilled and
+taken from by a Lua script, so concurrent requests can not spend the same
+token. Each bucket holds up to ``N`` tokens of an ``N/period`` rate and
+refills continuously, so clients may burst up to the budget and then
+proceed at the sustained rate.
+"""
+import functools
+import logging
+
+import redis
+from django.conf import settings
+from garden_app import consts
+from rest_framework import permissions, throttling
+from rest_framework.settings import api_settings
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+logger = logging.getLogger(__name__)
+
+# Takes a token from the bucket at KEYS[1] with capacity ARGV[1] refilled
+# every ARGV[2] seconds, using the Redis clock. Returns whether a token was
+# taken and the tokens left.
+TAKE_TOKEN = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * capacity / period)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], period)
+return {allowed, tostring(tokens)}
+"""
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Parse a rate like ``100/min`` into capacity and period in seconds.
+
+    Args:
+        rate (str): Rate in the DRF throttle rate format.
+
+    Returns:
+        tuple[int, int]: Bucket capacity and refill period.
+    """
+    requests, period = rate.split('/')
+    return int(requests), PERIODS[period[0]]
+
+
+def action_scope(request, view) -> str:
+    """Return the budget the request is charged to.
+
+    Args:
+        request (Request): Incoming request.
+        view (APIView): View handling the request.
+
+    Returns:
+        str: ``list``, ``retrieve`` or ``write``.
+    """
+    action = getattr(view, 'action', None)
+    if action == consts.THROTTLE_LIST:
+        return consts.THROTTLE_LIST
+    if action == consts.THROTTLE_RETRIEVE or request.method in permissions.SAFE_METHODS:
+        return consts.THROTTLE_RETRIEVE
+    return consts.THROTTLE_WRITE
+
+
+@functools.cache
+def _take_token():
+    return redis.Redis.from_url(settings.REDIS_URL).register_script(TAKE_TOKEN)
+
+
+class TokenBucketThrottle(throttling.BaseThrottle):
+    """Base throttle charging one token per request from a per-client bucket.
+
+    Rates are read from ``DEFAULT_THROTTLE_RATES`` under ``<prefix>_<scope>``.
+    """
+
+    prefix = ''
+
+    def __init__(self):
+        self.wait_time = None
+
+    def get_bucket_ident(self, request) -> str | None:
+        """Return the client identity or None to skip throttling.
+
+        Args:
+            request (Request): Incoming request.
+
+        Raises:
+            NotImplementedError: Subclasses must implement it.
+        """
+        raise NotImplementedError
+
+    def allow_request(self, request, view) -> bool:
+        """Take a token from the client bucket of the request's scope.
+
+        Args:
+            request (Request): Incoming request.
+            view (APIView): View handling the request.
+
+        Requests are let through while Redis is unreachable.
+
+        Returns:
+            bool: True if the bucket had a token.
+        """
+        ident = self.get_bucket_ident(request)
+        scope = f'{self.prefix}_{action_scope(request, view)}'
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+        if ident is None or rate is None:
+            return True
+        capacity, period = parse_rate(rate)
+        key = f'{consts.CACHE_PREFIX}:throttle:{scope}:{ident}'
+        try:
+            allowed, tokens = _take_token()(keys=[key], args=[capacity, period])
+        except redis.RedisError as error:
+            logger.warning('Throttling skipped, Redis is unavailable: %s', error)
+            self.wait_time = None
+            return True
+        if allowed:
+            self.wait_time = None
+        else:
+            self.wait_time = (1 - float(tokens)) * period / capacity
+        return bool(allowed)
+
+    def wait(self) -> float | None:
+        """Return seconds until the bucket has a token again.
+
+        Returns:
+            float | None: Seconds to wait.
+        """
+        return self.wait_time
+
+
+class TokenRateThrottle(TokenBucketThrottle):
+    """Throttle requests per API token."""
+
+    prefix = 'token'
+
+    def get_bucket_ident(self, request) -> str | None:
+        """Return the token key or user id of an authenticated request.
+
+        Args:
+            request (Request): Incoming request.
+
+        Returns:
+            str | None: Client identity.
+        """
+        key = getattr(request.auth, 'key', None)
+        if key is not None:
+            return key
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return None
+
+
+class IPRateThrottle(TokenBucketThrottle):
+    """Throttle requests per client address."""
+
+    prefix = 'ip'
+
+    def get_bucket_ident(self, request) -> str:
+        """Return the client address.
+
+        X-Forwarded-For is only read when ``NUM_PROXIES`` is configured,
+        otherwise clients could pick a fresh bucket per request.
+
+        Args:
+            request (Request): Incoming request.
+
+        Returns:
+            str: Client identity.
+        """
+        if api_settings.NUM_PROXIES is None:
+            return request.META.get('REMOTE_ADDR')
+        return self.get_ident(request)
@@ -0,0 +1,53 @@
+"""Module that provides upload handlers hashing files while they stream in."""
+import hashlib
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+
+class HashingMixin:
+    """Compute the SHA-256 of an uploaded file chunk by chunk.
+
+    The digest is stored as ``sha256`` on the uploaded file, so storages do
+    not have to read the file again to hash it.
+    """
+
+    def new_file(self, *args, **kwargs) -> None:
+        """Start hashing a new file."""
+        # Set before the parent call, which may stop the other handlers by raising.
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data: bytes, start: int):
+        """Hash a chunk and pass it on.
+
+        Args:
+            raw_data (bytes): Chunk of the file.
+            start (int): Chunk offset.
+
+        Returns:
+            bytes | None: Chunk for the next handler or None if it was consumed.
+        """
+        self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size: int):
+        """Attach the digest to the completed file.
+
+        Args:
+            file_size (int): Size of the file.
+
+        Returns:
+            UploadedFile | None: Uploaded file if this handler produced it.
+        """
+        uploaded = super().file_complete(file_size)
+        if uploaded is not None:
+            uploaded.sha256 = self.sha256.hexdigest()
+        return uploaded
+
+
+class HashingMemoryFileUploadHandler(HashingMixin, MemoryFileUploadHandler):
+    """Keep small uploads in memory and hash them."""
+
+
+class HashingTemporaryFileUploadHandler(HashingMixin, TemporaryFileUploadHandler):
+    """Stream large uploads to a temporary file and hash them."""
@@ -4,13 +4,8 @@ from garden_app import views
 from rest_framework.routers import DefaultRouter
 
 router = DefaultRouter()
-router.register(r'floras', views.FloraViewSet)
-router.register(r'collect_places', views.CollectPlaceViewSet)
-router.register(r'labels', views.LabelViewSet)
-router.register(r'coords', views.CoordsViewSet)
-router.register(r'taxons', views.TaxonViewSet)
-router.register(r'comments', views.CommentViewSet)
-router.register(r'herbariums', views.HerbariumViewSet)
+for prefix, viewset in views.RESOURCES.items():
+    router.register(prefix, viewset)
 
 urlpatterns = [
     path('', views.home_page, name='homepage'),
@@ -33,6 +28,20 @@ urlpatterns = [
     path('herbariums/', views.HerbariumListView.as_view(), name='herbariums'),
     path('herbarium/', views.herbarium_view, name='herbarium'),
 
+    path('autocomplete/taxons/', views.taxon_autocomplete, name='taxons_autocomplete'),
+    path(
+        'autocomplete/collect_places/',
+        views.collect_place_autocomplete,
+        name='collect_places_autocomplete',
+    ),
+    path(
+        'autocomplete/herbariums/', views.herbarium_autocomplete, name='herbariums_autocomplete',
+    ),
+    path('autocomplete/comments/', views.comment_autocomplete, name='comments_autocomplete'),
+
+    path('api/aggregations/grid/', views.grid_aggregation_view, name='grid_aggregation'),
+    path('api/aggregations/groups/', views.group_aggregation_view, name='group_aggregation'),
+    path('api/batch/', views.BatchView.as_view(), name='batch'),
     path('api/', include(router.urls), name='api'),
     path('api-auth/', include('rest_framework.urls'), name='rest_framework'),
 ]
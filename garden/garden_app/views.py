@@ -1,12 +1,25 @@
 """Module that provides views."""
+from collections import defaultdict
+from http import HTTPStatus
 from typing import Any
 
 from django.contrib.auth import decorators, mixins
 from django.core import paginator as django_paginator
+from django.core.exceptions import ValidationError
+from django.db.models import Count, ProtectedError, Q
+from django.http import JsonResponse
 from django.shortcuts import render
 from django.views.generic import ListView, CreateView
-from garden_app import models, serializers, forms
-from rest_framework import authentication, permissions, viewsets
+from garden_app import aggregations, bulk, caching, consts, forms, models, serializers, throttling
+from rest_framework import authentication, exceptions, permissions, viewsets
+from rest_framework.decorators import (
+    action,
+    api_view,
+    authentication_classes,
+    permission_classes,
+)
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 
 class MyPermission(permissions.BasePermission):
@@ -36,6 +49,22 @@ class MyPermission(permissions.BasePermission):
         return False
 
 
+class SuperuserPermission(permissions.BasePermission):
+    """Permission class that allows requests of superusers only, e.g. set-based bulk writes."""
+
+    def has_permission(self, request, _):
+        """Check if the request comes from a superuser.
+
+        Args:
+            request (HttpRequest): The incoming request.
+            _: Placeholder for the view argument, not used in this permission.
+
+        Returns:
+            bool: True if the request has permission, False otherwise.
+        """
+        return bool(request.user and request.user.is_superuser)
+
+
 def home_page(request):
     """Render the home page."""
     return render(
@@ -73,6 +102,22 @@ def create_list_view(model_class, plural_name, template):
         paginate_by = 10
         context_object_name = plural_name
 
+        def get(self, request, *args, **kwargs):
+            """Serve the page from cache until the model changes.
+
+            The key holds the page number parsed the way the paginator parses
+            it, so spellings of one page share an entry. Pages the paginator
+            rejects are not cached as only successful responses are stored.
+            """
+            try:
+                number = int(request.GET.get('page', 1))
+            except ValueError:
+                return super().get(request, *args, **kwargs)
+            key = caching.make_key(model_class, 'list', number)
+            return caching.cached_response(
+                key, lambda: super(CustomListView, self).get(request, *args, **kwargs),
+            )
+
         def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             """Get context data for the view."""
             context = super().get_context_data(**kwargs)
@@ -81,6 +126,8 @@ def create_list_view(model_class, plural_name, template):
             page = self.request.GET.get('page')
             page_obj = paginator.get_page(page)
             context[f'{plural_name}_list'] = page_obj
+            context['cache_version'] = caching.get_model_version(model_class)
+            context['fragment_timeout'] = consts.FRAGMENT_CACHE_TIMEOUT
             return context
 
     return CustomListView
@@ -99,37 +146,149 @@ def create_view(model_class, context_name, template):
         function: The view function.
     """
 
-    @decorators.login_required
-    def view(request):
-        id_ = request.GET.get('id', None)
+    def render_view(request, id_):
         target = model_class.objects.get(id=id_) if id_ else None
-        context = {context_name: target}
+        context = {
+            context_name: target,
+            'cache_version': caching.get_model_version(model_class),
+            'fragment_timeout': consts.FRAGMENT_CACHE_TIMEOUT,
+        }
         return render(
             request,
             template,
             context,
         )
 
+    @decorators.login_required
+    def view(request):
+        id_ = request.GET.get('id', None)
+        key = caching.make_key(model_class, 'detail', id_)
+        return caching.cached_response(key, lambda: render_view(request, id_))
+
     return view
 
 
-def create_viewset(model_class, serializer):
+def create_autocomplete_view(model_class, search_fields):
+    """
+    Create a view function that serves paginated autocomplete suggestions.
+
+    Every word of the ``q`` parameter has to start one of the search fields,
+    so the filter is served by the trigram indexes of the fields and the
+    unfiltered list by an index in the suggestion order.
+
+    Args:
+        model_class (type): The model class to search in.
+        search_fields (tuple): Fields matched against the ``q`` parameter.
+
+    Returns:
+        function: The view function.
+    """
+
+    @decorators.login_required
+    def view(request):
+        term = request.GET.get('q', '').strip()
+        try:
+            page = max(int(request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        queryset = model_class.objects.order_by(*search_fields, 'pk')
+        for word in term.split():
+            condition = Q()
+            for search_field in search_fields:
+                condition |= Q(**{f'{search_field}__istartswith': word})
+            queryset = queryset.filter(condition)
+        offset = (page - 1) * consts.AUTOCOMPLETE_PAGE_SIZE
+        objects = list(queryset[offset:offset + consts.AUTOCOMPLETE_PAGE_SIZE + 1])
+        return JsonResponse({
+            'results': [
+                {'id': str(obj.pk), 'text': str(obj)}
+                for obj in objects[:consts.AUTOCOMPLETE_PAGE_SIZE]
+            ],
+            'more': len(objects) > consts.AUTOCOMPLETE_PAGE_SIZE,
+        })
+
+    return view
+
+
+def create_viewset(model_class, serializer, queryset=None):
     """
     Create a viewset for a given model class and serializer.
 
     Args:
         model_class (type): The model class to create a viewset for.
         serializer (type): The serializer class for the model.
+        queryset (QuerySet): Queryset to serve instead of all model objects.
 
     Returns:
         type: A custom viewset class.
     """
+    viewset_queryset = model_class.objects.all() if queryset is None else queryset
 
     class CustomViewSet(viewsets.ModelViewSet):
         serializer_class = serializer
-        queryset = model_class.objects.all()
+        queryset = viewset_queryset
         permission_classes = [MyPermission]
         authentication_classes = [authentication.TokenAuthentication]
+        throttle_classes = [throttling.TokenRateThrottle, throttling.IPRateThrottle]
+
+        def create(self, request, *args, **kwargs):
+            """Create a record, answering 200 when the serializer returned an existing one."""
+            response = super().create(request, *args, **kwargs)
+            if not self.created:
+                response.status_code = HTTPStatus.OK
+            return response
+
+        def perform_create(self, serializer):
+            """Save the record and remember whether it is new."""
+            super().perform_create(serializer)
+            self.created = getattr(serializer, 'created', True)
+
+        def perform_destroy(self, instance):
+            """Delete the record unless protected records still reference it."""
+            try:
+                super().perform_destroy(instance)
+            except ProtectedError as error:
+                raise exceptions.ValidationError(error.args[0])
+
+        @action(detail=False, methods=['post'], permission_classes=[SuperuserPermission])
+        def bulk_delete(self, request):
+            """Delete records selected by ids or filter with set-based cascades."""
+            dry_run = bool(request.data.get('dry_run', False))
+            try:
+                queryset = bulk.select(
+                    model_class, request.data.get('ids'), request.data.get('filter'),
+                )
+                affected = bulk.delete(queryset, dry_run=dry_run)
+            except ValidationError as error:
+                raise exceptions.ValidationError(error.messages)
+            except ProtectedError as error:
+                raise exceptions.ValidationError(error.args[0])
+            return Response({'dry_run': dry_run, 'affected': affected})
+
+        @action(detail=False, methods=['patch'], permission_classes=[SuperuserPermission])
+        def bulk_update(self, request):
+            """Set the same field values on records selected by ids or filter."""
+            values = request.data.get('values')
+            if not isinstance(values, dict) or not values:
+                raise exceptions.ValidationError({'values': 'Must be a non-empty object.'})
+            serializer = self.get_serializer(data=values, partial=True)
+            serializer.is_valid(raise_exception=True)
+            unsupported = set(values) - set(serializer.validated_data)
+            unsupported |= set(values) & set(
+                getattr(self.serializer_class.Meta, 'bulk_read_only_fields', ()),
+            )
+            if unsupported:
+                raise exceptions.ValidationError(
+                    {'values': f'Unsupported fields: {", ".join(sorted(unsupported))}'},
+                )
+            try:
+                queryset = bulk.select(
+                    model_class, request.data.get('ids'), request.data.get('filter'),
+                )
+                updated = bulk.update(queryset, serializer.validated_data)
+            except ValidationError as error:
+                raise exceptions.ValidationError(error.messages)
+            return Response({'updated': updated})
 
     return CustomViewSet
 
@@ -139,10 +298,24 @@ FloraViewSet = create_viewset(models.Flora, serializers.FloraSerializer)
 CollectPlaceViewSet = create_viewset(models.CollectPlace, serializers.CollectPlaceSerializer)
 LabelViewSet = create_viewset(models.Label, serializers.LabelSerializer)
 CoordsViewSet = create_viewset(models.Coord, serializers.CoordSerializer)
-TaxonViewSet = create_viewset(models.Taxon, serializers.TaxonSerializer)
+TaxonViewSet = create_viewset(
+    models.Taxon,
+    serializers.TaxonSerializer,
+    models.Taxon.objects.annotate(specimens=Count('flora')).order_by('genus', 'species'),
+)
 CommentViewSet = create_viewset(models.Comment, serializers.CommentSerializer)
 HerbariumViewSet = create_viewset(models.Herbarium, serializers.HerbariumSerializer)
 
+RESOURCES = {
+    'floras': FloraViewSet,
+    'collect_places': CollectPlaceViewSet,
+    'labels': LabelViewSet,
+    'coords': CoordsViewSet,
+    'taxons': TaxonViewSet,
+    'comments': CommentViewSet,
+    'herbariums': HerbariumViewSet,
+}
+
 # List Views
 FloraListView = create_list_view(models.Flora, 'floras', 'catalog/floras.html')
 CollectPlaceListView = create_list_view(
@@ -166,6 +339,75 @@ comment_view = create_view(models.Comment, 'comment', 'entities/comment.html')
 herbarium_view = create_view(models.Herbarium, 'herbarium', 'entities/herbarium.html')
 
 
+@api_view(['GET'])
+@authentication_classes([authentication.TokenAuthentication])
+@permission_classes([MyPermission])
+def grid_aggregation_view(request):
+    """Return specimen and distinct taxon counts per grid cell."""
+    query = serializers.GridAggregationSerializer(data=request.query_params)
+    query.is_valid(raise_exception=True)
+    return Response(aggregations.grid(**query.validated_data))
+
+
+@api_view(['GET'])
+@authentication_classes([authentication.TokenAuthentication])
+@permission_classes([MyPermission])
+def group_aggregation_view(request):
+    """Return specimen and distinct taxon counts per region or herbarium."""
+    query = serializers.GroupAggregationSerializer(data=request.query_params)
+    query.is_valid(raise_exception=True)
+    return Response(aggregations.groups(**query.validated_data))
+
+
+class BatchView(APIView):
+    """Fetch records of several API resources in one request.
+
+    The body is a list of ``{"resource": ..., "ids": [...]}`` requests. Ids
+    of the same resource are merged and fetched with a single query, records
+    are rendered with the resource serializer and grouped by resource. Ids
+    that do not exist are left out of the response.
+    """
+
+    authentication_classes = [authentication.TokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [throttling.TokenRateThrottle, throttling.IPRateThrottle]
+    # A batch only reads, so it is charged to the list budget.
+    action = consts.THROTTLE_LIST
+
+    def post(self, request):
+        """Return the requested records grouped by resource."""
+        query = serializers.BatchRequestSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=consts.BATCH_MAX_REQUESTS,
+            context={'resources': RESOURCES},
+        )
+        query.is_valid(raise_exception=True)
+        ids = defaultdict(set)
+        for resource_request in query.validated_data:
+            ids[resource_request['resource']].update(resource_request['ids'])
+        response = {}
+        for resource, resource_ids in ids.items():
+            viewset = RESOURCES[resource]
+            serializer = viewset.serializer_class(
+                viewset.queryset.filter(pk__in=resource_ids),
+                many=True,
+                context={'request': request},
+            )
+            response[resource] = serializer.data
+        return Response(response)
+
+
+# Autocomplete Views
+taxon_autocomplete = create_autocomplete_view(models.Taxon, ('genus', 'species'))
+collect_place_autocomplete = create_autocomplete_view(
+    models.CollectPlace, ('country', 'region', 'city'),
+)
+herbarium_autocomplete = create_autocomplete_view(models.Herbarium, ('depart', 'region'))
+comment_autocomplete = create_autocomplete_view(models.Comment, ('description',))
+
+
 class FloraCreateView(CreateView):
     """View for creating a new Flora object."""
 
@@ -2,6 +2,7 @@
 from types import MethodType
 from typing import Any
 
+from django.core.cache import caches
 from django.db import connections
 from django.db.backends.base.base import BaseDatabaseWrapper
 from django.test.runner import DiscoverRunner
@@ -12,6 +13,7 @@ def prepare_db(self):
     self.connect()
     self.connection.cursor().execute('CREATE SCHEMA IF NOT EXISTS garden;')
     self.connection.cursor().execute('CREATE EXTENSION postgis;')
+    self.connection.cursor().execute('CREATE EXTENSION pg_trgm;')
 
 
 class PostgresSchemaRunner(DiscoverRunner):
@@ -27,3 +29,9 @@ class PostgresSchemaRunner(DiscoverRunner):
             connection = connections[conn_name]
             connection.prepare_database = MethodType(prepare_db, connection)
         return super().setup_databases(**kwargs)
+
+    def setup_test_environment(self, **kwargs: Any) -> None:
+        """Set up test environment with empty caches and throttle buckets."""
+        super().setup_test_environment(**kwargs)
+        for cache in caches.all():
+            cache.clear()
@@ -4,6 +4,7 @@ export POSTGRES_PORT=5432
 export POSTGRES_USER=test
 export POSTGRES_PASSWORD=test
 export POSTGRES_DB=test
+export REDIS_URL=redis://127.0.0.1:6379/1
 
 export SECRET_KEY=sirius
 export MINIO_USE_HTTPS=False
@@ -0,0 +1,88 @@
+"""Tests spatial aggregation API."""
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.test import TestCase
+from garden_app import models
+from rest_framework import status
+from rest_framework.test import APIClient
+
+url = '/api/aggregations/'
+
+SPECIMENS = (
+    ('Betula', 'pendula', 37.2, 55.2, True, 'Moscow'),
+    ('Betula', 'pendula', 37.4, 55.4, True, 'Moscow'),
+    ('Alnus', 'glutinosa', 37.6, 55.6, False, 'Moscow'),
+    ('Alnus', 'glutinosa', 30.3, 59.9, True, 'Leningrad'),
+)
+
+
+class AggregationApiTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create(username='vadim', password='vadim')
+        self.client.force_authenticate(user=self.user)
+        for genus, species, longitude, latitude, alive, region in SPECIMENS:
+            coord = models.Coord.objects.create(
+                latitude=latitude,
+                longitude=longitude,
+                geog_point=Point(longitude, latitude, srid=4326),
+            )
+            models.Flora.objects.create(
+                author='Ford',
+                taxonomycol=f'{genus} {species}',
+                alive=alive,
+                taxon=models.Taxon.objects.get_or_create(genus=genus, species=species)[0],
+                collect_place=models.CollectPlace.objects.create(
+                    country='Russia', region=region, coord=coord,
+                ),
+            )
+
+    def test_square_grid(self):
+        response = self.client.get(f'{url}grid/', {'resolution': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        cells = {(cell['i'], cell['j']): cell for cell in response.data}
+        self.assertEqual(cells[(37, 55)]['specimens'], 3)
+        self.assertEqual(cells[(37, 55)]['taxa'], 2)
+        self.assertEqual(cells[(30, 59)]['specimens'], 1)
+
+    def test_hex_grid_with_filter(self):
+        response = self.client.get(f'{url}grid/', {'shape': 'hex', 'alive': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sum(cell['specimens'] for cell in response.data), 3)
+
+    def test_hex_grid_cells(self):
+        models.Flora.objects.create(
+            author='Ford',
+            taxonomycol='Alnus glutinosa',
+            collect_place=models.CollectPlace.objects.create(
+                country='Russia',
+                region='Moscow',
+                # On the edge shared by the cells (0, 0) and (1, 0) of a 1 degree grid.
+                coord=models.Coord.objects.create(longitude=0.75, latitude=0.25 * 3 ** 0.5),
+            ),
+        )
+        response = self.client.get(f'{url}grid/', {'shape': 'hex', 'resolution': 1})
+        self.assertEqual(sum(cell['specimens'] for cell in response.data), len(SPECIMENS) + 1)
+        cells = {(cell['i'], cell['j']): cell for cell in response.data}
+        self.assertEqual(cells[(25, 31)]['specimens'], 2)
+        self.assertAlmostEqual(cells[(25, 31)]['longitude'], 37.5)
+
+    def test_groups(self):
+        response = self.client.get(f'{url}groups/', {'by': 'region'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        regions = {row['collect_place__region']: row for row in response.data}
+        self.assertEqual(regions['Moscow']['specimens'], 3)
+        self.assertEqual(regions['Moscow']['taxa'], 2)
+
+    def test_cache_invalidated_on_write(self):
+        self.client.get(f'{url}groups/', {'by': 'country'})
+        models.Flora.objects.create(author='Ford', taxonomycol='Betula pendula')
+        response = self.client.get(f'{url}groups/', {'by': 'country'})
+        self.assertEqual(sum(row['specimens'] for row in response.data), 5)
+
+    def test_invalid_query(self):
+        for params in ({'resolution': 0}, {'shape': 'circle'}):
+            response = self.client.get(f'{url}grid/', params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,43 @@
+"""Tests autocomplete endpoints and widgets."""
+from django.contrib.auth.models import User
+from django.test import TestCase
+from garden_app import consts, models
+
+url = '/autocomplete/taxons/'
+TAXA_COUNT = consts.AUTOCOMPLETE_PAGE_SIZE + 5
+
+
+class AutocompleteTest(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create(username='vadim', password='vadim')
+        self.client.force_login(self.user)
+        models.Taxon.objects.bulk_create(
+            models.Taxon(genus='Betula', species=f'species{number:02}')
+            for number in range(TAXA_COUNT)
+        )
+        models.Taxon.objects.create(genus='Alnus', species='glutinosa')
+
+    def test_pages(self):
+        first = self.client.get(url, {'q': 'betula'}).json()
+        self.assertEqual(len(first['results']), consts.AUTOCOMPLETE_PAGE_SIZE)
+        self.assertTrue(first['more'])
+
+        second = self.client.get(url, {'q': 'betula', 'page': 2}).json()
+        self.assertEqual(len(second['results']), TAXA_COUNT - consts.AUTOCOMPLETE_PAGE_SIZE)
+        self.assertFalse(second['more'])
+
+    def test_prefix_words(self):
+        results = self.client.get(url, {'q': 'betula species01'}).json()['results']
+        self.assertEqual(
+            [result['text'].split()[1:] for result in results], [['Betula', 'species01']],
+        )
+        self.assertEqual(self.client.get(url, {'q': 'etula'}).json()['results'], [])
+
+    def test_login_required(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+    def test_form_renders_no_unselected_options(self):
+        response = self.client.get('/floras/create')
+        self.assertContains(response, 'data-autocomplete-url="/autocomplete/taxons/"')
+        self.assertNotContains(response, 'glutinosa')
@@ -0,0 +1,61 @@
+"""Tests the batched multi-resource fetch endpoint."""
+from uuid import uuid4
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from garden_app import consts, models
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+URL = '/api/batch/'
+
+
+class BatchTest(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        user = User.objects.create(username='vadim', password='vadim')
+        self.client.force_authenticate(user=user, token=Token(user=user))
+        self.taxon = models.Taxon.objects.create(genus='Betula', species='pendula')
+        self.herbarium = models.Herbarium.objects.create(depart='Russia', region='Moscow')
+        self.floras = [
+            models.Flora.objects.create(author='Ford', taxonomycol='Betula', taxon=self.taxon)
+            for _ in range(3)
+        ]
+
+    def test_batch(self):
+        body = [
+            {'resource': 'floras', 'ids': [str(self.floras[0].pk), str(uuid4())]},
+            {'resource': 'taxons', 'ids': [str(self.taxon.pk)]},
+            {'resource': 'floras', 'ids': [str(self.floras[1].pk)]},
+            {'resource': 'herbariums', 'ids': [str(self.herbarium.pk)]},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(URL, body, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(
+            {flora['url'] for flora in response.data['floras']},
+            {f'http://testserver/api/floras/{flora.pk}/' for flora in self.floras[:2]},
+        )
+        self.assertEqual(response.data['taxons'][0]['specimens'], 3)
+        self.assertEqual(response.data['herbariums'][0]['depart'], 'Russia')
+
+    def test_invalid(self):
+        for body in (
+            [],
+            [{'resource': 'users', 'ids': [str(uuid4())]}],
+            [{'resource': 'floras', 'ids': ['1']}],
+            [{'resource': 'floras', 'ids': []}],
+            [{'resource': 'taxons', 'ids': [str(uuid4())]}] * (consts.BATCH_MAX_REQUESTS + 1),
+        ):
+            response = self.client.post(URL, body, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_anonymous(self):
+        self.client.force_authenticate(user=None)
+        body = [{'resource': 'floras', 'ids': [str(self.floras[0].pk)]}]
+        response = self.client.post(URL, body, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
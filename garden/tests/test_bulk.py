@@ -0,0 +1,135 @@
+"""Tests bulk operations API."""
+from django.contrib.auth.models import User
+from django.test import TestCase
+from garden_app import models
+from rest_framework import status
+from rest_framework.test import APIClient
+
+url = '/api/floras/'
+
+
+class BulkApiTest(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create(username='vadim', password='vadim')
+        self.superuser = User.objects.create(
+            username='admin',
+            password='admin',
+            is_superuser=True,
+        )
+        self.taxon = models.Taxon.objects.create(genus='Betula', species='pendula')
+        self.floras = []
+        for number in range(3):
+            place = models.CollectPlace.objects.create(
+                country='Russia',
+                region='Moscow',
+                coord=models.Coord.objects.create(latitude=55, longitude=37),
+            )
+            flora = models.Flora.objects.create(
+                author='Ford',
+                taxonomycol=f'Betula {number}',
+                taxon=self.taxon,
+                collect_place=place,
+            )
+            models.Label.objects.create(
+                institute='MW', project='Moscow', name=f'label {number}', plant=flora,
+            )
+            self.floras.append(flora)
+
+    def test_bulk_delete_dry_run(self):
+        self.client.force_authenticate(user=self.superuser)
+        response = self.client.post(
+            f'{url}bulk_delete/', {'filter': {'author': 'Ford'}, 'dry_run': True}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['affected'],
+            {'garden_app.Flora': 3, 'garden_app.Label': 3},
+        )
+        self.assertEqual(models.Flora.objects.count(), 3)
+
+    def test_bulk_delete(self):
+        self.client.force_authenticate(user=self.superuser)
+        ids = [str(flora.id) for flora in self.floras[:2]]
+        response = self.client.post(f'{url}bulk_delete/', {'ids': ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(models.Flora.objects.count(), 1)
+        self.assertEqual(models.Label.objects.count(), 1)
+        self.assertEqual(models.CollectPlace.objects.count(), 3)
+        self.assertEqual(models.Coord.objects.count(), 3)
+        self.assertEqual(models.Taxon.objects.count(), 1)
+
+    def test_bulk_delete_taxon_protected(self):
+        self.client.force_authenticate(user=self.superuser)
+        response = self.client.post(
+            '/api/taxons/bulk_delete/', {'ids': [str(self.taxon.id)]}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(models.Taxon.objects.count(), 1)
+        self.assertEqual(models.Flora.objects.count(), 3)
+
+        response = self.client.delete(f'/api/taxons/{self.taxon.id}/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(models.Flora.objects.count(), 3)
+
+    def test_bulk_delete_invalid_filter(self):
+        self.client.force_authenticate(user=self.superuser)
+        response = self.client.post(
+            f'{url}bulk_delete/', {'filter': {'taxon__genus': 'Betula'}}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_delete_malformed_filter_value(self):
+        self.client.force_authenticate(user=self.superuser)
+        for filters in ({'alive__in': 5}, {'taxon': 'x'}, {'alive__isnull': 'maybe'}):
+            response = self.client.post(
+                f'{url}bulk_delete/', {'filter': filters}, format='json',
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(models.Flora.objects.count(), 3)
+
+    def test_user_forbidden(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(f'{url}bulk_delete/', {'ids': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.patch(
+            f'{url}bulk_update/',
+            {'filter': {'pk__isnull': False}, 'values': {'alive': False}},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(models.Flora.objects.filter(alive=False).exists())
+
+    def test_bulk_update_by_filter(self):
+        self.client.force_authenticate(user=self.superuser)
+        response = self.client.patch(
+            f'{url}bulk_update/',
+            {'filter': {'author': 'Ford'}, 'values': {'alive': False, 'autochthony': 'invasive'}},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 3)
+        self.assertEqual(
+            models.Flora.objects.filter(alive=False, autochthony='invasive').count(), 3,
+        )
+
+    def test_bulk_update_by_ids(self):
+        self.client.force_authenticate(user=self.superuser)
+        response = self.client.patch(
+            f'{url}bulk_update/',
+            {'ids': [str(self.floras[0].id)], 'values': {'alive': False}},
+            format='json',
+        )
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(models.Flora.objects.filter(alive=False).count(), 1)
+
+    def test_bulk_update_invalid_values(self):
+        self.client.force_authenticate(user=self.superuser)
+        for values in ({'autochthony': 'alien'}, {'unknown': 1}, {'picture': None}, {}):
+            response = self.client.patch(
+                f'{url}bulk_update/',
+                {'filter': {'author': 'Ford'}, 'values': values},
+                format='json',
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(models.Flora.objects.filter(autochthony='alien').exists())
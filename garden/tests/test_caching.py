@@ -0,0 +1,54 @@
+"""Tests catalog page caching."""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from garden_app import caching, models
+
+
+def garden_queries(context):
+    """Return captured queries touching garden tables."""
+    return [query for query in context.captured_queries if '"garden"' in query['sql']]
+
+
+class CatalogCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create(username='vadim', password='vadim')
+        self.client.force_login(self.user)
+        self.flora = models.Flora.objects.create(author='Ford', taxonomycol='Forda')
+
+    def test_list_page_cached(self):
+        self.assertContains(self.client.get('/floras/'), 'Forda')
+        with CaptureQueriesContext(connection) as context:
+            self.assertContains(self.client.get('/floras/'), 'Forda')
+        self.assertEqual(garden_queries(context), [])
+
+    def test_page_number_normalized(self):
+        self.client.get('/floras/?page=1')
+        with CaptureQueriesContext(connection) as context:
+            self.assertContains(self.client.get('/floras/?page=01&sort=x'), 'Forda')
+        self.assertEqual(garden_queries(context), [])
+
+    def test_invalid_page_not_cached(self):
+        for page in ('abc', '0', '99'):
+            with self.subTest(page=page):
+                self.assertEqual(self.client.get(f'/floras/?page={page}').status_code, 404)
+                self.assertIsNone(cache.get(caching.make_key(models.Flora, 'list', page)))
+
+    def test_detail_page_cached(self):
+        url = f'/flora/?id={self.flora.id}'
+        self.assertContains(self.client.get(url), 'Forda')
+        with CaptureQueriesContext(connection) as context:
+            self.assertContains(self.client.get(url), 'Forda')
+        self.assertEqual(garden_queries(context), [])
+
+    def test_write_invalidates(self):
+        self.client.get('/floras/')
+        models.Flora.objects.create(author='Ford', taxonomycol='Betula')
+        self.assertContains(self.client.get('/floras/'), 'Betula')
+
+        self.flora.taxonomycol = 'Alnus'
+        self.flora.save()
+        self.assertContains(self.client.get(f'/flora/?id={self.flora.id}'), 'Alnus')
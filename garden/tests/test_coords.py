@@ -0,0 +1,95 @@
+"""Tests coordinates stored as numeric columns or as a single 3D point."""
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from garden_app import consts, jobs, models
+from rest_framework import status
+from rest_framework.test import APIClient
+
+url = '/api/coords/'
+point_storage = override_settings(COORD_STORAGE=consts.COORD_STORAGE_POINT)
+
+
+class CoordTest(TestCase):
+    def test_numeric_storage(self):
+        coord = models.Coord.objects.create(latitude=55.75, longitude=37.62, altitude=12)
+        coord.refresh_from_db()
+        self.assertEqual(coord.latitude, Decimal('55.75'))
+        self.assertEqual(coord.geog_point.coords, (37.62, 55.75, 12))
+
+    @point_storage
+    def test_point_storage(self):
+        coord = models.Coord.objects.create(latitude=55.75, longitude=37.62, altitude=12)
+        self.assertEqual(
+            models.Coord.objects.values_list(*consts.COORD_COLUMNS).get(),
+            (None, None, None),
+        )
+        coord.refresh_from_db()
+        self.assertEqual((coord.longitude, coord.latitude, coord.altitude), (37.62, 55.75, 12))
+
+        coord.latitude = 56
+        coord.save(update_fields=['latitude'])
+        coord.refresh_from_db()
+        self.assertEqual(coord.geog_point.coords, (37.62, 56, 12))
+
+    def test_validators(self):
+        with self.assertRaises(ValidationError):
+            models.Coord(latitude=200, longitude=37).full_clean()
+
+    def test_2d_point(self):
+        coord = models.Coord.objects.create()
+        models.Coord.objects.filter(pk=coord.pk).update(geog_point=Point(37, 55, srid=4326))
+        coord.refresh_from_db()
+        self.assertEqual(coord.geog_point.coords, (37, 55, 0))
+
+    def test_store_coords(self):
+        coord = models.Coord.objects.create(latitude=55.75, longitude=37.62, altitude=12)
+        job = jobs.run_inline('store_coords', {'storage': consts.COORD_STORAGE_POINT})
+        self.assertEqual(job.result, {'updated': 1})
+        self.assertFalse(models.Coord.objects.filter(latitude__isnull=False).exists())
+
+        jobs.run_inline('store_coords', {'storage': consts.COORD_STORAGE_NUMERIC})
+        coord.refresh_from_db()
+        self.assertEqual(coord.latitude, Decimal('55.75'))
+
+
+class CoordApiTest(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(
+            user=User.objects.create(username='admin', is_superuser=True),
+        )
+
+    def assert_representation(self):
+        response = self.client.post(
+            url, {'altitude': 3.893, 'longitude': 21.433, 'latitude': 12.343}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.get(response.data['url'])
+        self.assertEqual(response.data['latitude'], '12.34300000000000')
+        self.assertEqual(response.data['longitude'], '21.43300000000000')
+        self.assertEqual(response.data['altitude'], '3.89300000000000')
+        coord = models.Coord.objects.get()
+        self.assertEqual(coord.geog_point.coords, (21.433, 12.343, 3.893))
+
+    def test_representation(self):
+        self.assert_representation()
+
+    @point_storage
+    def test_point_representation(self):
+        self.assert_representation()
+
+    def test_validation(self):
+        response = self.client.post(url, {'latitude': 200}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_coordinates(self):
+        models.Coord.objects.create(latitude=55, longitude=37)
+        response = self.client.patch(
+            f'{url}bulk_update/', {'filter': {}, 'values': {'latitude': 56}}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(models.Coord.objects.filter(latitude=56).exists())
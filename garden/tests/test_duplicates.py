@@ -0,0 +1,93 @@
+"""Tests near-duplicate specimen detection."""
+import datetime
+
+from django.contrib.gis.geos import Point
+from django.test import TestCase
+from garden_app import consts, duplicates, jobs, models
+
+
+class DuplicatesTest(TestCase):
+    def setUp(self) -> None:
+        self.taxon = models.Taxon.objects.create(genus='Betula', species='pendula')
+        self.original = self.create_flora(37.0, 55.0, datetime.date(2020, 6, 1))
+        self.duplicate = self.create_flora(37.0003, 55.0003, datetime.date(2020, 6, 2))
+        self.create_flora(37.1, 55.0, datetime.date(2020, 6, 1))
+        self.create_flora(37.0, 55.0, datetime.date(2021, 6, 1))
+
+    def create_flora(self, longitude, latitude, collected, taxon=None):
+        place = models.CollectPlace.objects.create(
+            country='Russia',
+            coord=models.Coord.objects.create(
+                longitude=longitude, latitude=latitude, geog_point=Point(longitude, latitude),
+            ),
+        )
+        flora = models.Flora.objects.create(
+            author='Ford', taxonomycol='Betula', taxon=taxon or self.taxon, collect_place=place,
+        )
+        models.Label.objects.create(
+            institute='MW', project='Moscow', name='label', collected=collected, plant=flora,
+        )
+        return flora
+
+    def test_detect(self):
+        self.assertEqual(duplicates.detect()['candidates'], 1)
+        candidate = models.DuplicateCandidate.objects.get()
+        self.assertEqual(
+            {candidate.flora_id, candidate.duplicate_id},
+            {self.original.id, self.duplicate.id},
+        )
+        self.assertEqual(candidate.days, 1)
+        self.assertLess(candidate.distance, consts.DUPLICATE_DISTANCE)
+        self.assertEqual(duplicates.detect()['candidates'], 0)
+
+    def test_incremental(self):
+        job = jobs.run_inline('detect_duplicates')
+        self.assertEqual(job.result['candidates'], 1)
+        self.assertEqual(jobs.run_inline('detect_duplicates').result['candidates'], 0)
+
+        self.create_flora(37.0, 55.0, datetime.date(2020, 6, 1))
+        other = models.Taxon.objects.create(genus='Betula', species='nana')
+        self.create_flora(37.0, 55.0, datetime.date(2020, 6, 1), taxon=other)
+        self.assertEqual(jobs.run_inline('detect_duplicates').result['candidates'], 2)
+
+    def test_backdated(self):
+        duplicates.detect()
+        flora = self.create_flora(37.0, 55.0, datetime.date(2020, 6, 1))
+        models.Flora.objects.filter(pk=flora.pk).update(
+            created=datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(jobs.run_inline('detect_duplicates').result['candidates'], 2)
+
+    def test_merge_keeps_complete(self):
+        duplicates.detect()
+        candidate = models.DuplicateCandidate.objects.get()
+        self.duplicate.rus_name = 'Берёза повислая'
+        self.duplicate.save()
+        self.assertEqual(duplicates.merge(candidate), self.duplicate.id)
+        self.assertFalse(models.Flora.objects.filter(pk=self.original.id).exists())
+        self.assertEqual(models.Label.objects.filter(plant=self.duplicate).count(), 2)
+        self.assertFalse(models.DuplicateCandidate.objects.exists())
+
+    def test_merge_explicit(self):
+        duplicates.detect()
+        candidate = models.DuplicateCandidate.objects.get()
+        with self.assertRaises(ValueError):
+            duplicates.merge(candidate, keep=self.taxon.id)
+        self.assertEqual(duplicates.merge(candidate, keep=self.original.id), self.original.id)
+        self.assertFalse(models.Flora.objects.filter(pk=self.duplicate.id).exists())
+
+    def test_merge_removes_owned_records(self):
+        duplicates.detect()
+        candidate = models.DuplicateCandidate.objects.get()
+        removed = self.duplicate
+        models.Label.objects.filter(plant=removed).update(coord=removed.collect_place.coord)
+        removed.comment = models.Comment.objects.create(description='Birch')
+        removed.save()
+        duplicates.merge(candidate, keep=self.original.id)
+        self.assertFalse(models.CollectPlace.objects.filter(pk=removed.collect_place_id).exists())
+        self.assertFalse(models.Comment.objects.exists())
+        # The moved label still points to the coordinates.
+        self.assertTrue(
+            models.Coord.objects.filter(pk=removed.collect_place.coord_id).exists(),
+        )
+        self.assertEqual(models.CollectPlace.objects.count(), 3)
@@ -0,0 +1,91 @@
+"""Tests offline reverse geocoding of collect places."""
+import io
+import json
+import tempfile
+from pathlib import Path
+
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.core.management import call_command
+from django.test import TestCase
+from garden_app import consts, geocoding, models
+
+
+def square(left, bottom, size):
+    """Return a square multipolygon."""
+    right, top = left + size, bottom + size
+    return MultiPolygon(
+        Polygon(((left, bottom), (right, bottom), (right, top), (left, top), (left, bottom))),
+        srid=consts.WGS84,
+    )
+
+
+class ReverseGeocodingTest(TestCase):
+    def setUp(self) -> None:
+        models.AdminBoundary.objects.create(name='Russia', level=2, geom=square(30, 50, 20))
+        models.AdminBoundary.objects.create(name='Moscow', level=4, geom=square(36, 55, 2))
+        self.empty = self.create_place('', '', 37, 56)
+        self.wrong = self.create_place('Russia', 'Tver', 37, 55.5)
+        self.outside = self.create_place('', '', 10, 10)
+
+    def create_place(self, country, region, longitude, latitude):
+        return models.CollectPlace.objects.create(
+            country=country,
+            region=region,
+            coord=models.Coord.objects.create(
+                longitude=longitude, latitude=latitude, geog_point=Point(longitude, latitude),
+            ),
+        )
+
+    def test_validate(self):
+        result = geocoding.reverse_geocode(consts.GEOCODE_VALIDATE)
+        self.assertEqual(result['mismatched'], {'country': 0, 'region': 1, 'city': 0})
+        self.assertEqual(result['sample']['region'], [str(self.wrong.pk)])
+
+    def test_fill(self):
+        result = geocoding.reverse_geocode(consts.GEOCODE_FILL, batch_size=2)
+        self.assertEqual(result['updated'], {'country': 1, 'region': 1, 'city': 0})
+        self.empty.refresh_from_db()
+        self.wrong.refresh_from_db()
+        self.outside.refresh_from_db()
+        self.assertEqual((self.empty.country, self.empty.region), ('Russia', 'Moscow'))
+        self.assertEqual(self.wrong.region, 'Tver')
+        self.assertEqual(self.outside.country, '')
+
+    def test_fix(self):
+        geocoding.reverse_geocode(consts.GEOCODE_FIX)
+        self.wrong.refresh_from_db()
+        self.assertEqual(self.wrong.region, 'Moscow')
+
+    def test_load_boundaries(self):
+        features = [
+            {
+                'type': 'Feature',
+                'properties': {'name': 'Tver', 'admin_level': 4},
+                'geometry': json.loads(square(34, 56, 2)[0].json),
+            },
+            {
+                'type': 'Feature',
+                'properties': {'name': 'Point', 'admin_level': 4},
+                'geometry': {'type': 'Point', 'coordinates': [35, 57]},
+            },
+            {
+                'type': 'Feature',
+                'properties': {'name': None, 'admin_level': 4},
+                'geometry': json.loads(square(36, 56, 2)[0].json),
+            },
+            {
+                'type': 'Feature',
+                'properties': {'name': 'Unknown level', 'admin_level': None},
+                'geometry': json.loads(square(38, 56, 2)[0].json),
+            },
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'boundaries.geojson'
+            path.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}))
+            self.assertEqual(
+                geocoding.load_boundaries(path), {'loaded': 1, 'skipped': 2},
+            )
+            output = io.StringIO()
+            call_command('load_boundaries', str(path), '--replace', stdout=output)
+        self.assertEqual(output.getvalue().strip(), 'Loaded boundaries: 1, skipped: 2')
+        self.assertEqual(models.AdminBoundary.objects.get(name='Tver').level, 4)
@@ -0,0 +1,60 @@
+"""Tests bulk specimen import."""
+import csv
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase
+from garden_app import importer, models
+
+HEADER = (
+    'occurrenceID', 'scientificName', 'recordedBy', 'decimalLatitude', 'decimalLongitude',
+    'eventDate', 'country', 'stateProvince', 'institutionCode', 'collectionCode',
+)
+BETULA = ('Betula pendula', 'Ford')
+PLACE = ('2001-05-01', 'Russia', 'Moscow', 'MW', 'V')
+ROWS = (
+    ('occ-1', *BETULA, '55.7', '37.6', *PLACE),
+    ('occ-2', *BETULA, '95.0', '37.6', *PLACE),
+    ('occ-3', 'Alnus glutinosa', 'Ford', '', '', '2999-01-01', '', '', '', ''),
+    ('occ-4', 'Alnus glutinosa', '', '', '', '', '', '', '', ''),
+    ('occ-1', *BETULA, '55.7', '37.6', *PLACE),
+    ('occ-5', 'Alnus glutinosa', 'Ford', '', '', '', '', '', '', ''),
+)
+
+
+class ImportSpecimensTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = Path(tempfile.mkdtemp())
+        self.source = self.directory / 'specimens.csv'
+        with open(self.source, 'w', newline='') as source:
+            writer = csv.writer(source)
+            writer.writerow(HEADER)
+            writer.writerows(ROWS)
+
+    def run_import(self, resume=False):
+        return importer.run_import(
+            self.source,
+            workers=1,
+            chunk_size=2,
+            checkpoint=self.directory / 'checkpoint',
+            rejects=self.directory / 'rejects.csv',
+            resume=resume,
+        )
+
+    def test_import(self):
+        stats = self.run_import()
+        self.assertEqual(stats['accepted'], 3)
+        self.assertEqual(stats['rejected'], 3)
+        self.assertEqual(models.Flora.objects.count(), 2)
+        flora = models.Flora.objects.get(taxonomycol='Betula pendula')
+        self.assertEqual(flora.collect_place.country, 'Russia')
+        self.assertEqual(flora.label_set.get().institute, 'MW')
+        with open(self.directory / 'rejects.csv') as rejects:
+            self.assertEqual(len(list(csv.reader(rejects))), 4)
+
+    def test_resume(self):
+        self.run_import()
+        stats = self.run_import(resume=True)
+        self.assertEqual(stats['skipped_chunks'], 3)
+        self.assertEqual(stats['accepted'], 0)
+        self.assertEqual(models.Flora.objects.count(), 2)
@@ -0,0 +1,92 @@
+"""Tests background job queue."""
+from datetime import timedelta
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import TestCase
+from garden_app import consts, jobs, models
+
+
+@jobs.register('test_echo')
+def echo(job):
+    """Return job payload."""
+    jobs.report_progress(job, 0.5)
+    return job.payload
+
+
+@jobs.register('test_fail')
+def fail(job):
+    """Raise an error."""
+    raise RuntimeError('boom')
+
+
+class JobQueueTest(TestCase):
+    def test_priority_order(self):
+        low = jobs.enqueue('test_echo', {'name': 'low'})
+        high = jobs.enqueue('test_echo', {'name': 'high'}, priority=10)
+        self.assertEqual(jobs.claim('worker').pk, high.pk)
+        self.assertEqual(jobs.claim('worker').pk, low.pk)
+        self.assertIsNone(jobs.claim('worker'))
+
+    def test_run(self):
+        jobs.enqueue('test_echo', {'name': 'echo'})
+        self.assertEqual(jobs.work('worker', burst=True), 1)
+        job = models.Job.objects.get()
+        self.assertEqual(job.status, consts.JOB_DONE)
+        self.assertEqual(job.result, {'name': 'echo'})
+        self.assertEqual(job.progress, 1)
+
+    def test_retry_then_fail(self):
+        job = jobs.enqueue('test_fail')
+        jobs.run(jobs.claim('worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, consts.JOB_QUEUED)
+        self.assertIn('boom', job.error)
+        self.assertIsNone(jobs.claim('worker'))
+
+        models.Job.objects.filter(pk=job.pk).update(
+            attempts=job.max_attempts - 1, run_after=job.created,
+        )
+        jobs.run(jobs.claim('worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, consts.JOB_FAILED)
+
+    def test_expired_lease(self):
+        job = jobs.enqueue('test_echo', {'name': 'slow'})
+        stale = jobs.claim('first')
+        models.Job.objects.filter(pk=job.pk).update(
+            heartbeat=job.created - timedelta(seconds=consts.JOB_STALE_TIMEOUT + 1),
+        )
+        self.assertEqual(jobs.requeue_stale(), 1)
+        self.assertEqual(jobs.claim('second').pk, job.pk)
+
+        jobs.run(stale)
+        job.refresh_from_db()
+        self.assertEqual(job.status, consts.JOB_RUNNING)
+        self.assertEqual(job.worker, 'second')
+
+    def test_expired_lease_exhausted(self):
+        job = jobs.enqueue('test_echo')
+        jobs.claim('first')
+        models.Job.objects.filter(pk=job.pk).update(
+            max_attempts=1,
+            heartbeat=job.created - timedelta(seconds=consts.JOB_STALE_TIMEOUT + 1),
+        )
+        self.assertEqual(jobs.requeue_stale(), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, consts.JOB_FAILED)
+        self.assertEqual(job.error, 'Lease expired')
+        self.assertIsNone(jobs.claim('second'))
+
+    def test_database_error_backoff(self):
+        with (
+            mock.patch.object(jobs, 'claim', side_effect=[OperationalError, None]),
+            mock.patch.object(jobs, 'connection'),
+            mock.patch.object(jobs.time, 'sleep') as sleep,
+        ):
+            self.assertEqual(jobs.work('worker', burst=True), 0)
+        sleep.assert_called_once_with(consts.JOB_POLL_INTERVAL)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            jobs.enqueue('missing')
@@ -0,0 +1,147 @@
+"""Tests content-addressed picture storage and garbage collection."""
+import hashlib
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, TestCase
+from django_minio_backend import MinioBackend
+from garden_app import bulk, consts, models, pictures, storages, validators
+
+CONTENT = b'herbarium scan'
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+class PictureStorageTest(TestCase):
+    def test_upload_handler_hash(self):
+        request = RequestFactory().post(
+            '/floras/create/', {'picture': SimpleUploadedFile('scan.png', CONTENT)},
+        )
+        self.assertEqual(request.FILES['picture'].sha256, DIGEST)
+
+    def test_deduplicated_save(self):
+        storage = storages.ContentAddressedMinioBackend(bucket_name=consts.BUCKET_NAME)
+        with mock.patch.object(
+            MinioBackend, '_save', autospec=True, side_effect=lambda _, name, content: name,
+        ) as upload, mock.patch.object(MinioBackend, 'exists', return_value=True):
+            first = storage.save('2024-01-01/scan.PNG', ContentFile(CONTENT))
+            second = storage.save('2024-02-01/copy.png', ContentFile(CONTENT))
+        self.assertEqual(upload.call_count, 1)
+        self.assertEqual(first, f'sha256/{DIGEST[:2]}/{DIGEST}.png')
+        self.assertEqual(second, first)
+        self.assertEqual(models.PictureBlob.objects.get().size, len(CONTENT))
+
+    def test_missing_object_uploaded_again(self):
+        storage = storages.ContentAddressedMinioBackend(bucket_name=consts.BUCKET_NAME)
+        blob = models.PictureBlob.objects.create(
+            sha256=DIGEST, name='sha256/scan.png', size=1,
+            used=validators.get_datetime() - timedelta(days=2),
+        )
+        with mock.patch.object(
+            MinioBackend, '_save', autospec=True, side_effect=lambda _, name, content: name,
+        ) as upload, mock.patch.object(MinioBackend, 'exists', return_value=False):
+            name = storage.save('2024-02-01/copy.png', ContentFile(CONTENT))
+        self.assertEqual(upload.call_count, 1)
+        self.assertEqual(name, blob.name)
+        blob.refresh_from_db()
+        self.assertGreater(blob.used, validators.get_datetime() - timedelta(days=1))
+
+    def test_refcount(self):
+        blob = models.PictureBlob.objects.create(sha256=DIGEST, name='sha256/scan.png', size=1)
+        flora = models.Flora.objects.create(author='Ford', taxonomycol='Betula', picture=blob.name)
+        models.Flora.objects.create(author='Ford', taxonomycol='Betula', picture=blob.name)
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount, 2)
+
+        flora.picture = ''
+        flora.save()
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount, 1)
+
+        models.Flora.objects.filter(picture=blob.name).get().delete()
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount, 0)
+
+    def test_refcount_loaded(self):
+        blob = models.PictureBlob.objects.create(sha256=DIGEST, name='sha256/scan.png', size=1)
+        flora = models.Flora.objects.create(author='Ford', taxonomycol='Betula')
+        flora = models.Flora.objects.get(pk=flora.pk)
+        flora.picture = blob.name
+        flora.save(update_fields=['author'])
+        flora.save()
+        flora.save()
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount, 1)
+
+    def test_bulk_delete_refcount(self):
+        blob = models.PictureBlob.objects.create(sha256=DIGEST, name='sha256/scan.png', size=1)
+        for _ in range(2):
+            models.Flora.objects.create(author='Ford', taxonomycol='Betula', picture=blob.name)
+        with self.captureOnCommitCallbacks() as callbacks:
+            bulk.delete(models.Flora.objects.all())
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount, 2)
+        for callback in callbacks:
+            callback()
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount, 0)
+
+
+class ReclaimTest(TestCase):
+    def setUp(self) -> None:
+        old = validators.get_datetime() - timedelta(days=2)
+        self.canonical = f'sha256/{DIGEST[:2]}/{DIGEST}.png'
+        models.PictureBlob.objects.create(sha256=DIGEST, name=self.canonical, size=len(CONTENT))
+        models.Flora.objects.create(author='Ford', taxonomycol='Betula', picture=self.canonical)
+        self.legacy = models.Flora.objects.create(
+            author='Ford', taxonomycol='Betula', picture='2024-01-01/scan.png',
+        )
+        objects = [
+            SimpleNamespace(object_name=name, size=len(CONTENT), last_modified=old)
+            for name in (self.canonical, '2024-01-01/scan.png', '2024-01-02/orphan.png')
+        ]
+        objects.append(SimpleNamespace(
+            object_name='2024-01-03/fresh.png', size=1, last_modified=validators.get_datetime(),
+        ))
+        response = mock.Mock()
+        response.stream.return_value = [CONTENT]
+        self.client = mock.Mock()
+        self.client.list_objects.return_value = objects
+        self.client.get_object.return_value = response
+        storage = SimpleNamespace(client=self.client, bucket=consts.BUCKET_NAME)
+        patcher = mock.patch.object(pictures, '_storage', return_value=storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_dry_run(self):
+        stats = pictures.reclaim(dry_run=True)
+        self.assertEqual(stats['scanned'], 4)
+        self.assertEqual(stats['orphans'], 1)
+        self.assertEqual(stats['legacy'], 1)
+        self.client.remove_object.assert_not_called()
+
+    def test_reclaim(self):
+        stats = pictures.reclaim(workers=2)
+        self.assertEqual(stats['duplicates'], 1)
+        self.assertEqual(stats['removed'], 2)
+        removed = {call.args[1] for call in self.client.remove_object.call_args_list}
+        self.assertEqual(removed, {'2024-01-01/scan.png', '2024-01-02/orphan.png'})
+        self.legacy.refresh_from_db()
+        self.assertEqual(self.legacy.picture.name, self.canonical)
+        self.assertEqual(models.PictureBlob.objects.get().refcount, 2)
+
+    def test_recently_used(self):
+        now = validators.get_datetime()
+        old = now - timedelta(days=2)
+        for name, used in (('sha256/used.png', now), ('sha256/old.png', old)):
+            models.PictureBlob.objects.create(sha256=name, name=name, size=1, used=used)
+            self.client.list_objects.return_value.append(
+                SimpleNamespace(object_name=name, size=1, last_modified=old),
+            )
+        pictures.reclaim(workers=2)
+        removed = {call.args[1] for call in self.client.remove_object.call_args_list}
+        self.assertIn('sha256/old.png', removed)
+        self.assertNotIn('sha256/used.png', removed)
+        self.assertTrue(models.PictureBlob.objects.filter(name='sha256/used.png').exists())
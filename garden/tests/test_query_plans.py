@@ -0,0 +1,113 @@
+"""Tests that key queries are served by indexes."""
+import json
+from datetime import date
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from garden_app import models
+
+SEED_SIZE = 500
+FORBIDDEN_NODES = frozenset(('Seq Scan', 'Sort'))
+
+
+def plan_nodes(plan):
+    """Yield node types of an EXPLAIN plan tree."""
+    yield plan['Node Type']
+    for child in plan.get('Plans', ()):
+        yield from plan_nodes(child)
+
+
+def search_any(fields, term):
+    """Build the filter of an admin search over the fields."""
+    return Q(*(Q(**{f'{field}__icontains': term}) for field in fields), _connector=Q.OR)
+
+
+class QueryPlanTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        autochthony = ('autochthonous', 'introduced', 'invasive', None)
+        models.Flora.objects.bulk_create(
+            models.Flora(
+                author=f'author {number % 7}',
+                taxonomycol=f'taxon {number}',
+                alive=number % 2 == 0,
+                autochthony=autochthony[number % len(autochthony)],
+            )
+            for number in range(SEED_SIZE)
+        )
+        cls.flora = models.Flora.objects.first()
+        models.Label.objects.bulk_create(
+            models.Label(
+                institute='MW',
+                project='Moscow',
+                name=f'label {number}',
+                collected=date(2000 + number % 20, 1, 1),
+                plant=cls.flora if number % 50 == 0 else None,
+            )
+            for number in range(SEED_SIZE)
+        )
+        models.Taxon.objects.bulk_create(
+            models.Taxon(genus=f'genus {number % 40}', species=f'species {number}')
+            for number in range(SEED_SIZE)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def assert_indexed(self, queryset, forbidden=FORBIDDEN_NODES):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            # Disabled plan types are still chosen when no index can serve the query.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('SET LOCAL enable_sort = off')
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        nodes = set(plan_nodes(plan[0]['Plan']))
+        self.assertFalse(nodes & forbidden, f'{sql} uses {nodes}')
+
+    def test_flora_list_page(self):
+        self.assert_indexed(models.Flora.objects.all()[10:20])
+
+    def test_alive_flora_page(self):
+        self.assert_indexed(models.Flora.objects.filter(alive=True)[:10])
+
+    def test_autochthony_filter(self):
+        self.assert_indexed(
+            models.Flora.objects.filter(autochthony='invasive').order_by('taxonomycol')[:10],
+        )
+
+    def test_recent_floras(self):
+        self.assert_indexed(models.Flora.objects.order_by('-created')[:10])
+
+    def test_flora_labels(self):
+        self.assert_indexed(models.Label.objects.filter(plant=self.flora))
+
+    def test_labels_by_collected(self):
+        self.assert_indexed(models.Label.objects.filter(collected__gte=date(2015, 1, 1)))
+
+    def test_autocomplete_page(self):
+        self.assert_indexed(models.Taxon.objects.order_by('genus', 'species', 'pk')[:21])
+
+    def test_admin_flora_search(self):
+        self.assert_indexed(
+            models.Flora.objects.filter(
+                search_any(('taxonomycol', 'author', 'rus_name'), 'xon 4'),
+            ),
+            forbidden={'Seq Scan'},
+        )
+
+    def test_admin_label_search(self):
+        self.assert_indexed(
+            models.Label.objects.filter(search_any(('name', 'institute', 'project'), 'bel 4')),
+            forbidden={'Seq Scan'},
+        )
+
+    def test_autocomplete_prefix(self):
+        self.assert_indexed(
+            models.Taxon.objects.filter(
+                Q(genus__istartswith='spec') | Q(species__istartswith='spec'),
+            ).order_by('genus', 'species', 'pk')[:21],
+            forbidden={'Seq Scan'},
+        )
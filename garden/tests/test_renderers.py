@@ -0,0 +1,37 @@
+"""Tests API renderers and response compression."""
+import gzip
+
+import msgpack
+import orjson
+from django.contrib.auth.models import User
+from django.test import TestCase
+from garden_app import models
+from rest_framework import status
+from rest_framework.test import APIClient
+
+url = '/api/coords/'
+
+
+class RenderersTest(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=User.objects.create(username='vadim'))
+        for number in range(50):
+            models.Coord.objects.create(latitude=55 + number / 100, longitude=37)
+
+    def test_json(self):
+        response = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(len(orjson.loads(response.content)), 50)
+
+    def test_msgpack(self):
+        response = self.client.get(url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        json_response = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(msgpack.unpackb(response.content), orjson.loads(json_response.content))
+
+    def test_gzip(self):
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(len(orjson.loads(gzip.decompress(response.content))), 50)
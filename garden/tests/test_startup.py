@@ -0,0 +1,17 @@
+"""Tests startup profiling helpers."""
+from django.test import SimpleTestCase
+from garden_app.management.commands import profile_startup
+
+
+class ImportTimeTest(SimpleTestCase):
+    def test_parse(self):
+        output = '\n'.join((
+            'import time: self [us] | cumulative | imported package',
+            'import time:       120 |        120 |   _io',
+            'import time:      3000 |       5000 | django',
+            'unrelated line',
+        ))
+        self.assertEqual(
+            profile_startup.parse_import_times(output),
+            [('_io', 120, 120), ('django', 3000, 5000)],
+        )
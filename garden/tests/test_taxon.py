@@ -0,0 +1,42 @@
+"""Tests shared taxon dictionary."""
+from django.contrib.auth.models import User
+from django.test import TestCase
+from garden_app import models
+from rest_framework import status
+from rest_framework.test import APIClient
+
+url = '/api/taxons/'
+
+
+class TaxonDictionaryTest(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.superuser = User.objects.create(
+            username='admin',
+            password='admin',
+            is_superuser=True,
+        )
+        self.client.force_authenticate(user=self.superuser)
+
+    def test_create_reuses_taxon(self):
+        attrs = {'genus': 'Betula', 'species': 'pendula'}
+        first = self.client.post(url, attrs)
+        second = self.client.post(url, attrs)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data['id'], second.data['id'])
+        self.assertEqual(models.Taxon.objects.count(), 1)
+
+    def test_update_to_taken_classification(self):
+        models.Taxon.objects.create(genus='Betula', species='pendula')
+        taxon = models.Taxon.objects.create(genus='Alnus', species='glutinosa')
+        response = self.client.put(f'{url}{taxon.id}/', {'genus': 'Betula', 'species': 'pendula'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_specimen_counts(self):
+        taxon = models.Taxon.objects.create(genus='Betula', species='pendula')
+        for author in ('Ford', 'Linnaeus'):
+            models.Flora.objects.create(author=author, taxonomycol='Betula pendula', taxon=taxon)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['specimens'], 2)
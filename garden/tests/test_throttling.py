@@ -0,0 +1,126 @@
+"""Tests API throttling and load shedding."""
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+import redis
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from garden_app import consts, middleware, models, throttling
+from rest_framework import status
+from rest_framework.test import APIClient
+
+url = '/api/floras/'
+rates = {
+    'token_list': '2/min',
+    'token_retrieve': '100/min',
+    'token_write': '100/min',
+    'ip_list': '100/min',
+    'ip_retrieve': '100/min',
+    'ip_write': '100/min',
+}
+
+
+@override_settings(REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': rates})
+class ThrottlingTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create(username='vadim', password='vadim')
+        self.client.force_authenticate(user=self.user)
+        self.coord = models.Coord.objects.create(latitude=55, longitude=37)
+
+    def test_list_budget(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+
+        response = self.client.get(f'/api/coords/{self.coord.pk}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_budget_per_token(self):
+        for _ in range(3):
+            self.client.get(url)
+        other = User.objects.create(username='ford', password='ford')
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+    def test_concurrent_requests(self):
+        request = SimpleNamespace(auth=SimpleNamespace(key='token'), method='GET')
+        view = SimpleNamespace(action=consts.THROTTLE_LIST)
+
+        def allow(_):
+            return throttling.TokenRateThrottle().allow_request(request, view)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            allowed = list(pool.map(allow, range(20)))
+        self.assertEqual(sum(allowed), 2)
+
+    def test_spoofed_forwarded_for(self):
+        factory = RequestFactory()
+        idents = {
+            throttling.IPRateThrottle().get_bucket_ident(
+                factory.get(url, HTTP_X_FORWARDED_FOR=f'10.0.0.{number}'),
+            )
+            for number in range(3)
+        }
+        self.assertEqual(idents, {'127.0.0.1'})
+
+    def test_redis_outage(self):
+        script = mock.Mock(side_effect=redis.ConnectionError('down'))
+        with mock.patch.object(throttling, '_take_token', return_value=script):
+            for _ in range(3):
+                self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+
+class LoadSheddingTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.factory = RequestFactory()
+        self.middleware = middleware.LoadSheddingMiddleware(lambda request: HttpResponse())
+
+    def test_db_latency(self):
+        self.middleware.latency = consts.SHED_DB_LATENCY * 2
+        self.middleware.probed = float('inf')
+        response = self.middleware(self.factory.get(url))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], str(consts.SHED_RETRY_AFTER))
+        self.assertEqual(self.middleware(self.factory.get('/floras/')).status_code, 200)
+
+    def test_latency_recovers(self):
+        self.middleware.latency = consts.SHED_DB_LATENCY * 2
+        for _ in range(5):
+            self.middleware.probed = float('-inf')
+            response = self.middleware(self.factory.get(url))
+        self.assertEqual(response.status_code, 200)
+
+    def test_slow_views_ignored(self):
+        def slow_view(request):
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_sleep(%s)', [consts.SHED_DB_LATENCY * 3])
+            return HttpResponse()
+
+        self.middleware.get_response = slow_view
+        for _ in range(3):
+            self.middleware.probed = float('-inf')
+            self.assertEqual(self.middleware(self.factory.get(url)).status_code, 200)
+
+    def test_database_outage(self):
+        with mock.patch.object(middleware, 'connection') as connection_mock:
+            connection_mock.cursor.side_effect = OperationalError('down')
+            response = self.middleware(self.factory.get(url))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], str(consts.SHED_RETRY_AFTER))
+        connection_mock.close.assert_called_once_with()
+
+    def test_queue_depth(self):
+        with mock.patch.object(consts, 'SHED_QUEUE_DEPTH', 0):
+            models.Job.objects.create(kind='test')
+            self.assertEqual(self.middleware(self.factory.get(url)).status_code, 200)
+            response = self.middleware(self.factory.post(url))
+            self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,52 @@
+-- migrate:up transaction:false
+
+set search_path to public, garden;
+
+-- flora.taxon_id stops being unique, keep it indexed for the rewiring below
+create index if not exists flora_taxon_id_idx on garden.flora (taxon_id);
+alter table garden.flora drop constraint if exists flora_taxon_id_key;
+
+drop table if exists garden.taxon_merge;
+
+create table garden.taxon_merge as
+select id,
+       first_value(id) over (
+           partition by domain, kingdom, phylum, klass, ordo, family, genus, species, subspecies
+           order by id
+       ) as canonical_id,
+       false as done
+from garden.taxon;
+
+delete from garden.taxon_merge where id = canonical_id;
+create index taxon_merge_pending_idx on garden.taxon_merge (id) where not done;
+
+do $$
+declare
+    batch uuid[];
+begin
+    loop
+        select array_agg(id) into batch
+        from (select id from garden.taxon_merge where not done limit 5000) pending;
+        exit when batch is null;
+
+        update garden.flora f
+        set taxon_id = m.canonical_id
+        from garden.taxon_merge m
+        where m.id = any(batch) and f.taxon_id = m.id;
+
+        delete from garden.taxon where id = any(batch);
+        update garden.taxon_merge set done = true where id = any(batch);
+        commit;
+    end loop;
+end $$;
+
+drop table garden.taxon_merge;
+
+alter table garden.taxon
+    add constraint taxon_classification_unique
+    unique nulls not distinct (domain, kingdom, phylum, klass, ordo, family, genus, species, subspecies);
+
+-- migrate:down
+
+-- merged taxa can not be split back, only the dictionary constraint is dropped
+alter table garden.taxon drop constraint if exists taxon_classification_unique;
@@ -0,0 +1,35 @@
+-- migrate:up transaction:false
+
+set search_path to public, garden;
+
+-- catalog and API lists use Flora's default ordering
+create index concurrently if not exists flora_taxonomycol_author_idx
+    on garden.flora (taxonomycol, author);
+create index concurrently if not exists flora_alive_order_idx
+    on garden.flora (taxonomycol, author) where alive;
+create index concurrently if not exists flora_autochthony_idx
+    on garden.flora (autochthony, taxonomycol) where autochthony is not null;
+create index concurrently if not exists flora_created_idx
+    on garden.flora (created);
+
+create index concurrently if not exists label_plant_id_idx
+    on garden.label (plant_id);
+create index concurrently if not exists label_collected_idx
+    on garden.label (collected);
+
+create index concurrently if not exists collect_place_country_idx
+    on garden.collect_place (country, region);
+
+create index concurrently if not exists coord_geog_point_idx
+    on garden.coord using gist (geog_point);
+
+-- migrate:down transaction:false
+
+drop index concurrently if exists garden.coord_geog_point_idx;
+drop index concurrently if exists garden.collect_place_country_idx;
+drop index concurrently if exists garden.label_collected_idx;
+drop index concurrently if exists garden.label_plant_id_idx;
+drop index concurrently if exists garden.flora_created_idx;
+drop index concurrently if exists garden.flora_autochthony_idx;
+drop index concurrently if exists garden.flora_alive_order_idx;
+drop index concurrently if exists garden.flora_taxonomycol_author_idx;
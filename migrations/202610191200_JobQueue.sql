@@ -0,0 +1,27 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+create table garden.job (
+id              uuid primary key default uuid_generate_v4(),
+kind            text not null,
+payload         jsonb not null default '{}',
+status          text not null default 'queued',
+priority        smallint not null default 0,
+attempts        smallint not null default 0,
+max_attempts    smallint not null default 3,
+progress        double precision not null default 0,
+result          jsonb,
+error           text,
+worker          text,
+run_after       timestamp with time zone not null default CURRENT_TIMESTAMP,
+created         timestamp with time zone not null default CURRENT_TIMESTAMP,
+started         timestamp with time zone,
+finished        timestamp with time zone
+);
+
+create index job_queued_idx on garden.job (priority desc, run_after) where status = 'queued';
+
+-- migrate:down
+
+drop table if exists garden.job;
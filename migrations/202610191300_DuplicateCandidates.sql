@@ -0,0 +1,21 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+create table garden.duplicate_candidate (
+id              uuid primary key default uuid_generate_v4(),
+flora_id        uuid not null references garden.flora,
+duplicate_id    uuid not null references garden.flora,
+score           double precision not null,
+distance        double precision not null,
+days            integer,
+status          text not null default 'pending',
+created         timestamp with time zone not null default CURRENT_TIMESTAMP,
+constraint duplicate_candidate_pair_unique unique (flora_id, duplicate_id)
+);
+
+create index duplicate_candidate_duplicate_id_idx on garden.duplicate_candidate (duplicate_id);
+
+-- migrate:down
+
+drop table if exists garden.duplicate_candidate;
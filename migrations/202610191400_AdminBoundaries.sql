@@ -0,0 +1,17 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+create table garden.admin_boundary (
+id              uuid primary key default uuid_generate_v4(),
+name            text not null,
+level           smallint not null,
+geom            geometry(MultiPolygon, 4326) not null
+);
+
+create index admin_boundary_level_idx on garden.admin_boundary (level);
+create index admin_boundary_geom_idx on garden.admin_boundary using gist (geom);
+
+-- migrate:down
+
+drop table if exists garden.admin_boundary;
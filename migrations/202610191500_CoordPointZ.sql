@@ -0,0 +1,38 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+-- Expand: the 3D point that replaces the 2D point. The trigger keeps it
+-- current for rows written before the contract migration, the
+-- backfill_coord_points job fills existing rows in batches.
+alter table garden.coord add column if not exists geog_point_z geography(PointZ, 4326);
+
+create or replace function garden.coord_point_z(
+    longitude decimal, latitude decimal, altitude decimal, geog_point geography
+) returns geography as $$
+    select case
+        when longitude is not null and latitude is not null then
+            ST_SetSRID(ST_MakePoint(longitude, latitude, coalesce(altitude, 0)), 4326)::geography
+        when geog_point is not null then
+            ST_Force3D(geog_point::geometry)::geography
+    end
+$$ language sql immutable;
+
+create or replace function garden.coord_sync_point_z() returns trigger as $$
+begin
+    new.geog_point_z := garden.coord_point_z(
+        new.longitude, new.latitude, new.altitude, new.geog_point
+    );
+    return new;
+end
+$$ language plpgsql;
+
+create trigger coord_sync_point_z before insert or update on garden.coord
+for each row execute function garden.coord_sync_point_z();
+
+-- migrate:down
+
+drop trigger if exists coord_sync_point_z on garden.coord;
+drop function if exists garden.coord_sync_point_z();
+drop function if exists garden.coord_point_z(decimal, decimal, decimal, geography);
+alter table garden.coord drop column if exists geog_point_z;
@@ -0,0 +1,30 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+-- Contract: catch up rows the backfill job has not reached, then replace the
+-- 2D point with the 3D one. The numeric columns stay; the application keeps
+-- the point in sync and, with COORD_STORAGE=point, leaves them empty.
+update garden.coord
+set geog_point_z = garden.coord_point_z(longitude, latitude, altitude, geog_point)
+where geog_point_z is null;
+
+drop trigger if exists coord_sync_point_z on garden.coord;
+drop function if exists garden.coord_sync_point_z();
+drop function if exists garden.coord_point_z(decimal, decimal, decimal, geography);
+
+drop index if exists garden.coord_geog_point_idx;
+alter table garden.coord drop column geog_point;
+alter table garden.coord rename column geog_point_z to geog_point;
+create index coord_geog_point_idx on garden.coord using gist (geog_point);
+
+-- migrate:down
+
+update garden.coord set
+    altitude = ST_Z(geog_point::geometry),
+    longitude = ST_X(geog_point::geometry),
+    latitude = ST_Y(geog_point::geometry)
+where latitude is null and geog_point is not null;
+alter table garden.coord
+    alter column geog_point type geography(Point, 4326)
+    using ST_Force2D(geog_point::geometry)::geography;
@@ -0,0 +1,20 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+create table garden.picture_blob (
+id              uuid primary key default uuid_generate_v4(),
+sha256          varchar(64) not null unique,
+name            text not null unique,
+size            bigint not null,
+refcount        integer not null default 0,
+created         timestamp with time zone not null default CURRENT_TIMESTAMP
+);
+
+-- reference counts are recomputed by flora.picture lookups
+create index if not exists flora_picture_idx on garden.flora (picture) where picture <> '';
+
+-- migrate:down
+
+drop index if exists garden.flora_picture_idx;
+drop table if exists garden.picture_blob;
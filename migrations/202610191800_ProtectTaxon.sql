@@ -0,0 +1,15 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+-- taxa are a shared dictionary, a taxon still used by specimens can not be deleted
+alter table garden.flora
+    drop constraint if exists flora_taxon_id_fkey,
+    add constraint flora_taxon_id_fkey foreign key (taxon_id) references garden.taxon (id)
+        on delete restrict;
+
+-- migrate:down
+
+alter table garden.flora
+    drop constraint if exists flora_taxon_id_fkey,
+    add constraint flora_taxon_id_fkey foreign key (taxon_id) references garden.taxon (id);
@@ -0,0 +1,11 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+alter table garden.job add column heartbeat timestamp with time zone;
+
+update garden.job set heartbeat = started where status = 'running';
+
+-- migrate:down
+
+alter table garden.job drop column if exists heartbeat;
@@ -0,0 +1,48 @@
+-- migrate:up transaction:false
+
+set search_path to public, garden;
+
+create extension if not exists pg_trgm;
+
+-- unfiltered suggestions are read in this order
+create index concurrently if not exists taxon_autocomplete_idx
+    on garden.taxon (genus, species, id);
+create index concurrently if not exists collect_place_autocomplete_idx
+    on garden.collect_place (country, region, city, id);
+create index concurrently if not exists herbarium_autocomplete_idx
+    on garden.herbarium (depart, region, id);
+create index concurrently if not exists comment_autocomplete_idx
+    on garden.comment (description, id);
+
+-- istartswith compares upper(field) LIKE 'TERM%', which trigram indexes serve
+create index concurrently if not exists taxon_genus_trgm_idx
+    on garden.taxon using gin (upper(genus) gin_trgm_ops);
+create index concurrently if not exists taxon_species_trgm_idx
+    on garden.taxon using gin (upper(species) gin_trgm_ops);
+create index concurrently if not exists collect_place_country_trgm_idx
+    on garden.collect_place using gin (upper(country) gin_trgm_ops);
+create index concurrently if not exists collect_place_region_trgm_idx
+    on garden.collect_place using gin (upper(region) gin_trgm_ops);
+create index concurrently if not exists collect_place_city_trgm_idx
+    on garden.collect_place using gin (upper(city) gin_trgm_ops);
+create index concurrently if not exists herbarium_depart_trgm_idx
+    on garden.herbarium using gin (upper(depart) gin_trgm_ops);
+create index concurrently if not exists herbarium_region_trgm_idx
+    on garden.herbarium using gin (upper(region) gin_trgm_ops);
+create index concurrently if not exists comment_description_trgm_idx
+    on garden.comment using gin (upper(description) gin_trgm_ops);
+
+-- migrate:down transaction:false
+
+drop index concurrently if exists garden.comment_description_trgm_idx;
+drop index concurrently if exists garden.herbarium_region_trgm_idx;
+drop index concurrently if exists garden.herbarium_depart_trgm_idx;
+drop index concurrently if exists garden.collect_place_city_trgm_idx;
+drop index concurrently if exists garden.collect_place_region_trgm_idx;
+drop index concurrently if exists garden.collect_place_country_trgm_idx;
+drop index concurrently if exists garden.taxon_species_trgm_idx;
+drop index concurrently if exists garden.taxon_genus_trgm_idx;
+drop index concurrently if exists garden.comment_autocomplete_idx;
+drop index concurrently if exists garden.herbarium_autocomplete_idx;
+drop index concurrently if exists garden.collect_place_autocomplete_idx;
+drop index concurrently if exists garden.taxon_autocomplete_idx;
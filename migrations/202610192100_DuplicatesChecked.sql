@@ -0,0 +1,13 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+-- the first detection run after this migration checks every specimen once
+alter table garden.flora add column duplicates_checked boolean not null default false;
+
+create index flora_duplicates_pending_idx on garden.flora (id) where not duplicates_checked;
+
+-- migrate:down
+
+drop index if exists garden.flora_duplicates_pending_idx;
+alter table garden.flora drop column if exists duplicates_checked;
@@ -0,0 +1,11 @@
+-- migrate:up
+
+set search_path to public, garden;
+
+-- reclaim spares objects the storage handed out within the grace period
+alter table garden.picture_blob
+    add column used timestamp with time zone not null default CURRENT_TIMESTAMP;
+
+-- migrate:down
+
+alter table garden.picture_blob drop column if exists used;
@@ -0,0 +1,26 @@
+-- migrate:up transaction:false
+
+set search_path to public, garden;
+
+-- admin search compares upper(field) LIKE '%TERM%', which trigram indexes serve
+create index concurrently if not exists flora_taxonomycol_trgm_idx
+    on garden.flora using gin (upper(taxonomycol) gin_trgm_ops);
+create index concurrently if not exists flora_author_trgm_idx
+    on garden.flora using gin (upper(author) gin_trgm_ops);
+create index concurrently if not exists flora_rus_name_trgm_idx
+    on garden.flora using gin (upper(rus_name) gin_trgm_ops);
+create index concurrently if not exists label_name_trgm_idx
+    on garden.label using gin (upper(name) gin_trgm_ops);
+create index concurrently if not exists label_institute_trgm_idx
+    on garden.label using gin (upper(institute) gin_trgm_ops);
+create index concurrently if not exists label_project_trgm_idx
+    on garden.label using gin (upper(project) gin_trgm_ops);
+
+-- migrate:down transaction:false
+
+drop index concurrently if exists garden.label_project_trgm_idx;
+drop index concurrently if exists garden.label_institute_trgm_idx;
+drop index concurrently if exists garden.label_name_trgm_idx;
+drop index concurrently if exists garden.flora_rus_name_trgm_idx;
+drop index concurrently if exists garden.flora_author_trgm_idx;
+drop index concurrently if exists garden.flora_taxonomycol_trgm_idx;